@@ -1,19 +1,62 @@
-from flask import Flask
+import hmac
+from flask import Flask, request
 from flask_cors import CORS
 from app.config import Config
 from app.routes import blueprints
+from app.utils.db_pool import init_pool
+from app.utils.cache import response_cache
+from app.utils.timing import init_timing
+from app.utils.compression import init_compression
+from app.utils.serializer import JSONProvider, select_backend
+from app.utils.query_stats import query_stats
+from app.services.season_bundle import season_bundles
+from app.services.scrape_jobs import scrape_jobs
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
+    select_backend(config_class.JSON_ENCODER)
+    app.json = JSONProvider(app)
     
     CORS(app)
     
+    app.extensions['db_pool'] = init_pool(config_class)
+    
     for blueprint in blueprints:
         app.register_blueprint(blueprint)
         
     @app.route('/health')
     def health():
-        return {'status': 'healthy', 'message': 'F1 API is running'}, 200
+        return {
+            'status': 'healthy',
+            'message': 'F1 API is running',
+            'db_pool': app.extensions['db_pool'].stats(),
+            'response_cache': response_cache.stats(),
+            'query_stats': query_stats.stats(),
+            'season_bundles': season_bundles.stats(),
+            'scrape_jobs': scrape_jobs.stats(),
+        }, 200
+    
+    if config_class.QUERY_STATS_TOKEN:
+        @app.get('/internal/query-stats')
+        def query_stats_report():
+            """
+            Top query fingerprints of this worker by total time (?limit=20,
+            ?sort=total_time|max_time|calls|rows); needs Authorization: Bearer <QUERY_STATS_TOKEN>
+            """
+            token = request.headers.get('Authorization', '').removeprefix('Bearer ')
+            if not hmac.compare_digest(token.encode('utf-8'), config_class.QUERY_STATS_TOKEN.encode('utf-8')):
+                return {'error': 'Unauthorized'}, 401
+
+            limit = request.args.get('limit', default=20, type=int)
+            sort = request.args.get('sort', default='total_time')
+            try:
+                top = query_stats.top(limit, sort)
+            except ValueError as e:
+                return {'error': str(e)}, 400
+            return {**query_stats.stats(), 'queries': top}, 200
+    
+    init_timing(app)
+    init_compression(app)
         
     return app
\ No newline at end of file
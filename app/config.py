@@ -10,6 +10,66 @@ class Config:
     DB_PORT = os.environ.get('DB_PORT', '5432')
     DB_NAME = os.environ.get('DB_NAME', 'f1_database')
     
-    DATABASE_URL = f"postgresql://{DB_USER}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    # A full DATABASE_URL (e.g. a unix-socket DSN) takes precedence over the DB_* parts
+    DATABASE_URL = os.environ.get('DATABASE_URL', f"postgresql://{DB_USER}@{DB_HOST}:{DB_PORT}/{DB_NAME}")
     
-    OPENF1_API_BASE_URL = 'https://api.openf1.org/v1'
\ No newline at end of file
+    DB_POOL_MIN_SIZE = int(os.environ.get('DB_POOL_MIN_SIZE', '1'))
+    DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', '10'))
+    DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', '10'))
+    DB_POOL_HEALTH_CHECK = os.environ.get('DB_POOL_HEALTH_CHECK', 'true').lower() == 'true'
+    
+    CACHE_ENABLED = os.environ.get('CACHE_ENABLED', 'true').lower() == 'true'
+    CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', '1024'))
+    CACHE_TTL_CURRENT_SEASON = int(os.environ.get('CACHE_TTL_CURRENT_SEASON', '300'))
+    CACHE_TTL_PAST_SEASON = int(os.environ.get('CACHE_TTL_PAST_SEASON', '86400'))
+    CACHE_TTL_DEFAULT = int(os.environ.get('CACHE_TTL_DEFAULT', '600'))
+    DATA_VERSION_TTL = float(os.environ.get('DATA_VERSION_TTL', '5'))
+    
+    SCRAPE_TIMEOUT = float(os.environ.get('SCRAPE_TIMEOUT', '10'))
+    SCRAPE_CACHE_TTL = int(os.environ.get('SCRAPE_CACHE_TTL', '86400'))
+    SCRAPE_CACHE_STALE_TTL = int(os.environ.get('SCRAPE_CACHE_STALE_TTL', '604800'))
+    SCRAPE_CACHE_ERROR_TTL = int(os.environ.get('SCRAPE_CACHE_ERROR_TTL', '300'))
+    SCRAPE_REFRESH_WORKERS = int(os.environ.get('SCRAPE_REFRESH_WORKERS', '2'))
+    # Async mode of the scrape-backed routes (also ?async=1): cache misses become 202 + a /jobs/<id> to poll
+    SCRAPE_ASYNC = os.environ.get('SCRAPE_ASYNC', 'false').lower() == 'true'
+    SCRAPE_JOB_WORKERS = int(os.environ.get('SCRAPE_JOB_WORKERS', '4'))
+    SCRAPE_JOB_MAX_PENDING = int(os.environ.get('SCRAPE_JOB_MAX_PENDING', '32'))
+    SCRAPE_JOB_TIMEOUT = float(os.environ.get('SCRAPE_JOB_TIMEOUT', '30'))
+    
+    # Bucket widths (ms) of the car_data rollups built at load time, finest first
+    TELEMETRY_ROLLUP_RESOLUTIONS = [int(ms) for ms in os.environ.get('TELEMETRY_ROLLUP_RESOLUTIONS', '1000,5000,30000').split(',')]
+    TELEMETRY_DEFAULT_POINTS = int(os.environ.get('TELEMETRY_DEFAULT_POINTS', '1000'))
+    TELEMETRY_MAX_POINTS = int(os.environ.get('TELEMETRY_MAX_POINTS', '10000'))
+    STREAM_CHUNK_SIZE = int(os.environ.get('STREAM_CHUNK_SIZE', '2000'))
+    # Largest ?limit= page of raw telemetry; larger requests are capped to it
+    RAW_TELEMETRY_MAX_LIMIT = int(os.environ.get('RAW_TELEMETRY_MAX_LIMIT', '50000'))
+
+    # Most ids one batch lookup (e.g. /drivers/driver/batch) resolves in a single query
+    BATCH_MAX_KEYS = int(os.environ.get('BATCH_MAX_KEYS', '50'))
+
+    # JSON encoder behind create_response and jsonify: auto (orjson when installed), orjson or stdlib
+    JSON_ENCODER = os.environ.get('JSON_ENCODER', 'auto')
+    # Responses of at least COMPRESSION_MIN_BYTES are sent brotli- or gzip-compressed when the client accepts it
+    COMPRESSION_ENABLED = os.environ.get('COMPRESSION_ENABLED', 'true').lower() == 'true'
+    COMPRESSION_MIN_BYTES = int(os.environ.get('COMPRESSION_MIN_BYTES', '1024'))
+    COMPRESSION_GZIP_LEVEL = int(os.environ.get('COMPRESSION_GZIP_LEVEL', '6'))
+    COMPRESSION_BROTLI_QUALITY = int(os.environ.get('COMPRESSION_BROTLI_QUALITY', '4'))
+
+    # Pre-compressed season bundles the loader publishes and /seasons/bundle serves
+    SEASON_BUNDLE_DIR = os.environ.get(
+        'SEASON_BUNDLE_DIR', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bundles')
+    )
+    
+    # Per-phase request timings in a Server-Timing header, and Prometheus histograms at /metrics
+    SERVER_TIMING_ENABLED = os.environ.get('SERVER_TIMING_ENABLED', 'true').lower() == 'true'
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+    
+    # Per-fingerprint query counters; queries slower than SLOW_QUERY_MS are logged with their params
+    QUERY_STATS_ENABLED = os.environ.get('QUERY_STATS_ENABLED', 'true').lower() == 'true'
+    QUERY_STATS_MAX_FINGERPRINTS = int(os.environ.get('QUERY_STATS_MAX_FINGERPRINTS', '1000'))
+    SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', '200'))
+    # Bearer token for /internal/query-stats; the endpoint is not registered without one
+    QUERY_STATS_TOKEN = os.environ.get('QUERY_STATS_TOKEN', '')
+    
+    # Point the loader at another OpenF1-compatible server, e.g. benchmarks/mock_openf1.py
+    OPENF1_API_BASE_URL = os.environ.get('OPENF1_API_BASE_URL', 'https://api.openf1.org/v1')
\ No newline at end of file
@@ -0,0 +1,22 @@
+from app.models.Query import Query
+
+class DataVersionModel(Query):
+    """Model for the per-year / per-meeting / per-session change counters bumped by the loader"""
+    
+    row_mode = True
+    # Looked up by @conditional before the view runs
+    timing_phase = 'validate'
+    
+    def __init__(self):
+        super().__init__()
+    
+    def get_version(self, scope: str, scope_key: int):
+        query = """
+            SELECT
+            dv.version,
+            dv.updated_at
+            FROM data_version dv
+            WHERE dv.scope = %s AND dv.scope_key = %s;
+        """
+        
+        return self.query_db(query, (scope, scope_key))
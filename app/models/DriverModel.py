@@ -1,9 +1,13 @@
 from app.models.Query import Query
+from app.utils.cache import cached
 
 class DriverModel(Query):
+    row_mode = True
+    
     def __init__(self):
         super().__init__()
 
+    @cached
     def get_drivers_by_year(self, year: int = 2025):
         query = """
             SELECT DISTINCT ON (d.driver_number)
@@ -27,25 +31,74 @@ class DriverModel(Query):
         
         return self.query_db(query, (year,))
     
+    @cached
     def get_driver_info(self, driver_number, session_key):
+        """Returns (result, msg, session_exists) from a single query"""
         query = """
-            SELECT DISTINCT ON (d.driver_number)
-                d.driver_number,
-                d.first_name,
-                d.last_name,
-                d.full_name,
-                d.broadcast_name,
-                d.name_acronym,
-                d.team_name,
-                d.team_colour,
-                d.country_code,
-                d.headshot_url
-            FROM drivers d
-            WHERE d.driver_number = %s AND d.session_key = %s
+            SELECT
+                e._exists,
+                r.*
+            FROM (
+                SELECT EXISTS (
+                    SELECT 1 FROM sessions WHERE session_key = %s
+                ) AS _exists
+            ) e
+            LEFT JOIN (
+                SELECT DISTINCT ON (d.driver_number)
+                    TRUE AS _hit,
+                    d.driver_number,
+                    d.first_name,
+                    d.last_name,
+                    d.full_name,
+                    d.broadcast_name,
+                    d.name_acronym,
+                    d.team_name,
+                    d.team_colour,
+                    d.country_code,
+                    d.headshot_url
+                FROM drivers d
+                WHERE d.driver_number = %s AND d.session_key = %s
+            ) r ON TRUE
         """
         
-        return self.query_db(query, (driver_number, session_key))
+        return self.query_with_exists(query, (session_key, driver_number, session_key))
 
+    def get_drivers_info(self, driver_numbers, session_key):
+        """
+        Returns (result, msg, session_exists) for several drivers of one
+        session from a single query. Not @cached, like every batch lookup.
+        """
+        query = """
+            SELECT
+                e._exists,
+                r.*
+            FROM (
+                SELECT EXISTS (
+                    SELECT 1 FROM sessions WHERE session_key = %s
+                ) AS _exists
+            ) e
+            LEFT JOIN (
+                SELECT DISTINCT ON (d.driver_number)
+                    TRUE AS _hit,
+                    d.driver_number,
+                    d.first_name,
+                    d.last_name,
+                    d.full_name,
+                    d.broadcast_name,
+                    d.name_acronym,
+                    d.team_name,
+                    d.team_colour,
+                    d.country_code,
+                    d.headshot_url
+                FROM drivers d
+                WHERE d.driver_number = ANY(%s) AND d.session_key = %s
+                ORDER BY d.driver_number
+            ) r ON TRUE
+        """
+        
+        return self.query_with_exists(query, (session_key, list(driver_numbers), session_key))
+
+    @cached
     def get_driver_info_by_year(self, driver_number, year):
         query = """
             SELECT DISTINCT ON (d.driver_number)
@@ -67,53 +120,87 @@ class DriverModel(Query):
              
         return self.query_db(query, (driver_number, year))
         
+    @cached
     def get_driver_race_wins_in_year(self, driver_number: int, year: int = 2025):
+        """Returns (result, msg, driver_exists_in_year) from a single query"""
         query = """
-            SELECT 
-                s.circuit_short_name,
-                s.meeting_key,
-                s.location,
-                d.driver_number,
-                d.full_name,
-                d.team_name,
-                s.date_start,
-                s.session_name
-            FROM session_result sr
-            JOIN drivers d
-                ON d.driver_number = sr.driver_number
-                AND d.session_key = sr.session_key
-            JOIN sessions s
-                ON sr.session_key = s.session_key
-            WHERE d.driver_number = %s
-                AND s.year = %s
-                AND sr.position = 1
-                AND s.session_type = 'Race'
-            ORDER BY s.date_start, s.circuit_short_name;
+            SELECT
+                e._exists,
+                r.*
+            FROM (
+                SELECT EXISTS (
+                    SELECT 1
+                    FROM drivers d
+                    JOIN sessions s
+                        ON s.session_key = d.session_key
+                    WHERE d.driver_number = %s AND s.year = %s
+                ) AS _exists
+            ) e
+            LEFT JOIN (
+                SELECT
+                    TRUE AS _hit,
+                    s.circuit_short_name,
+                    s.meeting_key,
+                    s.location,
+                    d.driver_number,
+                    d.full_name,
+                    d.team_name,
+                    s.date_start,
+                    s.session_name
+                FROM session_result sr
+                JOIN drivers d
+                    ON d.driver_number = sr.driver_number
+                    AND d.session_key = sr.session_key
+                JOIN sessions s
+                    ON sr.session_key = s.session_key
+                WHERE d.driver_number = %s
+                    AND s.year = %s
+                    AND sr.position = 1
+                    AND s.session_type = 'Race'
+            ) r ON TRUE
+            ORDER BY r.date_start, r.circuit_short_name;
         """
-        return self.query_db(query, (driver_number, year))     
+        return self.query_with_exists(query, (driver_number, year, driver_number, year))     
             
 
+    @cached
     def get_driver_podiums_in_year(self, driver_number: int, year: int = 2025):
+        """Returns (result, msg, driver_exists_in_year) from a single query"""
         query = """
-            SELECT 
-                s.circuit_short_name,
-                s.location,
-                d.driver_number,
-                d.full_name,
-                d.team_name,
-                sr.position,
-                s.date_start,
-                s.session_name
-            FROM session_result sr
-            JOIN drivers d
-                ON d.driver_number = sr.driver_number
-                AND d.session_key = sr.session_key
-            JOIN sessions s
-                ON sr.session_key = s.session_key
-            WHERE d.driver_number = %s
-                AND s.year = %s
-                AND sr.position <= 3
-                AND s.session_type = 'Race'
-            ORDER BY s.date_start, s.circuit_short_name;
+            SELECT
+                e._exists,
+                r.*
+            FROM (
+                SELECT EXISTS (
+                    SELECT 1
+                    FROM drivers d
+                    JOIN sessions s
+                        ON s.session_key = d.session_key
+                    WHERE d.driver_number = %s AND s.year = %s
+                ) AS _exists
+            ) e
+            LEFT JOIN (
+                SELECT
+                    TRUE AS _hit,
+                    s.circuit_short_name,
+                    s.location,
+                    d.driver_number,
+                    d.full_name,
+                    d.team_name,
+                    sr.position,
+                    s.date_start,
+                    s.session_name
+                FROM session_result sr
+                JOIN drivers d
+                    ON d.driver_number = sr.driver_number
+                    AND d.session_key = sr.session_key
+                JOIN sessions s
+                    ON sr.session_key = s.session_key
+                WHERE d.driver_number = %s
+                    AND s.year = %s
+                    AND sr.position <= 3
+                    AND s.session_type = 'Race'
+            ) r ON TRUE
+            ORDER BY r.date_start, r.circuit_short_name;
         """
-        return self.query_db(query, (driver_number, year))
\ No newline at end of file
+        return self.query_with_exists(query, (driver_number, year, driver_number, year))
\ No newline at end of file
@@ -1,11 +1,15 @@
 from app.models.Query import Query
+from app.utils.cache import cached
 
 class MeetingsModel(Query):
     """Model for meetings-related database operations"""
     
+    row_mode = True
+    
     def __init__(self):
         super().__init__()
     
+    @cached
     def get_meetings_by_year(self, year: int = 2025):
         query = """
             SELECT DISTINCT ON (m.date_start)
@@ -23,6 +27,7 @@ class MeetingsModel(Query):
         
         return self.query_db(query, (year,))
     
+    @cached
     def get_meeting_by_key(self, meeting_key: int):
         query = """
             SELECT 
@@ -38,4 +43,19 @@ class MeetingsModel(Query):
             WHERE meeting_key = %s;
         """
         
+        return self.query_db(query, (meeting_key,))
+    
+    @cached
+    def get_meeting_with_circuit_info(self, meeting_key: int):
+        query = """
+            SELECT 
+            m.country_name,
+            m.year,
+            ci.info AS circuit_info
+            FROM meetings m
+            LEFT JOIN circuit_info ci
+                ON ci.meeting_key = m.meeting_key
+            WHERE m.meeting_key = %s;
+        """
+        
         return self.query_db(query, (meeting_key,))
\ No newline at end of file
@@ -1,12 +1,16 @@
 from app.models.Query import Query
+from app.utils.cache import cached
 
 class SessionResultModel(Query):
+    row_mode = True
+    
     def __init__(self):
         super().__init__()
     
+    @cached
     def get_session_result_for_session(self, session_key):
         query = """
-        SELECT DISTINCT ON (sr.position, sr.driver_number)
+        SELECT
         sr.position,
         sr.number_of_laps,
         sr.gap_to_leader,
@@ -23,8 +27,41 @@ class SessionResultModel(Query):
         FROM session_result sr
         JOIN drivers d
                 ON d.driver_number = sr.driver_number
+                AND d.session_key = sr.session_key
         WHERE sr.session_key = %s
         ORDER BY sr.position, sr.driver_number;
         """
         
-        return self.query_db(query, (session_key,))
\ No newline at end of file
+        return self.query_db(query, (session_key,))
+    
+    def get_session_results_for_sessions(self, session_keys):
+        """
+        Results of several sessions in one query, ordered by session then
+        position. Not @cached: a list of keys makes a poor cache key and could
+        not be invalidated per session.
+        """
+        query = """
+        SELECT
+        sr.session_key,
+        sr.position,
+        sr.number_of_laps,
+        sr.gap_to_leader,
+        sr.duration,
+        sr.driver_number,
+        d.full_name,
+        d.team_name,
+        d.team_colour,
+        sr.dnf,
+        sr.dns,
+        sr.dsq,
+        sr.points,
+        d.headshot_url
+        FROM session_result sr
+        JOIN drivers d
+                ON d.driver_number = sr.driver_number
+                AND d.session_key = sr.session_key
+        WHERE sr.session_key = ANY(%s)
+        ORDER BY sr.session_key, sr.position, sr.driver_number;
+        """
+        
+        return self.query_rows(query, (list(session_keys),))
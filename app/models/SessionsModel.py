@@ -1,9 +1,13 @@
 from app.models.Query import Query
+from app.utils.cache import cached
 
 class SessionsModel(Query):
+    row_mode = True
+    
     def __init__(self):
         super().__init__()
 
+    @cached
     def get_sessions_for_meeting(self, meeting_key: int):
         query = """
         SELECT DISTINCT ON (s.date_start)
@@ -21,6 +25,7 @@ class SessionsModel(Query):
         
         return self.query_db(query, (meeting_key,))
     
+    @cached
     def get_session_by_key(self, session_key: int):
         query = """
             SELECT 
@@ -35,4 +40,40 @@ class SessionsModel(Query):
             WHERE session_key = %s;
         """
         
-        return self.query_db(query, (session_key,))
\ No newline at end of file
+        return self.query_db(query, (session_key,))
+    
+    def get_sessions_for_meetings(self, meeting_keys):
+        """Sessions of several meetings in one query; not @cached, like every batch lookup"""
+        query = """
+        SELECT DISTINCT ON (s.meeting_key, s.date_start)
+        s.meeting_key,
+        s.session_key,
+        s.circuit_short_name,
+        s.date_start,
+        s.date_end,
+        s.location,
+        s.session_name,
+        s.session_type
+        FROM sessions s
+        WHERE s.meeting_key = ANY(%s)
+        ORDER BY s.meeting_key, s.date_start;
+        """
+        
+        return self.query_rows(query, (list(meeting_keys),))
+    
+    def get_sessions_by_keys(self, session_keys):
+        """Several sessions by key in one query; not @cached, like every batch lookup"""
+        query = """
+            SELECT 
+            s.session_name,
+            s.session_type,
+            s.session_key,
+            s.circuit_short_name,
+            s.date_start,
+            s.date_end,
+            s.location
+            FROM sessions s
+            WHERE session_key = ANY(%s);
+        """
+        
+        return self.query_rows(query, (list(session_keys),))
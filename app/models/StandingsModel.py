@@ -0,0 +1,51 @@
+from app.models.Query import Query
+from app.utils.cache import cached
+
+class StandingsModel(Query):
+    """Model for the per-season standings tables kept up to date by the loader"""
+    
+    row_mode = True
+    
+    def __init__(self):
+        super().__init__()
+    
+    @cached
+    def get_driver_standings(self, year: int = 2025):
+        query = """
+            SELECT
+                ds.position,
+                ds.driver_number,
+                ds.full_name,
+                ds.name_acronym,
+                ds.team_name,
+                ds.team_colour,
+                ds.points,
+                ds.wins,
+                ds.podiums,
+                ds.dnfs,
+                ds.races
+            FROM driver_standings ds
+            WHERE ds.year = %s
+            ORDER BY ds.position, ds.driver_number;
+        """
+        
+        return self.query_db(query, (year,))
+    
+    @cached
+    def get_team_standings(self, year: int = 2025):
+        query = """
+            SELECT
+                ts.position,
+                ts.team_name,
+                ts.team_colour,
+                ts.points,
+                ts.wins,
+                ts.podiums,
+                ts.dnfs,
+                ts.races
+            FROM team_standings ts
+            WHERE ts.year = %s
+            ORDER BY ts.position, ts.team_name;
+        """
+        
+        return self.query_db(query, (year,))
@@ -0,0 +1,68 @@
+from typing import Optional, Tuple
+from app.models.Query import Query
+from app.utils.downsample import CHANNELS
+from app.utils.keyset import keyset
+
+# Raw telemetry tables /telemetry/raw may page through
+RAW_TABLES = ['car_data', 'location', 'position', 'intervals']
+
+class TelemetryModel(Query):
+    """Model for /telemetry: precomputed car_data rollups and raw telemetry pages"""
+
+    row_mode = True
+
+    def __init__(self):
+        super().__init__()
+
+    def get_car_data_rollup(self, session_key: int, driver_number: int, resolution_ms: int):
+        columns = ',\n            '.join(
+            f"r.{channel}_{stat}" for channel in CHANNELS for stat in ('min', 'max', 'mean')
+        )
+        query = f"""
+            SELECT
+            r.bucket_start,
+            r.samples,
+            {columns}
+            FROM car_data_rollup r
+            WHERE r.session_key = %s
+            AND r.driver_number = %s
+            AND r.resolution_ms = %s
+            ORDER BY r.bucket_start;
+        """
+
+        return self.query_db(query, (session_key, driver_number, resolution_ms))
+
+    def stream_table(self, table: str, session_key: int, driver_number: Optional[int] = None,
+                     order_by: str = 'id', after: Optional[Tuple] = None, limit: Optional[int] = None,
+                     chunk_size: int = 5000):
+        """
+        Keyset-paginated rows of one raw telemetry table for a session, streamed in chunks
+
+        Args:
+            table: One of RAW_TABLES
+            order_by: 'id' or 'date'
+            after: Decoded cursor; only rows sorting after it are returned
+            limit: Maximum number of rows, or None for the rest of the session
+
+        Raises:
+            ValueError for an unknown table or ordering
+        """
+        if table not in RAW_TABLES:
+            raise ValueError(f"Unknown telemetry table {table!r}")
+        after_clause, order = keyset(order_by)
+
+        conditions = ["session_key = %s"]
+        params = [session_key]
+        if driver_number is not None:
+            conditions.append("driver_number = %s")
+            params.append(driver_number)
+        if after is not None:
+            conditions.append(after_clause)
+            params.extend(after)
+
+        query = f"SELECT * FROM {table} WHERE {' AND '.join(conditions)} ORDER BY {order}"
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit)
+
+        return self.stream_rows(query, tuple(params), chunk_size)
@@ -1,19 +1,37 @@
+import time
+import uuid
 import logging
+import warnings
 from pandas import read_sql_query
 from app.config import Config
-from psycopg2 import connect
-from typing import Optional, Tuple, List, Dict, Any
+from app.utils.db_pool import get_pool
+from app.utils.timing import timed
+from app.utils.query_stats import query_stats, observe_query, calling_method
+from typing import Optional, Tuple, List, Dict, Any, Iterator
+
+# read_sql_query is handed pooled DBAPI connections on purpose
+warnings.filterwarnings('ignore', message='pandas only supports SQLAlchemy', category=UserWarning)
 
 class Query:
-    """Base class for database queries with connection management"""
+    """Base class for database queries, borrowing connections from the shared pool"""
+    
+    # Subclasses set this to skip pandas and return rows straight from the cursor
+    row_mode = False
+    # Server-Timing / metrics phase the model's queries are counted under
+    timing_phase = 'db'
     
     def __init__(self):
         self.conn_string = Config.DATABASE_URL
         self.logger = logging.getLogger(__name__)
         
+    @property
+    def pool(self):
+        return get_pool()
+        
     def query_db(self, query: str, params: Optional[Tuple] = None) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
         """
-        Execute a query and return results as list of dicts
+        Execute a query and return results as a DataFrame, or as a list of
+        dicts when the model has opted into row_mode
         
         Args:
             query: SQL query string
@@ -22,10 +40,123 @@ class Query:
         Returns:
             Tuple of (results, message) or (None, error_message)
         """
+        if self.row_mode:
+            return self.query_rows(query, params)
+        
         try:            
-            df = read_sql_query(query, self.conn_string, params=params)
+            with timed(self.timing_phase), observe_query(query, params, self) as observed, self.pool.connection() as conn:
+                df = read_sql_query(query, conn, params=params)
+                observed.rows = len(df)
             return df, None
             
         except Exception as e:
             self.logger.error(f"Error fetching data from database: {e}")
-            return None, str(e)
\ No newline at end of file
+            return None, str(e)
+    
+    def query_rows(self, query: str, params: Optional[Tuple] = None) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """
+        Execute a query and return the cursor rows as a list of dicts,
+        without building a DataFrame. NULLs stay None, so nullable integer
+        columns need no dtype fix-up.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters tuple
+            
+        Returns:
+            Tuple of (results, message) or (None, error_message)
+        """
+        try:
+            with timed(self.timing_phase), observe_query(query, params, self) as observed, self.pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, params)
+                    columns = [desc[0] for desc in cursor.description]
+                    rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+                    observed.rows = len(rows)
+            return rows, None
+            
+        except Exception as e:
+            self.logger.error(f"Error fetching data from database: {e}")
+            return None, str(e)
+    
+    def stream_rows(self, query: str, params: Optional[Tuple] = None, chunk_size: int = 5000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Execute a query through a server-side named cursor and yield the rows
+        in chunks, so a result of any size is never held in memory at once
+        
+        The pooled connection stays checked out until the generator is
+        exhausted or closed.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters tuple
+            chunk_size: Rows fetched per round trip
+            
+        Yields:
+            Lists of at most chunk_size row dicts
+            
+        Raises:
+            psycopg2.Error if the query fails
+        """
+        # Resolved now: once the generator runs, the calling model method has returned
+        caller = calling_method(self) if query_stats.enabled else None
+        return self._stream_chunks(query, params, chunk_size, caller)
+    
+    def _stream_chunks(self, query: str, params: Optional[Tuple], chunk_size: int, caller: Optional[str]) -> Iterator[List[Dict[str, Any]]]:
+        # Only time spent in the database counts towards query_stats, not the
+        # time the consumer takes between chunks
+        elapsed = 0.0
+        fetched = 0
+        error = False
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor(name=f"stream_{uuid.uuid4().hex}") as cursor:
+                    cursor.itersize = chunk_size
+                    started = time.perf_counter()
+                    cursor.execute(query, params)
+                    elapsed += time.perf_counter() - started
+                    columns = None
+                    while True:
+                        started = time.perf_counter()
+                        rows = cursor.fetchmany(chunk_size)
+                        elapsed += time.perf_counter() - started
+                        if not rows:
+                            break
+                        fetched += len(rows)
+                        if columns is None:
+                            columns = [desc[0] for desc in cursor.description]
+                        yield [dict(zip(columns, row)) for row in rows]
+        except Exception:
+            error = True
+            raise
+        finally:
+            if caller is not None:
+                query_stats.record(query, params, elapsed, fetched, caller, error)
+    
+    def query_with_exists(self, query: str, params: Optional[Tuple] = None) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str], bool]:
+        """
+        Execute a query that reports existence and data in one round trip
+        
+        The query must select an _exists boolean on every row and LEFT JOIN
+        the data rows with a TRUE AS _hit marker, so an existing but empty
+        result comes back as a single placeholder row with _hit NULL.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters tuple
+            
+        Returns:
+            Tuple of (results, message, exists) or (None, error_message, False)
+        """
+        rows, msg = self.query_rows(query, params)
+        if msg is not None:
+            return None, msg, False
+        
+        exists = bool(rows) and bool(rows[0]['_exists'])
+        result = []
+        for row in rows:
+            if row.pop('_hit'):
+                row.pop('_exists')
+                result.append(row)
+        
+        return result, None, exists
\ No newline at end of file
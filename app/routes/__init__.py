@@ -2,6 +2,10 @@ from app.routes.meetings import bp as meetings_bp
 from app.routes.sessions import bp as sessions_bp
 from app.routes.drivers import bp as drivers_bp
 from app.routes.session_result import bp as session_result_bp
+from app.routes.telemetry import bp as telemetry_bp
+from app.routes.standings import bp as standings_bp
+from app.routes.seasons import bp as seasons_bp
+from app.routes.jobs import bp as jobs_bp
 
 sessions_bp.url_prefix = '/meetings/sessions'
 session_result_bp.url_prefix = '/meetings/sessions/session_result'
@@ -11,4 +15,8 @@ blueprints = [
     sessions_bp,
     drivers_bp,
     session_result_bp,
+    telemetry_bp,
+    standings_bp,
+    seasons_bp,
+    jobs_bp,
 ]
\ No newline at end of file
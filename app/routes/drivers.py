@@ -1,95 +1,143 @@
 from flask import Blueprint, jsonify, make_response, request
 from app.models.DriverModel import DriverModel
 from app.utils.response_helper import create_response
-from app.utils.DbValidator import DbValidator
+from app.utils.serializer import to_records
+from app.utils.conditional import conditional
+from app.utils.batch import keyed, parse_keys
 from app.services.driver_scraper import scrap_driver_stats
+from app.routes.jobs import scrape_or_enqueue, wants_async
 
 bp = Blueprint('drivers', __name__, url_prefix='/drivers')
 driver_model = DriverModel()
-validatior = DbValidator()
 
 @bp.get('/')
+@conditional('year', 'year')
 def drivers_by_year():
     year = request.args.get('year')
-    df, msg = driver_model.get_drivers_by_year(year)
-    result = df.to_dict(orient='records')
+    data, msg = driver_model.get_drivers_by_year(year)
+    result = to_records(data)
     return create_response(result, msg)
 
 @bp.get('/driver')
+@conditional('session', 'session_key')
 def driver_by_number_and_session():
-    session_key = request.args.get('session_key')
+    session_key = request.args.get('session_key', type=int)
+    driver_number = request.args.get('driver_number', type=int)
     
-    if not validatior.session_exists(session_key):
-        return make_response(jsonify({'error': f'The session {session_key} does not exist'}), 404)
+    data, msg, session_found = driver_model.get_driver_info(driver_number, session_key)
+    if msg:
+        return create_response(None, msg)
     
-    driver_number = request.args.get('driver_number')
+    if not session_found:
+        return make_response(jsonify({'error': f'The session {session_key} does not exist'}), 404)
     
-    if not validatior.driver_exists_in_session(driver_number, session_key):
+    if len(data) == 0:
         return make_response(jsonify({'error': f'Driver with number {driver_number} does not exist in the session {session_key}'}), 404)
     
+    return create_response(data, msg)
+
+@bp.get('/driver/batch')
+@conditional('session', 'session_key')
+def drivers_by_numbers_and_session():
+    """
+    Several drivers of one session in one round trip, keyed by driver_number
+
+    Query args:
+        session_key
+        driver_number: comma-separated or repeated, at most BATCH_MAX_KEYS
+    """
+    session_key = request.args.get('session_key', type=int)
+    try:
+        driver_numbers = parse_keys('driver_number')
+    except ValueError as e:
+        return make_response(jsonify({'error': str(e)}), 400)
+    
+    data, msg, session_found = driver_model.get_drivers_info(driver_numbers, session_key)
+    if msg:
+        return create_response(None, msg)
+    
+    if not session_found:
+        return make_response(jsonify({'error': f'The session {session_key} does not exist'}), 404)
     
-    df, msg = driver_model.get_driver_info(driver_number, session_key)
-    result = df.to_dict(orient='records')
+    result = keyed(data, driver_numbers, 'driver_number',
+                   f'Driver with number {{key}} does not exist in the session {session_key}', many=False)
     return create_response(result, msg)
 
 @bp.get('/driver-for-year')
+@conditional('year', 'year')
 def driver_by_number_and_year():
-    year = request.args.get('year')    
-    driver_number = request.args.get('driver_number')
+    year = request.args.get('year', type=int)
+    driver_number = request.args.get('driver_number', type=int)
+    
+    data, msg = driver_model.get_driver_info_by_year(driver_number, year)
+    result = to_records(data)
+    if msg:
+        return create_response(None, msg)
     
-    if not validatior.driver_exists_in_year(driver_number, year):
+    if len(result) == 0:
         return make_response(jsonify({'error': f'Driver with number {driver_number} does not exist in the year {year}'}), 404)
     
-    df, msg = driver_model.get_driver_info_by_year(driver_number, year)
-    result = df.to_dict(orient='records')
     return create_response(result, msg)
 
 @bp.get('/race-wins')
+@conditional('year', 'year')
 def driver_race_win_by_year():
-    driver_number = request.args.get('driver_number')
-    year = request.args.get('year')
+    driver_number = request.args.get('driver_number', type=int)
+    year = request.args.get('year', type=int)
     
-    if not validatior.driver_exists_in_year(driver_number, year):
-        return make_response(jsonify({'error': f'Driver with number {driver_number} does not exist in the year {year}'}), 404)
+    data, msg, driver_found = driver_model.get_driver_race_wins_in_year(driver_number, year)
+    if msg:
+        return create_response(None, msg)
     
-    df, msg = driver_model.get_driver_race_wins_in_year(driver_number, year)
-    result = df.to_dict(orient='records')
+    if not driver_found:
+        return make_response(jsonify({'error': f'Driver with number {driver_number} does not exist in the year {year}'}), 404)
     
-    if len(result) == 0:
+    if len(data) == 0:
         return make_response(jsonify({'info': f'Driver did not win in the year {year}'}), 200)
     
-    return create_response(result, msg)
+    return create_response(data, msg)
 
 @bp.get('/podiums')
+@conditional('year', 'year')
 def driver_podiums_by_year():
-    driver_number = request.args.get('driver_number')
-    year = request.args.get('year')
+    driver_number = request.args.get('driver_number', type=int)
+    year = request.args.get('year', type=int)
     
-    if not validatior.driver_exists_in_year(driver_number, year):
-        return make_response(jsonify({'error': f'Driver with number {driver_number} does not exist in the year {year}'}), 404)
+    data, msg, driver_found = driver_model.get_driver_podiums_in_year(driver_number, year)
+    if msg:
+        return create_response(None, msg)
     
-    df, msg = driver_model.get_driver_podiums_in_year(driver_number, year)
-    result = df.to_dict(orient='records')
+    if not driver_found:
+        return make_response(jsonify({'error': f'Driver with number {driver_number} does not exist in the year {year}'}), 404)
     
-    if len(result) == 0:
+    if len(data) == 0:
         return make_response(jsonify({'info': f'Driver did not get podiums in the year {year}'}), 200)
     
-    return create_response(result, msg)
+    return create_response(data, msg)
 
 @bp.get('/driver-stats')
 def driver_stats():
-    driver_number = request.args.get('driver_number')
-    year = request.args.get('year')
+    driver_number = request.args.get('driver_number', type=int)
+    year = request.args.get('year', type=int)
     
-    if not validatior.driver_exists_in_year(driver_number, year):
-        return make_response(jsonify({'error': f'Driver with number {driver_number} does not exist in the year {year}'}), 404)
+    data, msg = driver_model.get_driver_info_by_year(driver_number, year)
+    result = to_records(data)
+    if msg:
+        return create_response(None, msg)
     
-    df, msg = driver_model.get_driver_info_by_year(driver_number, year)
+    if len(result) == 0:
+        return make_response(jsonify({'error': f'Driver with number {driver_number} does not exist in the year {year}'}), 404)
 
-    full_name = df.loc[0, 'full_name']
+    full_name = result[0]['full_name']
     first_name, last_name = full_name.split(' ', 1)
     
+    if wants_async():
+        return scrape_or_enqueue(scrap_driver_stats, (first_name, last_name),
+                                 f"The stats for {full_name} are not available")
+    
     result = scrap_driver_stats(first_name, last_name)
     
+    if result is None:
+        return create_response(None, f"The stats for {full_name} are not available")
+    
     return create_response(result, None)
-    
\ No newline at end of file
@@ -0,0 +1,59 @@
+from flask import Blueprint, jsonify, make_response, request, url_for
+from app.config import Config
+from app.services.scrape_jobs import scrape_jobs
+from app.utils.response_helper import create_response
+
+bp = Blueprint('jobs', __name__, url_prefix='/jobs')
+
+def wants_async() -> bool:
+    """?async=1 / ?async=0 on a scrape-backed route, defaulting to SCRAPE_ASYNC"""
+    value = request.args.get('async')
+    if value is None:
+        return Config.SCRAPE_ASYNC
+    return value.lower() in ('1', 'true', 'yes')
+
+def scrape_or_enqueue(scraper, args, unavailable: str):
+    """
+    Async mode of a scrape-backed route: the cached result when there is one,
+    otherwise 202 Accepted with a job id and the URL to poll
+
+    Args:
+        scraper: A @cached_scrape scraper
+        args: Its arguments
+        unavailable: Error for a scrape that failed
+    """
+    hit, result = scraper.lookup(*args)
+    if hit:
+        if result is None:
+            return create_response(None, unavailable)
+        return create_response(result, None)
+
+    job = scrape_jobs.submit(scraper, *args)
+    if job is None:
+        response = make_response(jsonify({'error': 'Too many scrape jobs outstanding, retry later'}), 503)
+        response.headers['Retry-After'] = '5'
+        return response
+
+    status_url = url_for('jobs.job_status', job_id=job['job_id'])
+    response = make_response(jsonify({'job_id': job['job_id'], 'status': job['status'], 'status_url': status_url}), 202)
+    response.headers['Location'] = status_url
+    response.headers['Retry-After'] = '1'
+    return response
+
+@bp.get('/<job_id>')
+def job_status(job_id):
+    """
+    Status of a scrape job; the result is included once it is done
+
+    Any worker can answer: finished results are read from the shared scrape
+    cache. A job queued on another worker reports 'pending'.
+    """
+    try:
+        report = scrape_jobs.status(job_id)
+    except ValueError as e:
+        return make_response(jsonify({'error': str(e)}), 404)
+
+    response = make_response(jsonify(report), 200)
+    if report['status'] in ('queued', 'running', 'pending'):
+        response.headers['Retry-After'] = '1'
+    return response
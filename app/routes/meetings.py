@@ -1,46 +1,65 @@
 from flask import Blueprint, request, jsonify, make_response
 from app.models.MeetingsModel import MeetingsModel
 from app.utils.response_helper import create_response
+from app.utils.serializer import to_records
+from app.utils.conditional import conditional
 from app.services.circuit_scraper import scrap_circuit_info
-from app.utils.DbValidator import DbValidator
+from app.routes.jobs import scrape_or_enqueue, wants_async
 
 bp = Blueprint('meetings', __name__, url_prefix='/meetings')
 meetings_mode = MeetingsModel()
-validator = DbValidator()
 
 @bp.get('/')
+@conditional('year', 'year', default=2025)
 def meetings_by_year():
     year = request.args.get('year', default=2025, type=int)
-    df, msg = meetings_mode.get_meetings_by_year(year)
-    result = df.to_dict(orient='records')
+    data, msg = meetings_mode.get_meetings_by_year(year)
+    result = to_records(data)
     return create_response(result, msg)
 
 @bp.get('/get-meeting')
+@conditional('meeting', 'meeting_key')
 def meeting_by_key():
     meeting_key = request.args.get('meeting_key', type=int)
     
-    if not validator.meeting_exists(meeting_key):
+    data, msg = meetings_mode.get_meeting_by_key(meeting_key)
+    result = to_records(data)
+    if msg:
+        return create_response(None, msg)
+    
+    if len(result) == 0:
         return make_response(jsonify({'error': f'The meeting with key {meeting_key} does not exists'}), 404)
     
-    df, msg = meetings_mode.get_meeting_by_key(meeting_key)
-    result = df.to_dict(orient='records')
     return create_response(result, msg)
 
 @bp.get('/get-meeting-info')
 def meeting_info():
     meeting_key = request.args.get('meeting_key', type=int)
     
-    if not validator.meeting_exists(meeting_key):
-        return make_response(jsonify({'error': f'The meeting with key {meeting_key} does not exists'}), 404)
+    data, msg = meetings_mode.get_meeting_with_circuit_info(meeting_key)
+    result = to_records(data)
+    if msg:
+        return create_response(None, msg)
     
-    df, msg = meetings_mode.get_meeting_by_key(meeting_key)
+    if len(result) == 0:
+        return make_response(jsonify({'error': f'The meeting with key {meeting_key} does not exists'}), 404)
         
-    country_name = df.iloc[0]["country_name"]
-    year = df.iloc[0]["year"]
+    meeting = result[0]
+    
+    # Pre-scraped by F1DataManager.warm_circuit_info
+    if meeting["circuit_info"]:
+        return create_response(meeting["circuit_info"], None)
+    
+    country_name = meeting["country_name"]
+    year = meeting["year"]
     
     if country_name is None or year is None:
         return create_response(None, "The session or the year does not exists")
     
+    if wants_async():
+        return scrape_or_enqueue(scrap_circuit_info, (str(year), str(country_name)),
+                                 f"The information for the circuit in {country_name} for the year {year} is not available")
+    
     result = scrap_circuit_info(str(year), str(country_name))
     
     if not isinstance(result, dict):
@@ -0,0 +1,43 @@
+from flask import Blueprint, Response, jsonify, make_response, request
+from app.services.season_bundle import ENCODINGS, season_bundles
+from app.utils.cache import ttl_for_year
+from app.utils.timing import timed
+
+bp = Blueprint('seasons', __name__, url_prefix='/seasons')
+
+@bp.get('/bundle')
+def season_bundle():
+    """
+    Meetings, sessions, results and drivers of a season in one pre-compressed
+    document, published by the loader; no database query is made
+
+    Query args:
+        year (default 2025)
+
+    Brotli or gzip is picked from Accept-Encoding. The strong ETag only
+    changes when the season's data does, and carries the encoding since each
+    one is a different body.
+    """
+    year = request.args.get('year', default=2025, type=int)
+
+    with timed('bundle'):
+        bundle = season_bundles.get(year)
+    if bundle is None:
+        return make_response(jsonify({'error': f'No bundle has been built for the season {year}'}), 404)
+
+    max_age = int(ttl_for_year(year))
+    available = [encoding for encoding in ENCODINGS if encoding in bundle.bodies]
+    encoding = request.accept_encodings.best_match(available, default='identity')
+    etag = f'{bundle.etag}-{encoding}'
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+    else:
+        response = Response(bundle.bodies[encoding], 200, mimetype='application/json')
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+
+    response.set_etag(etag)
+    response.last_modified = bundle.generated_at
+    response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    response.vary.add('Accept-Encoding')
+    return response
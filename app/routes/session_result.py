@@ -1,19 +1,38 @@
-from flask import Blueprint, request
+from flask import Blueprint, jsonify, make_response, request
 from app.models.SessionResultModel import SessionResultModel
 from app.utils.response_helper import create_response
+from app.utils.serializer import to_records
+from app.utils.conditional import conditional
+from app.utils.batch import keyed, parse_keys
 
 bp = Blueprint('session_result', __name__)
 session_result_model = SessionResultModel()
 
 @bp.get('/')
+@conditional('session', 'session_key')
 def all_sessions():
     session_key = request.args.get('session_key')
-    df, msg = session_result_model.get_session_result_for_session(session_key)
-    
-    for col in ["position", "number_of_laps", "points"]:
-        if col in df.columns:
-            df[col] = df[col].astype("Int64")
-            
-    result = df.to_dict(orient='records')
+    data, msg = session_result_model.get_session_result_for_session(session_key)
+    result = to_records(data)
+
+    return create_response(result, msg)
+
+@bp.get('/batch')
+def session_results_batch():
+    """
+    Results of several sessions in one round trip, keyed by session_key
 
-    return create_response(result, msg)
\ No newline at end of file
+    Query args:
+        session_key: comma-separated or repeated, at most BATCH_MAX_KEYS
+    """
+    try:
+        session_keys = parse_keys('session_key')
+    except ValueError as e:
+        return make_response(jsonify({'error': str(e)}), 400)
+    
+    data, msg = session_result_model.get_session_results_for_sessions(session_keys)
+    if msg:
+        return create_response(None, msg)
+    
+    result = keyed(data, session_keys, 'session_key', 'No results for the session {key}')
+    return create_response(result, msg)
@@ -1,20 +1,65 @@
-from flask import Blueprint, request
+from flask import Blueprint, jsonify, make_response, request
 from app.models.SessionsModel import SessionsModel
 from app.utils.response_helper import create_response
+from app.utils.serializer import to_records
+from app.utils.conditional import conditional
+from app.utils.batch import keyed, parse_keys
 
 bp = Blueprint('sessions', __name__)
 sessons_model = SessionsModel()
 
 @bp.get('/')
+@conditional('meeting', 'meeting_key')
 def all_sessions():
     meeting_key = request.args.get('meeting_key')
-    df, msg = sessons_model.get_sessions_for_meeting(meeting_key)
-    result = df.to_dict(orient='records')
+    data, msg = sessons_model.get_sessions_for_meeting(meeting_key)
+    result = to_records(data)
     return create_response(result, msg)
 
 @bp.get('/get-session')
+@conditional('session', 'session_key')
 def meeting_by_key():
     session_key = request.args.get('session_key')
-    df, msg = sessons_model.get_session_by_key(session_key)
-    result = df.to_dict(orient='records')
-    return create_response(result, msg)
\ No newline at end of file
+    data, msg = sessons_model.get_session_by_key(session_key)
+    result = to_records(data)
+    return create_response(result, msg)
+
+@bp.get('/batch')
+def sessions_batch():
+    """
+    Sessions of several meetings in one round trip, keyed by meeting_key
+
+    Query args:
+        meeting_key: comma-separated or repeated, at most BATCH_MAX_KEYS
+    """
+    try:
+        meeting_keys = parse_keys('meeting_key')
+    except ValueError as e:
+        return make_response(jsonify({'error': str(e)}), 400)
+    
+    data, msg = sessons_model.get_sessions_for_meetings(meeting_keys)
+    if msg:
+        return create_response(None, msg)
+    
+    result = keyed(data, meeting_keys, 'meeting_key', 'No sessions for the meeting {key}')
+    return create_response(result, msg)
+
+@bp.get('/get-session/batch')
+def sessions_by_keys_batch():
+    """
+    Several sessions in one round trip, keyed by session_key
+
+    Query args:
+        session_key: comma-separated or repeated, at most BATCH_MAX_KEYS
+    """
+    try:
+        session_keys = parse_keys('session_key')
+    except ValueError as e:
+        return make_response(jsonify({'error': str(e)}), 400)
+    
+    data, msg = sessons_model.get_sessions_by_keys(session_keys)
+    if msg:
+        return create_response(None, msg)
+    
+    result = keyed(data, session_keys, 'session_key', 'The session {key} does not exist', many=False)
+    return create_response(result, msg)
@@ -0,0 +1,21 @@
+from flask import Blueprint, request
+from app.models.StandingsModel import StandingsModel
+from app.utils.response_helper import create_response
+from app.utils.conditional import conditional
+
+bp = Blueprint('standings', __name__, url_prefix='/standings')
+standings_model = StandingsModel()
+
+@bp.get('/drivers')
+@conditional('year', 'year', default=2025)
+def driver_standings():
+    year = request.args.get('year', default=2025, type=int)
+    data, msg = standings_model.get_driver_standings(year)
+    return create_response(data, msg)
+
+@bp.get('/teams')
+@conditional('year', 'year', default=2025)
+def team_standings():
+    year = request.args.get('year', default=2025, type=int)
+    data, msg = standings_model.get_team_standings(year)
+    return create_response(data, msg)
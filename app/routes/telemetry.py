@@ -0,0 +1,96 @@
+from flask import Blueprint, request, jsonify, make_response
+from app.config import Config
+from app.models.TelemetryModel import TelemetryModel, RAW_TABLES
+from app.models.SessionsModel import SessionsModel
+from app.utils.response_helper import create_response, stream_response
+from app.utils.conditional import conditional
+from app.utils.downsample import pick_resolution, to_trace
+from app.utils.keyset import decode_cursor
+
+bp = Blueprint('telemetry', __name__, url_prefix='/telemetry')
+telemetry_model = TelemetryModel()
+sessions_model = SessionsModel()
+
+@bp.get('/car-data')
+@conditional('session', 'session_key')
+def car_data_trace():
+    """
+    Downsampled speed/throttle/brake/gear/rpm trace for one driver
+
+    Query args:
+        session_key, driver_number
+        resolution: bucket width in ms, or
+        points: approximate number of buckets across the session (default TELEMETRY_DEFAULT_POINTS)
+    """
+    session_key = request.args.get('session_key', type=int)
+    driver_number = request.args.get('driver_number', type=int)
+    resolution = request.args.get('resolution', type=int)
+    points = request.args.get('points', default=Config.TELEMETRY_DEFAULT_POINTS, type=int)
+    points = max(1, min(points, Config.TELEMETRY_MAX_POINTS))
+
+    sessions, msg = sessions_model.get_session_by_key(session_key)
+    if msg:
+        return create_response(None, msg)
+
+    if len(sessions) == 0:
+        return make_response(jsonify({'error': f'The session {session_key} does not exist'}), 404)
+
+    session = sessions[0]
+    span_ms = (session['date_end'] - session['date_start']).total_seconds() * 1000
+    resolutions = Config.TELEMETRY_ROLLUP_RESOLUTIONS
+    # Never return more than TELEMETRY_MAX_POINTS buckets, whatever the resolution asked for
+    width = max(resolution or span_ms / points, span_ms / Config.TELEMETRY_MAX_POINTS, min(resolutions))
+    level = pick_resolution(width, resolutions)
+    width = int(-(-width // level) * level)
+
+    rows, msg = telemetry_model.get_car_data_rollup(session_key, driver_number, level)
+    if msg:
+        return create_response(None, msg)
+
+    if len(rows) == 0:
+        return make_response(jsonify({'error': f'No telemetry loaded for driver {driver_number} in the session {session_key}'}), 404)
+
+    result = {
+        'session_key': session_key,
+        'driver_number': driver_number,
+        'resolution_ms': width,
+        **to_trace(rows, width),
+    }
+    return create_response(result, None)
+
+@bp.get('/raw/<table>')
+@conditional('session', 'session_key')
+def raw_telemetry(table):
+    """
+    Raw car_data/location/position/intervals rows for a session, streamed
+
+    Query args:
+        session_key, driver_number (optional)
+        order_by: 'id' (default) or 'date'
+        after: keyset cursor, the last row's id, or '<date>,<id>' when ordering by date
+        limit: page size, capped at RAW_TELEMETRY_MAX_LIMIT; without it the rest of the session is streamed
+        format: 'ndjson' for one row per line (also chosen by Accept: application/x-ndjson)
+    """
+    session_key = request.args.get('session_key', type=int)
+    driver_number = request.args.get('driver_number', type=int)
+    order_by = request.args.get('order_by', default='id')
+    cursor = request.args.get('after')
+    limit = request.args.get('limit', type=int)
+    ndjson = (request.args.get('format') == 'ndjson'
+              or request.accept_mimetypes.best == 'application/x-ndjson')
+
+    if table not in RAW_TABLES:
+        return make_response(jsonify({'error': f'Unknown telemetry table {table}'}), 404)
+    if limit is not None:
+        if limit <= 0:
+            return make_response(jsonify({'error': 'limit must be a positive integer'}), 400)
+        limit = min(limit, Config.RAW_TELEMETRY_MAX_LIMIT)
+
+    try:
+        after = decode_cursor(cursor, order_by) if cursor else None
+        chunks = telemetry_model.stream_table(table, session_key, driver_number, order_by, after, limit,
+                                              chunk_size=Config.STREAM_CHUNK_SIZE)
+    except ValueError as e:
+        return make_response(jsonify({'error': f'Invalid pagination arguments: {e}'}), 400)
+
+    return stream_response(chunks, ndjson)
@@ -13,6 +13,8 @@ CREATE TABLE meetings (
     year INTEGER NOT NULL
 );
 
+CREATE INDEX idx_meetings_year ON meetings(year, date_start);
+
 CREATE TABLE sessions (
     session_key INTEGER PRIMARY KEY,
     meeting_key INTEGER NOT NULL REFERENCES meetings(meeting_key),
@@ -30,6 +32,9 @@ CREATE TABLE sessions (
     year INTEGER NOT NULL
 );
 
+CREATE INDEX idx_sessions_year ON sessions(year, session_type);
+CREATE INDEX idx_sessions_meeting ON sessions(meeting_key, date_start);
+
 CREATE TABLE drivers (
     id SERIAL PRIMARY KEY,
     session_key INTEGER NOT NULL REFERENCES sessions(session_key),
@@ -47,31 +52,77 @@ CREATE TABLE drivers (
     UNIQUE(session_key, driver_number)
 );
 
+-- UNIQUE(session_key, driver_number) covers per-session lookups; this one
+-- serves the per-driver season queries, which start from driver_number
+CREATE INDEX idx_drivers_driver_number ON drivers(driver_number, session_key);
+
+-- Telemetry tables are list-partitioned by session_key: every session gets
+-- its own partition (e.g. car_data_9158), created on demand by
+-- F1DataManager.ensure_partition. Queries filtered on session_key touch one
+-- partition, and reloading or dropping a session detaches its partition
+-- instead of running a DELETE. Keys and unique indexes must include
+-- session_key on a partitioned table.
 CREATE TABLE position (
-    id BIGSERIAL PRIMARY KEY,
+    id BIGSERIAL,
     session_key INTEGER NOT NULL REFERENCES sessions(session_key),
     meeting_key INTEGER NOT NULL REFERENCES meetings(meeting_key),
     driver_number INTEGER NOT NULL,
     date TIMESTAMPTZ NOT NULL,
-    position INTEGER NOT NULL
-);
+    position INTEGER NOT NULL,
+    PRIMARY KEY (session_key, id)
+) PARTITION BY LIST (session_key);
 
-CREATE INDEX idx_position_session_driver ON position(session_key, driver_number);
+CREATE UNIQUE INDEX idx_position_session_driver ON position(session_key, driver_number, date);
 CREATE INDEX idx_position_date ON position(date);
 
 CREATE TABLE intervals (
-    id BIGSERIAL PRIMARY KEY,
+    id BIGSERIAL,
     session_key INTEGER NOT NULL REFERENCES sessions(session_key),
     meeting_key INTEGER NOT NULL REFERENCES meetings(meeting_key),
     driver_number INTEGER NOT NULL,
     date TIMESTAMPTZ NOT NULL,
     gap_to_leader NUMERIC(10, 3),
-    interval NUMERIC(10, 3)
-);
+    interval NUMERIC(10, 3),
+    PRIMARY KEY (session_key, id)
+) PARTITION BY LIST (session_key);
 
-CREATE INDEX idx_intervals_session ON intervals(session_key);
+CREATE UNIQUE INDEX idx_intervals_session_driver_date ON intervals(session_key, driver_number, date);
 CREATE INDEX idx_intervals_date ON intervals(date);
 
+CREATE TABLE car_data (
+    id BIGSERIAL,
+    session_key INTEGER NOT NULL REFERENCES sessions(session_key),
+    meeting_key INTEGER NOT NULL REFERENCES meetings(meeting_key),
+    driver_number INTEGER NOT NULL,
+    date TIMESTAMPTZ NOT NULL,
+    brake INTEGER,
+    drs INTEGER,
+    n_gear INTEGER,
+    rpm INTEGER,
+    speed INTEGER,
+    throttle INTEGER,
+    PRIMARY KEY (session_key, id)
+) PARTITION BY LIST (session_key);
+
+-- Per-driver pages of /telemetry/raw, in the default id order
+CREATE INDEX idx_car_data_session_driver ON car_data(session_key, driver_number, id);
+CREATE INDEX idx_car_data_date ON car_data(date);
+
+CREATE TABLE location (
+    id BIGSERIAL,
+    session_key INTEGER NOT NULL REFERENCES sessions(session_key),
+    meeting_key INTEGER NOT NULL REFERENCES meetings(meeting_key),
+    driver_number INTEGER NOT NULL,
+    date TIMESTAMPTZ NOT NULL,
+    x INTEGER,
+    y INTEGER,
+    z INTEGER,
+    PRIMARY KEY (session_key, id)
+) PARTITION BY LIST (session_key);
+
+CREATE INDEX idx_location_session_driver ON location(session_key, driver_number, id);
+CREATE INDEX idx_location_date ON location(date);
+
 CREATE TABLE session_result (
     id SERIAL PRIMARY KEY,
     session_key INTEGER NOT NULL REFERENCES sessions(session_key),
@@ -88,3 +139,113 @@ CREATE TABLE session_result (
     UNIQUE(session_key, driver_number)
 );
 
+CREATE INDEX idx_session_result_session_position ON session_result(session_key, position);
+
+
+CREATE TABLE data_version (
+    scope VARCHAR(20) NOT NULL,
+    scope_key INTEGER NOT NULL,
+    version BIGINT NOT NULL DEFAULT 1,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (scope, scope_key)
+);
+
+CREATE TABLE scrape_cache (
+    cache_key VARCHAR(200) PRIMARY KEY,
+    payload JSONB,
+    is_error BOOLEAN NOT NULL DEFAULT FALSE,
+    fetched_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE TABLE circuit_info (
+    meeting_key INTEGER PRIMARY KEY REFERENCES meetings(meeting_key),
+    year INTEGER NOT NULL,
+    country_name VARCHAR(100),
+    info JSONB NOT NULL,
+    scraped_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX idx_circuit_info_year ON circuit_info(year);
+
+CREATE TABLE sync_state (
+    table_name VARCHAR(50) NOT NULL,
+    year INTEGER NOT NULL,
+    watermark_column VARCHAR(50) NOT NULL,
+    watermark TEXT,
+    records_synced BIGINT NOT NULL DEFAULT 0,
+    synced_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (table_name, year)
+);
+
+-- One row per (table, session) load. 'loading' rows that never reach
+-- 'complete' mark interrupted, partially loaded sessions.
+CREATE TABLE load_manifest (
+    table_name VARCHAR(50) NOT NULL,
+    session_key INTEGER NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'loading',
+    row_count BIGINT NOT NULL DEFAULT 0,
+    started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    completed_at TIMESTAMPTZ,
+    PRIMARY KEY (table_name, session_key)
+);
+
+-- Per-driver min/max/mean buckets of car_data at several resolutions, built
+-- by F1DataManager.build_rollups when a session's car_data is loaded
+CREATE TABLE car_data_rollup (
+    session_key INTEGER NOT NULL REFERENCES sessions(session_key),
+    driver_number INTEGER NOT NULL,
+    resolution_ms INTEGER NOT NULL,
+    bucket_start TIMESTAMPTZ NOT NULL,
+    samples INTEGER NOT NULL,
+    speed_min INTEGER,
+    speed_max INTEGER,
+    speed_mean REAL,
+    throttle_min INTEGER,
+    throttle_max INTEGER,
+    throttle_mean REAL,
+    brake_min INTEGER,
+    brake_max INTEGER,
+    brake_mean REAL,
+    gear_min INTEGER,
+    gear_max INTEGER,
+    gear_mean REAL,
+    rpm_min INTEGER,
+    rpm_max INTEGER,
+    rpm_mean REAL,
+    PRIMARY KEY (session_key, driver_number, resolution_ms, bucket_start)
+);
+
+-- Season standings, recomputed by F1DataManager.refresh_standings for the
+-- seasons touched whenever new session results are loaded. Counts cover
+-- session_type 'Race' (Grand Prix and sprint), like /drivers/race-wins.
+CREATE TABLE driver_standings (
+    year INTEGER NOT NULL,
+    driver_number INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    full_name VARCHAR(200),
+    name_acronym VARCHAR(3),
+    team_name VARCHAR(100),
+    team_colour VARCHAR(6),
+    points INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    podiums INTEGER NOT NULL DEFAULT 0,
+    dnfs INTEGER NOT NULL DEFAULT 0,
+    races INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (year, driver_number)
+);
+
+CREATE TABLE team_standings (
+    year INTEGER NOT NULL,
+    team_name VARCHAR(100) NOT NULL,
+    position INTEGER NOT NULL,
+    team_colour VARCHAR(6),
+    points INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    podiums INTEGER NOT NULL DEFAULT 0,
+    dnfs INTEGER NOT NULL DEFAULT 0,
+    races INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (year, team_name)
+);
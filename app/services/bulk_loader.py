@@ -0,0 +1,113 @@
+import io
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _format_value(value: Any) -> str:
+    """Render one value in COPY text format"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return _array_literal(value).translate(_ESCAPES)
+    return str(value).translate(_ESCAPES)
+
+
+def _array_literal(values) -> str:
+    """Postgres array literal; anything but numbers and NULL is double-quoted"""
+    items = []
+    for v in values:
+        if v is None:
+            items.append('NULL')
+        elif isinstance(v, (list, tuple)):
+            items.append(_array_literal(v))
+        elif isinstance(v, bool):
+            items.append('t' if v else 'f')
+        elif isinstance(v, (int, float)):
+            items.append(repr(v))
+        else:
+            text = v.isoformat() if isinstance(v, (datetime, date)) else str(v)
+            items.append('"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"')
+    return '{' + ','.join(items) + '}'
+
+
+def _copy_lines(columns: List[str], rows: Iterable[Dict]) -> Iterator[bytes]:
+    for row in rows:
+        yield ('\t'.join(_format_value(row.get(col)) for col in columns) + '\n').encode('utf-8')
+
+
+class RowStream(io.RawIOBase):
+    """
+    Read-only file object that renders dict rows as COPY text on demand.
+
+    copy_expert pulls fixed-size chunks from it, so the full CSV/text payload
+    is never held in memory at once.
+    """
+
+    def __init__(self, columns: List[str], rows: Iterable[Dict]):
+        self._lines = _copy_lines(columns, rows)
+        self._buffer = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+
+        if size < 0:
+            chunk, self._buffer = self._buffer, b''
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+def copy_rows(conn, table: str, columns: List[str], rows: Iterable[Dict],
+              dedup: bool = False, conflict_target: Optional[str] = None) -> int:
+    """
+    Bulk load rows with COPY FROM STDIN. The caller owns the transaction.
+
+    Args:
+        conn: psycopg2 connection
+        table: Target table
+        columns: Columns to load, in order; missing keys load as NULL
+        rows: Iterable of dict records, consumed lazily
+        dedup: COPY into a temporary staging table first, then
+            INSERT ... SELECT ... ON CONFLICT DO NOTHING into the target
+        conflict_target: Optional conflict target, e.g. '(session_key, driver_number, date)'
+
+    Returns:
+        Number of rows written to the target table
+    """
+    cols_str = ', '.join(columns)
+    stream = RowStream(columns, rows)
+
+    with conn.cursor() as cursor:
+        if not dedup:
+            cursor.copy_expert(f"COPY {table} ({cols_str}) FROM STDIN", stream, size=1 << 16)
+            return cursor.rowcount
+
+        staging = f"staging_{table}"
+        cursor.execute(f"CREATE TEMP TABLE IF NOT EXISTS {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP")
+        cursor.execute(f"TRUNCATE {staging}")
+        cursor.copy_expert(f"COPY {staging} ({cols_str}) FROM STDIN", stream, size=1 << 16)
+        cursor.execute(
+            f"INSERT INTO {table} ({cols_str}) SELECT {cols_str} FROM {staging} "
+            f"ON CONFLICT {conflict_target or ''} DO NOTHING"
+        )
+        return cursor.rowcount
@@ -1,11 +1,16 @@
 import requests
 from bs4 import BeautifulSoup
+from app.config import Config
+from app.services.scrape_cache import cached_scrape
+from app.utils.timing import timed
 
+@cached_scrape('circuit_info', lambda year, country: f"{year}:{country.lower().replace(' ', '-')}")
+@timed('scrape')
 def scrap_circuit_info(year: str, country: str):
     country = country.lower().replace(' ', '-')
     url = f"https://www.formula1.com/en/racing/{year}/{country}"
     
-    response = requests.get(url)
+    response = requests.get(url, timeout=Config.SCRAPE_TIMEOUT)
     soup = BeautifulSoup(response.content, "html.parser")
     
     infos = {}
@@ -1,16 +1,39 @@
 import psycopg2
-from psycopg2.extras import execute_batch
+from psycopg2.extras import execute_batch, Json
 import requests
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple
+import sys
 import time
+import uuid
 import logging
+from collections import Counter
 from dataclasses import dataclass
+from datetime import timedelta
+from app.config import Config
+from app.utils.cache import invalidate
+from app.utils.downsample import CHANNELS
+from app.utils.keyset import keyset, encode_cursor, decode_cursor
+from app.services.circuit_scraper import scrap_circuit_info
+from app.services.openf1_client import OpenF1Client, FetchConfig
+from app.services.bulk_loader import copy_rows
+from app.services.season_bundle import build_season_bundle, write_season_bundle
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def peak_memory_mb() -> float:
+    """Peak resident set size of this process in MB (0 where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
 @dataclass
 class CacheConfig:
     """Configuration for what data to pre-load vs lazy-load"""
@@ -21,22 +44,48 @@ class CacheConfig:
     ]
     lazy_tables = ['car_data', 'location', 'intervals', 'position']
     recent_sessions_count = 3  # Pre-load last N race weekends
+    copy_threshold = 10000  # Telemetry batches at least this large go through COPY
+    copy_columns = {
+        'car_data': ['session_key', 'meeting_key', 'driver_number', 'date',
+                     'brake', 'drs', 'n_gear', 'rpm', 'speed', 'throttle'],
+        'location': ['session_key', 'meeting_key', 'driver_number', 'date', 'x', 'y', 'z'],
+        'position': ['session_key', 'meeting_key', 'driver_number', 'date', 'position'],
+        'intervals': ['session_key', 'meeting_key', 'driver_number', 'date', 'gap_to_leader', 'interval'],
+    }
+    # Tables with a natural unique key: reloads go through a staging table + ON CONFLICT
+    copy_dedup_tables = ['position', 'intervals']
+    stream_telemetry = True  # Parse telemetry responses incrementally straight into COPY
+    stream_chunk_size = 5000
+    # List-partitioned by session_key in F1data.sql; one partition per session
+    partitioned_tables = ['car_data', 'location', 'intervals', 'position']
+    # Incremental sync watermark per table; tables not listed follow session_key
+    sync_watermarks = {'meetings': 'date_start', 'sessions': 'date_start'}
+    # A completed session still without rows is asked for again until it has been over this long
+    sync_grace = timedelta(days=3)
+    # Tables in the /seasons/bundle document; a change marks the season's bundle stale
+    bundle_tables = ['meetings', 'sessions', 'drivers', 'session_result']
 
 
 class F1DataManager:
     """Manages F1 data with hybrid loading strategy"""
     
-    def __init__(self, db_config: Dict[str, str]):
+    def __init__(self, db_config: Dict[str, str], fetch_config: Optional[FetchConfig] = None,
+                 api_base_url: Optional[str] = None):
         """
         Initialize the data manager
         
         Args:
             db_config: Dict with keys: host, database, user, password, port
+            fetch_config: Rate limit, concurrency and retry settings for OpenF1
+            api_base_url: OpenF1-compatible API root (default Config.OPENF1_API_BASE_URL)
         """
         self.db_config = db_config
-        self.api_base_url = "https://api.openf1.org/v1"
+        self.api_base_url = (api_base_url or Config.OPENF1_API_BASE_URL).rstrip('/')
         self.config = CacheConfig()
+        self.client = OpenF1Client(fetch_config)
         self.conn = None
+        self._partitioned = None
+        self.stale_bundles = set()
         
     def connect(self):
         """Establish database connection"""
@@ -71,47 +120,455 @@ class F1DataManager:
     def fetch_from_api(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
         url = f"{self.api_base_url}/{endpoint}"
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self.client.fetch(url, endpoint, params)
             logger.info(f"Fetched {len(data)} records from {endpoint}")
             return data
         except requests.exceptions.RequestException as e:
             logger.error(f"API request failed for {endpoint}: {e}")
             return []
+    
+    """
+    Fetch several OpenF1 requests concurrently
+    
+    Args:
+        requests_: Iterable of (endpoint, params) pairs
+        
+    Yields:
+        (endpoint, params, data) as each response completes, so the caller
+        can insert it while the remaining requests are still downloading.
+        data is None when the request failed.
+    """
+    def fetch_many_from_api(self, requests_: Iterable[Tuple[str, Optional[Dict]]]) -> Iterator[Tuple[str, Optional[Dict], Optional[List[Dict]]]]:
+        jobs = ((f"{self.api_base_url}/{endpoint}", endpoint, params) for endpoint, params in requests_)
+        for endpoint, params, data in self.client.fetch_many(jobs):
+            if data is not None:
+                logger.info(f"Fetched {len(data)} records from {endpoint} {params or ''}")
+            yield endpoint, params, data
+    
+    """
+    Stream one OpenF1 response as bounded chunks of records
+    
+    Args:
+        endpoint: API endpoint (e.g., 'car_data', 'location')
+        params: Query parameters
+        
+    Yields:
+        Lists of at most CacheConfig.stream_chunk_size records. Request and
+        parse errors propagate so a partially consumed stream can be rolled back.
+    """
+    def stream_from_api(self, endpoint: str, params: Optional[Dict] = None) -> Iterator[List[Dict]]:
+        url = f"{self.api_base_url}/{endpoint}"
+        yield from self.client.stream(url, endpoint, params, chunk_size=self.config.stream_chunk_size)
             
     # ==================== CACHE CHECKING ====================
     """
     Check if data exists in database
     
+    Answered from load_manifest, so it is a primary-key lookup rather than
+    a count over the data table.
+    
     Args:
         table: Table name
         session_key: Optional session filter
         
     Returns:
-        True if data exists
+        True if the session (or, without a session, any session) is fully loaded
     """
     def is_table_cached(self, table: str, session_key: Optional[int] = None) -> bool:
         cursor = self.conn.cursor()
         try:
             if session_key:
-                cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE session_key = %s", (session_key,))
-            else:
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            count = cursor.fetchone()[0]
-            return count > 0
+                cursor.execute(
+                    "SELECT status = 'complete' FROM load_manifest WHERE table_name = %s AND session_key = %s",
+                    (table, session_key)
+                )
+                row = cursor.fetchone()
+                return bool(row and row[0])
+            cursor.execute(
+                "SELECT EXISTS (SELECT 1 FROM load_manifest WHERE table_name = %s AND status = 'complete')",
+                (table,)
+            )
+            return cursor.fetchone()[0]
         finally:
             cursor.close()
     
     """Get list of session_keys that have telemetry data cached"""
-    def get_cached_sessions(self) -> List[int]:
+    def get_cached_sessions(self, table: str = 'car_data') -> List[int]:
         cursor = self.conn.cursor()
         try:
-            cursor.execute("SELECT DISTINCT session_key FROM car_data")
+            cursor.execute(
+                "SELECT session_key FROM load_manifest WHERE table_name = %s AND status = 'complete' ORDER BY session_key",
+                (table,)
+            )
             return [row[0] for row in cursor.fetchall()]
         finally:
             cursor.close()
     
+    """Get loads that started but never completed, i.e. partially loaded sessions"""
+    def get_partial_loads(self) -> List[Dict]:
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT table_name, session_key, row_count, started_at
+                FROM load_manifest
+                WHERE status = 'loading'
+                ORDER BY started_at
+            """)
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+    
+    # ==================== LOAD MANIFEST ====================
+    
+    def begin_load(self, table: str, session_key: int):
+        """
+        Record that a session load started; it stays 'loading' until mark_loaded
+        
+        For telemetry tables, rows left by an earlier or interrupted load of
+        the session are cleared and its partition is created.
+        """
+        if table in self.config.partitioned_tables:
+            if self.get_load_status(table, session_key) is not None:
+                self.clear_session(table, session_key)
+            self.ensure_partition(table, session_key)
+        
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("""
+                INSERT INTO load_manifest (table_name, session_key, status)
+                VALUES (%s, %s, 'loading')
+                ON CONFLICT (table_name, session_key) DO UPDATE SET
+                    status = 'loading',
+                    started_at = NOW(),
+                    completed_at = NULL
+            """, (table, session_key))
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            logger.warning(f"Failed to record {table} load for session {session_key}: {e}")
+        finally:
+            cursor.close()
+    
+    def get_load_status(self, table: str, session_key: int) -> Optional[str]:
+        """'loading', 'complete', or None if the session was never loaded"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT status FROM load_manifest WHERE table_name = %s AND session_key = %s",
+                (table, session_key)
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
+        finally:
+            cursor.close()
+    
+    def abandon_load(self, table: str, session_key: int):
+        """Drop an in-progress marker for a load that turned out to have no data"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                "DELETE FROM load_manifest WHERE table_name = %s AND session_key = %s AND status = 'loading'",
+                (table, session_key)
+            )
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            logger.warning(f"Failed to clear {table} load for session {session_key}: {e}")
+        finally:
+            cursor.close()
+    
+    def mark_loaded(self, table: str, counts: Dict[int, int]):
+        """
+        Record committed loads as complete
+        
+        Args:
+            table: Table that was loaded
+            counts: Rows loaded per session_key
+        """
+        if not counts:
+            return
+        
+        cursor = self.conn.cursor()
+        try:
+            query = """
+                INSERT INTO load_manifest (table_name, session_key, status, row_count, completed_at)
+                VALUES (%s, %s, 'complete', %s, NOW())
+                ON CONFLICT (table_name, session_key) DO UPDATE SET
+                    status = 'complete',
+                    row_count = EXCLUDED.row_count,
+                    completed_at = NOW()
+            """
+            execute_batch(cursor, query, [(table, session_key, rows) for session_key, rows in counts.items()])
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            logger.warning(f"Failed to record completed {table} loads: {e}")
+        finally:
+            cursor.close()
+    
+    def after_load(self, table: str, counts: Dict[int, int]):
+        """Bookkeeping once a load is committed: manifest entries, then car_data rollups"""
+        self.mark_loaded(table, counts)
+        if table == 'car_data':
+            for session_key in counts:
+                self.build_rollups(session_key)
+    
+    def backfill_manifest(self, tables: Optional[List[str]] = None):
+        """
+        One-off: register sessions loaded before load_manifest existed
+        
+        Scans each table once; afterwards cache checks never touch the data tables.
+        """
+        tables = tables or [t for t in self.config.priority_tables + self.config.lazy_tables if t not in ['meetings', 'sessions']]
+        cursor = self.conn.cursor()
+        try:
+            for table in tables:
+                try:
+                    cursor.execute(f"""
+                        INSERT INTO load_manifest (table_name, session_key, status, row_count, completed_at)
+                        SELECT %s, session_key, 'complete', COUNT(*), NOW()
+                        FROM {table}
+                        GROUP BY session_key
+                        ON CONFLICT (table_name, session_key) DO NOTHING
+                    """, (table,))
+                    self.conn.commit()
+                    logger.info(f"Registered {cursor.rowcount} loaded sessions for {table}")
+                except Exception as e:
+                    self.conn.rollback()
+                    logger.warning(f"Could not backfill manifest for {table}: {e}")
+        finally:
+            cursor.close()
+    
+    # ==================== PARTITIONS ====================
+    
+    @staticmethod
+    def partition_name(table: str, session_key: int) -> str:
+        return f"{table}_{int(session_key)}"
+    
+    def is_partitioned(self, table: str) -> bool:
+        """Whether the live schema partitions a table (older databases may not)"""
+        if self._partitioned is None:
+            cursor = self.conn.cursor()
+            try:
+                cursor.execute("""
+                    SELECT c.relname
+                    FROM pg_partitioned_table p
+                    JOIN pg_class c ON c.oid = p.partrelid
+                """)
+                self._partitioned = {row[0] for row in cursor.fetchall()}
+            finally:
+                cursor.close()
+        return table in self._partitioned
+    
+    def ensure_partition(self, table: str, session_key: int):
+        """Create a session's partition of a telemetry table if it does not exist yet"""
+        if not self.is_partitioned(table):
+            return
+        
+        partition = self.partition_name(table, session_key)
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {partition} PARTITION OF {table} FOR VALUES IN ({int(session_key)})"
+            )
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Failed to create partition {partition}: {e}")
+        finally:
+            cursor.close()
+    
+    def clear_session(self, table: str, session_key: int):
+        """
+        Remove one session's rows from a telemetry table
+        
+        A partitioned table detaches and drops the session's partition, which
+        is a catalog change rather than a DELETE over millions of rows.
+        """
+        cursor = self.conn.cursor()
+        try:
+            if self.is_partitioned(table):
+                partition = self.partition_name(table, session_key)
+                cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (partition,))
+                if cursor.fetchone()[0]:
+                    cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {partition}")
+                    cursor.execute(f"DROP TABLE {partition}")
+            else:
+                cursor.execute(f"DELETE FROM {table} WHERE session_key = %s", (session_key,))
+            self.conn.commit()
+            logger.info(f"Cleared {table} for session {session_key}")
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Failed to clear {table} for session {session_key}: {e}")
+            raise
+        finally:
+            cursor.close()
+    
+    def drop_session(self, session_key: int, tables: Optional[List[str]] = None):
+        """
+        Drop a session's telemetry and its load_manifest entries
+        
+        Args:
+            session_key: Session to drop
+            tables: Telemetry tables to drop it from (default: all partitioned tables)
+        """
+        tables = tables or self.config.partitioned_tables
+        for table in tables:
+            self.clear_session(table, session_key)
+        
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                "DELETE FROM load_manifest WHERE session_key = %s AND table_name = ANY(%s)",
+                (session_key, list(tables))
+            )
+            if 'car_data' in tables:
+                cursor.execute("DELETE FROM car_data_rollup WHERE session_key = %s", (session_key,))
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            logger.warning(f"Failed to clear load manifest for session {session_key}: {e}")
+        finally:
+            cursor.close()
+        
+        self.notify_data_changed([{'session_key': session_key}])
+    
+    # ==================== TELEMETRY ROLLUPS ====================
+    
+    def build_rollups(self, session_key: int, resolutions: Optional[List[int]] = None):
+        """
+        Precompute per-driver min/max/mean buckets of car_data for /telemetry
+        
+        The finest resolution is aggregated from the session's car_data
+        partition in one pass; each coarser one is folded from the finest
+        rollup, with means weighted by sample count.
+        
+        Args:
+            session_key: Session whose car_data was just loaded
+            resolutions: Bucket widths in ms (default Config.TELEMETRY_ROLLUP_RESOLUTIONS)
+        """
+        resolutions = sorted(resolutions or Config.TELEMETRY_ROLLUP_RESOLUTIONS)
+        finest = resolutions[0]
+        stats = [f"{channel}_{stat}" for channel in CHANNELS for stat in ('min', 'max', 'mean')]
+        cols_str = ', '.join(stats)
+        from_raw = ', '.join(
+            f"MIN({column}), MAX({column}), AVG({column})" for column in CHANNELS.values()
+        )
+        from_rollup = ', '.join(
+            f"MIN({channel}_min), MAX({channel}_max), "
+            f"SUM({channel}_mean * samples) / NULLIF(SUM(samples) FILTER (WHERE {channel}_mean IS NOT NULL), 0)"
+            for channel in CHANNELS
+        )
+        
+        def bucket(column: str, width: int) -> str:
+            return f"to_timestamp(floor(extract(epoch FROM {column}) * 1000 / {width}) * {width} / 1000.0)"
+        
+        start_time = time.time()
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("DELETE FROM car_data_rollup WHERE session_key = %s", (session_key,))
+            cursor.execute(f"""
+                INSERT INTO car_data_rollup (session_key, driver_number, resolution_ms, bucket_start, samples, {cols_str})
+                SELECT session_key, driver_number, {finest}, {bucket('date', finest)}, COUNT(*), {from_raw}
+                FROM car_data
+                WHERE session_key = %s
+                GROUP BY session_key, driver_number, 4
+            """, (session_key,))
+            
+            for width in resolutions[1:]:
+                cursor.execute(f"""
+                    INSERT INTO car_data_rollup (session_key, driver_number, resolution_ms, bucket_start, samples, {cols_str})
+                    SELECT session_key, driver_number, {width}, {bucket('bucket_start', width)}, SUM(samples), {from_rollup}
+                    FROM car_data_rollup
+                    WHERE session_key = %s AND resolution_ms = {finest}
+                    GROUP BY session_key, driver_number, 4
+                """, (session_key,))
+            
+            self.conn.commit()
+            logger.info(f"Built car_data rollups for session {session_key} in {time.time() - start_time:.2f} seconds")
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Failed to build car_data rollups for session {session_key}: {e}")
+            return
+        finally:
+            cursor.close()
+        
+        self.notify_data_changed([{'session_key': session_key}])
+    
+    # ==================== CACHE INVALIDATION ====================
+    
+    def notify_data_changed(self, data: List[Dict], table: Optional[str] = None):
+        """
+        Invalidate cached API results touched by newly committed rows and
+        bump their data versions so clients revalidate
+        
+        Session-level rows carry no year, so the affected meetings and
+        seasons are resolved from the sessions table.
+        
+        Args:
+            data: Records that were just committed
+            table: Table they went into; bundle tables mark their seasons' bundles stale
+        """
+        session_keys = {row['session_key'] for row in data if row.get('session_key') is not None}
+        meeting_keys = {row['meeting_key'] for row in data if row.get('meeting_key') is not None}
+        years = {row['year'] for row in data if row.get('year') is not None}
+        
+        if session_keys:
+            cursor = self.conn.cursor()
+            try:
+                cursor.execute(
+                    "SELECT DISTINCT meeting_key, year FROM sessions WHERE session_key = ANY(%s)",
+                    (list(session_keys),)
+                )
+                for meeting_key, year in cursor.fetchall():
+                    meeting_keys.add(meeting_key)
+                    years.add(year)
+            except Exception as e:
+                self.conn.rollback()
+                logger.warning(f"Could not resolve seasons for cache invalidation: {e}")
+            finally:
+                cursor.close()
+        
+        self.bump_data_versions(session_keys, meeting_keys, years)
+        invalidate(session_keys=session_keys, meeting_keys=meeting_keys, years=years)
+        if table in self.config.bundle_tables:
+            self.stale_bundles.update(years)
+    
+    def bump_data_versions(self, session_keys, meeting_keys, years):
+        """
+        Increment the data_version counters the API derives ETags from
+        
+        Args:
+            session_keys: Sessions whose data changed
+            meeting_keys: Meetings whose data changed
+            years: Seasons whose data changed
+        """
+        scopes = (
+            [('session', key) for key in session_keys]
+            + [('meeting', key) for key in meeting_keys]
+            + [('year', key) for key in years]
+        )
+        if not scopes:
+            return
+        
+        cursor = self.conn.cursor()
+        try:
+            query = """
+                INSERT INTO data_version (scope, scope_key)
+                VALUES (%s, %s)
+                ON CONFLICT (scope, scope_key) DO UPDATE SET
+                    version = data_version.version + 1,
+                    updated_at = NOW()
+            """
+            execute_batch(cursor, query, scopes)
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            logger.warning(f"Failed to bump data versions: {e}")
+        finally:
+            cursor.close()
+    
     # ==================== DATA INSERTION ====================
     
     def insert_meetings(self, data: List[Dict]):
@@ -135,6 +592,7 @@ class F1DataManager:
             execute_batch(cursor, query, data)
             self.conn.commit()
             logger.info(f"Inserted {len(data)} meetings")
+            self.notify_data_changed(data, 'meetings')
         except Exception as e:
             self.conn.rollback()
             logger.error(f"Failed to insert meetings: {e}")
@@ -162,6 +620,7 @@ class F1DataManager:
             execute_batch(cursor, query, data)
             self.conn.commit()
             logger.info(f"Inserted {len(data)} sessions")
+            self.notify_data_changed(data, 'sessions')
         except Exception as e:
             self.conn.rollback()
             logger.error(f"Failed to insert sessions: {e}")
@@ -192,9 +651,12 @@ class F1DataManager:
             execute_batch(cursor, query, data)
             self.conn.commit()
             logger.info(f"Inserted {len(data)} driver records")
+            self.notify_data_changed(data, 'drivers')
+            return True
         except Exception as e:
             self.conn.rollback()
             logger.error(f"Failed to insert drivers: {e}")
+            return False
         finally:
             cursor.close()
     
@@ -223,9 +685,12 @@ class F1DataManager:
             execute_batch(cursor, query, data)
             self.conn.commit()
             logger.info(f"Inserted {len(data)} laps")
+            self.notify_data_changed(data)
+            return True
         except Exception as e:
             self.conn.rollback()
             logger.error(f"Failed to insert laps: {e}")
+            return False
         finally:
             cursor.close()
     
@@ -252,9 +717,12 @@ class F1DataManager:
                 execute_batch(cursor, query, batch, page_size=1000)
                 self.conn.commit()
                 logger.info(f"Inserted car_data batch {i//batch_size + 1}/{(len(data)-1)//batch_size + 1}")
+            self.notify_data_changed(data, 'car_data')
+            return True
         except Exception as e:
             self.conn.rollback()
             logger.error(f"Failed to insert car_data: {e}")
+            return False
         finally:
             cursor.close()
     
@@ -274,6 +742,7 @@ class F1DataManager:
             execute_batch(cursor, query, data)
             self.conn.commit()
             logger.info(f"Inserted {len(data)} records into {table}")
+            self.notify_data_changed(data, table)
         except Exception as e:
             self.conn.rollback()
             logger.error(f"Failed to insert into {table}: {e}")
@@ -281,6 +750,124 @@ class F1DataManager:
         finally:
             cursor.close()
     
+    def insert_bulk(self, table: str, data: List[Dict]):
+        """
+        Insert a large telemetry batch with COPY FROM STDIN
+        
+        Tables listed in CacheConfig.copy_dedup_tables are copied into a
+        staging table and merged with ON CONFLICT DO NOTHING.
+        """
+        if not data:
+            return
+        
+        columns = self.config.copy_columns[table]
+        dedup = table in self.config.copy_dedup_tables
+        start_time = time.time()
+        try:
+            inserted = copy_rows(self.conn, table, columns, data, dedup=dedup)
+            self.conn.commit()
+            elapsed = time.time() - start_time
+            logger.info(
+                f"Copied {inserted} of {len(data)} records into {table} in {elapsed:.2f} seconds "
+                f"({len(data) / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+            self.notify_data_changed(data)
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Failed to copy into {table}: {e}")
+            raise
+    
+    def insert_stream(self, table: str, chunks: Iterable[List[Dict]], prepare=None) -> int:
+        """
+        COPY a chunked record stream into a table in a single transaction
+        
+        Records are pulled from the stream as COPY consumes them, so only one
+        chunk is in memory at a time. A failed download or parse rolls back
+        everything copied so far.
+        
+        Args:
+            table: Telemetry table listed in CacheConfig.copy_columns
+            chunks: Iterable of record lists, e.g. stream_from_api(...)
+            prepare: Optional in-place fix-up applied to each chunk
+            
+        Returns:
+            Number of records received from the stream, or None if the load failed
+        """
+        columns = self.config.copy_columns[table]
+        dedup = table in self.config.copy_dedup_tables
+        scopes = Counter()
+        received = 0
+        
+        def records():
+            nonlocal received
+            for chunk in chunks:
+                if prepare:
+                    prepare(chunk)
+                received += len(chunk)
+                scopes.update((row.get('session_key'), row.get('meeting_key')) for row in chunk)
+                yield from chunk
+        
+        start_time = time.time()
+        try:
+            inserted = copy_rows(self.conn, table, columns, records(), dedup=dedup)
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Failed to stream into {table}: {e}")
+            return None
+        
+        elapsed = time.time() - start_time
+        logger.info(
+            f"Streamed {inserted} of {received} records into {table} in {elapsed:.2f} seconds "
+            f"({received / elapsed if elapsed else 0:.0f} rows/s, peak RSS {peak_memory_mb():.0f} MB)"
+        )
+        sessions = Counter()
+        for (sk, _), rows in scopes.items():
+            sessions[sk] += rows
+        self.after_load(table, sessions)
+        self.notify_data_changed([{'session_key': sk, 'meeting_key': mk} for sk, mk in scopes])
+        return received
+    
+    def insert_telemetry(self, table: str, data: List[Dict]) -> bool:
+        """Route a telemetry batch to COPY above copy_threshold, row inserts below it"""
+        if len(data) >= self.config.copy_threshold and table in self.config.copy_columns:
+            self.insert_bulk(table, data)
+        elif table == 'car_data':
+            return self.insert_car_data(data)
+        else:
+            self.insert_generic(table, data)
+        return True
+    
+    def store(self, table: str, data: Optional[List[Dict]]) -> bool:
+        """
+        Insert a fetched batch through the table's insert path and record the
+        sessions it covers in load_manifest
+        
+        Returns:
+            False if the insert failed
+        """
+        if not data:
+            return True
+        
+        try:
+            if table in self.config.lazy_tables:
+                ok = self.insert_telemetry(table, data)
+            elif table == 'drivers':
+                ok = self.insert_drivers(data)
+            elif table == 'laps':
+                ok = self.insert_laps(data)
+            else:
+                if table == 'session_result':
+                    self.prepare_session_results(data)
+                self.insert_generic(table, data)
+                ok = True
+        except Exception:
+            return False
+        
+        if ok:
+            self.after_load(table, Counter(row['session_key'] for row in data if row.get('session_key') is not None))
+        return ok
+    
     # ==================== INITIAL SETUP ====================
     """
     Run initial database population
@@ -292,31 +879,25 @@ class F1DataManager:
         logger.info("Starting initial setup...")
         start_time = time.time()
         
-        logger.info("Loading meetings...")
-        meetings = self.fetch_from_api('meetings', {'year': year})
-        self.insert_meetings(meetings)
-        
-        logger.info("Loading sessions...")
-        sessions = self.fetch_from_api('sessions', {'year': year})
-        self.insert_sessions(sessions)
+        # sessions reference meetings, so both are fetched together but inserted in order
+        logger.info("Loading meetings and sessions...")
+        fetched = {endpoint: data for endpoint, _, data in self.fetch_many_from_api([
+            ('meetings', {'year': year}),
+            ('sessions', {'year': year}),
+        ])}
+        self.insert_meetings(fetched['meetings'])
+        self.insert_sessions(fetched['sessions'])
         
         recent_sessions = self.get_recent_sessions(self.config.recent_sessions_count)
         
-        for table in self.config.priority_tables:
-            if table in ['meetings', 'sessions']:
-                continue
-            
-            logger.info(f"Loading {table}...")
-            data = self.fetch_from_api(table, {'year': year})
-            
-            if table == 'drivers':
-                self.insert_drivers(data)
-            elif table == 'laps':
-                self.insert_laps(data)
-            else:
-                self.insert_generic(table, data)
-            
-            time.sleep(0.5)
+        tables = [table for table in self.config.priority_tables if table not in ['meetings', 'sessions']]
+        logger.info(f"Loading {', '.join(tables)}...")
+        
+        for table, _, data in self.fetch_many_from_api((table, {'year': year}) for table in tables):
+            self.store(table, data)
+        
+        self.refresh_standings([year])
+        self.rebuild_season_bundles()
         
         logger.info(f"Pre-loading telemetry for {len(recent_sessions)} recent sessions...")
         for session_key in recent_sessions:
@@ -324,6 +905,7 @@ class F1DataManager:
         
         elapsed = time.time() - start_time
         logger.info(f"Initial setup completed in {elapsed:.2f} seconds")
+        self.client.log_throughput()
     
     def get_recent_sessions(self, count: int) -> List[int]:
         """Get the N most recent session keys"""
@@ -340,49 +922,84 @@ class F1DataManager:
         finally:
             cursor.close()
     
-    def load_session_telemetry(self, session_key: int):
-        """Load all telemetry data for a specific session"""
+    @staticmethod
+    def prepare_intervals(data: List[Dict]):
+        """intervals gaps are stored as text-compatible values"""
+        for record in data:
+            if record.get('gap_to_leader') is not None:
+                record['gap_to_leader'] = str(record['gap_to_leader'])
+            if record.get('interval') is not None:
+                record['interval'] = str(record['interval'])
+    
+    @staticmethod
+    def prepare_session_results(data: List[Dict]):
+        """
+        session_result gaps are stored as text and durations as arrays; OpenF1
+        sends a single number outside qualifying
+        """
+        for record in data:
+            if record.get('gap_to_leader') is not None:
+                record['gap_to_leader'] = str(record['gap_to_leader'])
+            if isinstance(record.get('duration'), (int, float)):
+                record['duration'] = [record['duration']]
+    
+    def load_session_telemetry(self, session_key: int, stream: Optional[bool] = None):
+        """
+        Load all telemetry data for a specific session
+        
+        Args:
+            session_key: Session to load
+            stream: Parse each response incrementally into COPY so memory stays
+                flat (default: CacheConfig.stream_telemetry); otherwise download
+                the tables concurrently and insert whole responses
+        """
         logger.info(f"Loading telemetry for session {session_key}...")
+        if stream is None:
+            stream = self.config.stream_telemetry
+        
+        tables = ['car_data', 'location', 'intervals', 'position']
+        if stream:
+            for table in tables:
+                self.stream_session_table(table, session_key)
+        else:
+            for table, _, data in self.fetch_many_from_api((table, {'session_key': session_key}) for table in tables):
+                if not data:
+                    continue
+                
+                if table == 'intervals':
+                    self.prepare_intervals(data)
+                
+                self.begin_load(table, session_key)
+                self.store(table, data)
+        
+        logger.info(f"Telemetry loaded for session {session_key} (peak RSS {peak_memory_mb():.0f} MB)")
+        
+    def stream_session_table(self, table: str, session_key: int) -> Optional[int]:
+        """
+        Stream one telemetry table for a session into the database
         
-        # Load car_data
-        car_data = self.fetch_from_api('car_data', {'session_key': session_key})
-        if car_data:
-            self.insert_car_data(car_data)
-        
-        # Load location
-        location_data = self.fetch_from_api('location', {'session_key': session_key})
-        if location_data:
-            self.insert_generic('location', location_data)
-        
-        # Load intervals
-        intervals_data = self.fetch_from_api('intervals', {'session_key': session_key})
-        if intervals_data:
-            for record in intervals_data:
-                if record.get('gap_to_leader') is not None:
-                    record['gap_to_leader'] = str(record['gap_to_leader'])
-                if record.get('interval') is not None:
-                    record['interval'] = str(record['interval'])
-            self.insert_generic('intervals', intervals_data)
-        
-        # Load position
-        position_data = self.fetch_from_api('position', {'session_key': session_key})
-        if position_data:
-            self.insert_generic('position', position_data)
-        
-        logger.info(f"Telemetry loaded for session {session_key}")
+        The session stays 'loading' in load_manifest if the stream dies part way.
         
+        Returns:
+            Records loaded, or None if the load failed
+        """
+        self.begin_load(table, session_key)
+        prepare = self.prepare_intervals if table == 'intervals' else None
+        received = self.insert_stream(table, self.stream_from_api(table, {'session_key': session_key}), prepare)
+        if received == 0:
+            self.abandon_load(table, session_key)
+        return received
+    
     # loading driver info
     def load_driver_info_by_year(self, year: int = 2025):
-        cursor = self.conn.cursor()
-        try:
-            sessions = self.fetch_from_api('sessions', {'year': year})
-            for session in sessions:
-                session_key = session['session_key']
-
-                data = self.fetch_from_api('drivers', {'session_key': session_key})                
-                self.insert_drivers(data)
-        finally:
-            cursor.close()
+        sessions = self.fetch_from_api('sessions', {'year': year})
+        requests_ = (('drivers', {'session_key': session['session_key']}) for session in sessions)
+        
+        for _, _, data in self.fetch_many_from_api(requests_):
+            self.store('drivers', data)
+        
+        self.rebuild_season_bundles()
+        self.client.log_throughput()
 
     def load_missing_session_results(self):
         """Load session results only for sessions that don't have data yet"""
@@ -409,35 +1026,23 @@ class F1DataManager:
             
             total_inserted = 0
             failed_sessions = []
+            loaded_sessions = []
             
-            for session_key in missing_sessions:
+            requests_ = (('session_result', {'session_key': session_key}) for session_key in missing_sessions)
+            for _, params, datas in self.fetch_many_from_api(requests_):
+                session_key = params['session_key']
                 try:
-                    # Fetch data for this session
-                    datas = self.fetch_from_api('session_result', {'session_key': session_key})
-                    
                     if not datas:
                         logger.warning(f"No data available from API for session {session_key}")
                         continue
                     
-                    # Process each record
-                    processed_data = []
-                    for data in datas:
-                        processed = data.copy()
-                        
-                        # Handle gap_to_leader
-                        if processed.get('gap_to_leader') is not None:
-                            processed['gap_to_leader'] = str(processed['gap_to_leader'])
-                        
-                        # Handle duration
-                        if isinstance(processed.get('duration'), float):
-                            processed['duration'] = [processed['duration']]
-                        
-                        processed_data.append(processed)
-                    
                     # Insert all records for this session
-                    self.insert_generic('session_result', processed_data)
-                    total_inserted += len(processed_data)
-                    logger.info(f"Loaded {len(processed_data)} results for session {session_key}")
+                    if not self.store('session_result', datas):
+                        failed_sessions.append(session_key)
+                        continue
+                    total_inserted += len(datas)
+                    loaded_sessions.append(session_key)
+                    logger.info(f"Loaded {len(datas)} results for session {session_key}")
                     
                 except Exception as e:
                     logger.error(f"Failed to load session {session_key}: {e}")
@@ -446,12 +1051,447 @@ class F1DataManager:
             
             logger.info(f"Missing session results loaded. Total: {total_inserted}")
             
+            # Only the seasons that gained results are recomputed
+            if loaded_sessions:
+                self.refresh_standings(self.seasons_for_sessions(loaded_sessions))
+                self.rebuild_season_bundles()
+            
             if failed_sessions:
                 logger.warning(f"Failed to load: {failed_sessions}")
             
+            self.client.log_throughput()
+            
+        finally:
+            cursor.close()
+            
+    
+    # ==================== INCREMENTAL SYNC ====================
+    
+    def get_watermarks(self, year: int) -> Dict[str, Optional[str]]:
+        """Watermarks recorded by earlier syncs of a season, keyed by table"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("SELECT table_name, watermark FROM sync_state WHERE year = %s", (year,))
+            return dict(cursor.fetchall())
+        finally:
+            cursor.close()
+    
+    def save_watermark(self, table: str, year: int, column: str, watermark, records: int):
+        """Advance a table's watermark; a None watermark keeps the stored one"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("""
+                INSERT INTO sync_state (table_name, year, watermark_column, watermark, records_synced)
+                VALUES (%s, %s, %s, %s, %s)
+                ON CONFLICT (table_name, year) DO UPDATE SET
+                    watermark_column = EXCLUDED.watermark_column,
+                    watermark = COALESCE(EXCLUDED.watermark, sync_state.watermark),
+                    records_synced = sync_state.records_synced + EXCLUDED.records_synced,
+                    synced_at = NOW()
+            """, (table, year, column, None if watermark is None else str(watermark), records))
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Failed to save {table} watermark: {e}")
+        finally:
+            cursor.close()
+    
+    def _max_value(self, query: str, params: Tuple):
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(query, params)
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+    
+    def completed_sessions(self, year: int) -> List[Tuple[int, bool]]:
+        """(session_key, settled) of a season's finished sessions in key order; settled once past sync_grace"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT session_key, date_end < NOW() - %s
+                FROM sessions
+                WHERE year = %s AND date_end < NOW()
+                ORDER BY session_key
+            """, (self.config.sync_grace, year))
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+    
+    def sync(self, year: int = 2025) -> Dict:
+        """
+        Incrementally sync a season, requesting only data newer than the
+        watermarks stored in sync_state
+        
+        meetings and sessions track the latest date_start loaded. The
+        session-level tables (drivers, laps, session_result, ...) track a
+        session_key, since OpenF1 assigns session keys in chronological
+        order. Their watermark only moves across an unbroken run of completed
+        sessions that returned rows, so a session still in progress or one
+        OpenF1 publishes late is fetched again on the next sync. A session
+        that still has no rows sync_grace after it ended (pit stops in
+        practice, say) is taken to have none. The first sync of a season has
+        no watermarks and loads it in full, like initial_setup. Failed
+        requests leave their watermark untouched.
+        
+        Args:
+            year: Season to sync
+            
+        Returns:
+            Report dict with per-table record counts and watermarks, plus the
+            tables that failed
+        """
+        logger.info(f"Syncing {year}...")
+        start_time = time.time()
+        watermarks = self.get_watermarks(year)
+        report = {'year': year, 'tables': {}, 'failed': []}
+        
+        def newer(table: str) -> Dict:
+            # OpenF1 takes comparison filters in the query string, e.g. date_start>=...;
+            # with >= the boundary rows are fetched again and dropped by ON CONFLICT
+            params = {'year': year}
+            column = self.config.sync_watermarks.get(table, 'session_key')
+            if watermarks.get(table) is not None:
+                params[f"{column}>="] = watermarks[table]
+            return params
+        
+        fetched = {endpoint: data for endpoint, _, data in self.fetch_many_from_api([
+            ('meetings', newer('meetings')),
+            ('sessions', newer('sessions')),
+        ])}
+        for table, insert in (('meetings', self.insert_meetings), ('sessions', self.insert_sessions)):
+            data = fetched[table]
+            if data is None:
+                report['failed'].append(table)
+                continue
+            
+            insert(data)
+            column = self.config.sync_watermarks[table]
+            # Read back from the table so rows that failed to insert never advance it
+            latest = self._max_value(f"SELECT MAX({column}) FROM {table} WHERE year = %s", (year,))
+            watermark = latest.isoformat() if latest is not None else None
+            self.save_watermark(table, year, column, watermark, len(data))
+            report['tables'][table] = {'records': len(data), 'watermark': watermark or watermarks.get(table)}
+        
+        completed = self.completed_sessions(year)
+        last_completed = completed[-1][0] if completed else None
+        tables = [
+            table for table in self.config.priority_tables
+            if table not in ['meetings', 'sessions']
+            and last_completed is not None
+            and (watermarks.get(table) is None or int(watermarks[table]) < last_completed)
+        ]
+        
+        for table, _, data in self.fetch_many_from_api((table, newer(table)) for table in tables):
+            if data is None:
+                report['failed'].append(table)
+                continue
+            
+            if not self.store(table, data):
+                report['failed'].append(table)
+                continue
+            
+            # Stop at the first completed session with no rows yet, unless it has been over for sync_grace
+            received = {row.get('session_key') for row in data}
+            stored = int(watermarks[table]) if watermarks.get(table) is not None else None
+            watermark = None
+            for session_key, settled in completed:
+                if stored is not None and session_key <= stored:
+                    continue
+                if session_key not in received and not settled:
+                    break
+                watermark = session_key
+            self.save_watermark(table, year, 'session_key', watermark, len(data))
+            report['tables'][table] = {'records': len(data), 'watermark': watermark or watermarks.get(table)}
+        
+        if report['tables'].get('session_result', {}).get('records'):
+            self.refresh_standings([year])
+        self.rebuild_season_bundles()
+        
+        elapsed = time.time() - start_time
+        synced = sum(entry['records'] for entry in report['tables'].values())
+        logger.info(
+            f"Synced {synced} records for {year} across {len(report['tables'])} tables in {elapsed:.2f} seconds"
+            + (f"; failed: {', '.join(report['failed'])}" if report['failed'] else "")
+        )
+        self.client.log_throughput()
+        return report
+    
+    # ==================== STANDINGS ====================
+    
+    def seasons_for_sessions(self, session_keys: Iterable[int]) -> List[int]:
+        """Seasons the given sessions belong to"""
+        session_keys = list(session_keys)
+        if not session_keys:
+            return []
+        
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT DISTINCT year FROM sessions WHERE session_key = ANY(%s) ORDER BY year",
+                (session_keys,)
+            )
+            return [row[0] for row in cursor.fetchall()]
         finally:
             cursor.close()
+    
+    def refresh_standings(self, years: Optional[Iterable[int]] = None):
+        """
+        Recompute driver_standings and team_standings for the given seasons
+        
+        Each season is rebuilt from session_result in one transaction, so
+        readers see either the old table or the new one. Only seasons whose
+        results changed need refreshing; without years every season with
+        sessions is rebuilt (e.g. after creating the tables).
+        
+        Args:
+            years: Seasons to rebuild
+        """
+        cursor = self.conn.cursor()
+        try:
+            if years is None:
+                cursor.execute("SELECT DISTINCT year FROM sessions ORDER BY year")
+                years = [row[0] for row in cursor.fetchall()]
+            years = sorted(set(years))
             
+            for year in years:
+                cursor.execute("DELETE FROM driver_standings WHERE year = %s", (year,))
+                cursor.execute("""
+                    WITH results AS (
+                        SELECT
+                            sr.driver_number,
+                            sr.position,
+                            COALESCE(sr.points, 0) AS points,
+                            sr.dnf,
+                            sr.dns,
+                            s.date_start,
+                            d.full_name,
+                            d.name_acronym,
+                            d.team_name,
+                            d.team_colour
+                        FROM session_result sr
+                        JOIN sessions s
+                            ON s.session_key = sr.session_key
+                        LEFT JOIN drivers d
+                            ON d.session_key = sr.session_key
+                            AND d.driver_number = sr.driver_number
+                        WHERE s.year = %(year)s AND s.session_type = 'Race'
+                    ),
+                    latest AS (
+                        SELECT DISTINCT ON (driver_number)
+                            driver_number, full_name, name_acronym, team_name, team_colour
+                        FROM results
+                        ORDER BY driver_number, (full_name IS NULL), date_start DESC
+                    ),
+                    totals AS (
+                        SELECT
+                            driver_number,
+                            SUM(points) AS points,
+                            COUNT(*) FILTER (WHERE position = 1) AS wins,
+                            COUNT(*) FILTER (WHERE position <= 3) AS podiums,
+                            COUNT(*) FILTER (WHERE dnf) AS dnfs,
+                            COUNT(*) FILTER (WHERE NOT COALESCE(dns, FALSE)) AS races
+                        FROM results
+                        GROUP BY driver_number
+                    )
+                    INSERT INTO driver_standings (
+                        year, driver_number, position, full_name, name_acronym,
+                        team_name, team_colour, points, wins, podiums, dnfs, races
+                    )
+                    SELECT
+                        %(year)s, t.driver_number,
+                        RANK() OVER (ORDER BY t.points DESC, t.wins DESC, t.podiums DESC),
+                        l.full_name, l.name_acronym, l.team_name, l.team_colour,
+                        t.points, t.wins, t.podiums, t.dnfs, t.races
+                    FROM totals t
+                    JOIN latest l USING (driver_number)
+                """, {'year': year})
+                drivers = cursor.rowcount
+                
+                cursor.execute("DELETE FROM team_standings WHERE year = %s", (year,))
+                cursor.execute("""
+                    WITH results AS (
+                        SELECT
+                            sr.session_key,
+                            sr.position,
+                            COALESCE(sr.points, 0) AS points,
+                            sr.dnf,
+                            s.date_start,
+                            d.team_name,
+                            d.team_colour
+                        FROM session_result sr
+                        JOIN sessions s
+                            ON s.session_key = sr.session_key
+                        JOIN drivers d
+                            ON d.session_key = sr.session_key
+                            AND d.driver_number = sr.driver_number
+                        WHERE s.year = %(year)s AND s.session_type = 'Race' AND d.team_name IS NOT NULL
+                    ),
+                    latest AS (
+                        SELECT DISTINCT ON (team_name) team_name, team_colour
+                        FROM results
+                        ORDER BY team_name, date_start DESC
+                    ),
+                    totals AS (
+                        SELECT
+                            team_name,
+                            SUM(points) AS points,
+                            COUNT(*) FILTER (WHERE position = 1) AS wins,
+                            COUNT(*) FILTER (WHERE position <= 3) AS podiums,
+                            COUNT(*) FILTER (WHERE dnf) AS dnfs,
+                            COUNT(DISTINCT session_key) AS races
+                        FROM results
+                        GROUP BY team_name
+                    )
+                    INSERT INTO team_standings (
+                        year, team_name, position, team_colour, points, wins, podiums, dnfs, races
+                    )
+                    SELECT
+                        %(year)s, t.team_name,
+                        RANK() OVER (ORDER BY t.points DESC, t.wins DESC, t.podiums DESC),
+                        l.team_colour, t.points, t.wins, t.podiums, t.dnfs, t.races
+                    FROM totals t
+                    JOIN latest l USING (team_name)
+                """, {'year': year})
+                
+                self.conn.commit()
+                logger.info(f"Refreshed {year} standings: {drivers} drivers, {cursor.rowcount} teams")
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Failed to refresh standings: {e}")
+            return
+        finally:
+            cursor.close()
+        
+        self.notify_data_changed([{'year': year} for year in years])
+    
+    # ==================== SEASON BUNDLES ====================
+    
+    def rebuild_season_bundles(self, years: Optional[Iterable[int]] = None) -> Dict[int, Dict]:
+        """
+        Rebuild and publish the pre-compressed /seasons/bundle documents
+        
+        The loaders call this once at the end of a run for the seasons whose
+        meetings, sessions, drivers or results changed; code calling store()
+        directly should do the same. A failed season stays stale and is
+        retried by the next rebuild.
+        
+        Args:
+            years: Seasons to rebuild (default: the stale ones)
+            
+        Returns:
+            Meta document of each published bundle, keyed by year
+        """
+        years = sorted(set(years) if years is not None else self.stale_bundles)
+        published = {}
+        for year in years:
+            try:
+                document = build_season_bundle(self.conn, year)
+                if document is None:
+                    logger.info(f"No meetings for {year}; no season bundle built")
+                    self.stale_bundles.discard(year)
+                    continue
+                meta = write_season_bundle(year, document)
+            except Exception as e:
+                logger.error(f"Failed to rebuild the {year} season bundle: {e}")
+                continue
+            
+            self.stale_bundles.discard(year)
+            published[year] = meta
+            sizes = ', '.join(f"{encoding} {size / 1024:.0f} KB" for encoding, size in meta['bytes'].items())
+            logger.info(f"Published the {year} season bundle {meta['etag']} ({sizes})")
+        return published
+    
+    # ==================== CIRCUIT INFO WARM-UP ====================
+    
+    def warm_circuit_info(self, year: int = 2025, refresh: bool = False, delay: float = 1.0) -> Dict:
+        """
+        Scrape formula1.com circuit facts for every meeting of a season into
+        circuit_info, so /meetings/get-meeting-info never scrapes on the request path
+        
+        Args:
+            year: Season to walk
+            refresh: Re-scrape meetings that already have circuit info
+            delay: Seconds to wait between scrapes
+            
+        Returns:
+            Report dict with the number of meetings seen, populated and skipped,
+            plus the meetings that failed and why
+        """
+        logger.info(f"Warming circuit info for {year}...")
+        start_time = time.time()
+        
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT m.meeting_key, m.country_name, ci.meeting_key IS NOT NULL
+                FROM meetings m
+                LEFT JOIN circuit_info ci ON ci.meeting_key = m.meeting_key
+                WHERE m.year = %s
+                ORDER BY m.date_start
+            """, (year,))
+            meetings = cursor.fetchall()
+        finally:
+            cursor.close()
+        
+        report = {'year': year, 'meetings': len(meetings), 'populated': 0, 'skipped': 0, 'failed': []}
+        rows = []
+        
+        for meeting_key, country_name, present in meetings:
+            if present and not refresh:
+                report['skipped'] += 1
+                continue
+            
+            if not country_name:
+                report['failed'].append({'meeting_key': meeting_key, 'country_name': country_name, 'error': 'missing country name'})
+                continue
+            
+            try:
+                info = scrap_circuit_info.uncached(str(year), country_name)
+            except Exception as e:
+                info = None
+                error = str(e)
+            else:
+                error = 'no circuit data on page'
+            
+            if isinstance(info, dict) and len(info) > 0:
+                rows.append({'meeting_key': meeting_key, 'year': year, 'country_name': country_name, 'info': Json(info)})
+            else:
+                report['failed'].append({'meeting_key': meeting_key, 'country_name': country_name, 'error': error})
+            
+            time.sleep(delay)
+        
+        if rows:
+            cursor = self.conn.cursor()
+            try:
+                query = """
+                    INSERT INTO circuit_info (meeting_key, year, country_name, info)
+                    VALUES (%(meeting_key)s, %(year)s, %(country_name)s, %(info)s)
+                    ON CONFLICT (meeting_key) DO UPDATE SET
+                        info = EXCLUDED.info,
+                        country_name = EXCLUDED.country_name,
+                        scraped_at = NOW()
+                """
+                execute_batch(cursor, query, rows)
+                self.conn.commit()
+                report['populated'] = len(rows)
+                self.notify_data_changed([{'meeting_key': row['meeting_key'], 'year': year} for row in rows])
+            except Exception as e:
+                self.conn.rollback()
+                logger.error(f"Failed to store circuit info: {e}")
+                report['failed'].extend({'meeting_key': row['meeting_key'], 'country_name': row['country_name'], 'error': str(e)} for row in rows)
+            finally:
+                cursor.close()
+        
+        elapsed = time.time() - start_time
+        logger.info(
+            f"Circuit info for {year}: {report['populated']} populated, {report['skipped']} skipped, "
+            f"{len(report['failed'])} failed of {report['meetings']} meetings in {elapsed:.2f} seconds"
+        )
+        for failure in report['failed']:
+            logger.warning(f"Circuit info failed for meeting {failure['meeting_key']} ({failure['country_name']}): {failure['error']}")
+        
+        return report
     
     # ==================== SMART DATA RETRIEVAL ====================
     """
@@ -461,56 +1501,107 @@ class F1DataManager:
         table: Table name
         session_key: Session key
         filters: Additional WHERE conditions
+        order_by: 'id' or 'date'
+        after: Cursor returned with the previous page
+        limit: Page size
         
     Returns:
-        List of data records
+        List of data records (one page; see query_page for the next cursor)
     """
-    def get_data(self, table: str, session_key: int, filters: Optional[Dict] = None) -> List[Dict]:
+    def get_data(self, table: str, session_key: int, filters: Optional[Dict] = None,
+                 order_by: str = 'id', after: Optional[str] = None, limit: int = 1000) -> List[Dict]:
         # Check if data is cached
         if not self.is_table_cached(table, session_key):
             logger.info(f"Cache miss for {table}, session {session_key}. Fetching from API...")
             
-            # Fetch from API
-            params = {'session_key': session_key}
-            if filters:
-                params.update(filters)
-            
-            data = self.fetch_from_api(table, params)
-            
-            # Store in database
-            if table == 'car_data':
-                self.insert_car_data(data)
-            elif table == 'drivers':
-                self.insert_drivers(data)
-            elif table == 'laps':
-                self.insert_laps(data)
+            # Load the whole session, not just the filtered slice, so the
+            # manifest entry is true for every later filter
+            if table in self.config.copy_columns and self.config.stream_telemetry:
+                self.stream_session_table(table, session_key)
             else:
-                self.insert_generic(table, data)
+                data = self.fetch_from_api(table, {'session_key': session_key})
+                
+                if data:
+                    if table == 'intervals':
+                        self.prepare_intervals(data)
+                    self.begin_load(table, session_key)
+                    self.store(table, data)
         
-        return self.query_table(table, session_key, filters)
+        return self.query_table(table, session_key, filters, order_by, after, limit)
     
-    def query_table(self, table: str, session_key: int, filters: Optional[Dict] = None) -> List[Dict]:
-        """Query data from database"""
-        cursor = self.conn.cursor()
-        try:
-            query = f"SELECT * FROM {table} WHERE session_key = %s"
-            params = [session_key]
-            
-            if filters:
-                for key, value in filters.items():
-                    query += f" AND {key} = %s"
-                    params.append(value)
-            
-            query += " ORDER BY id LIMIT 1000"
+    def iter_table(self, table: str, session_key: int, filters: Optional[Dict] = None,
+                   order_by: str = 'id', after: Optional[str] = None, limit: Optional[int] = None,
+                   chunk_size: int = 5000) -> Iterator[List[Dict]]:
+        """
+        Stream a session's rows in keyset order through a server-side named cursor
+        
+        Only chunk_size rows are held client-side at a time. The cursor lives
+        in the current transaction, so do not commit on this connection until
+        the iterator is exhausted or closed.
+        
+        Args:
+            table: Table name
+            session_key: Session key (prunes telemetry to one partition)
+            filters: Additional equality conditions
+            order_by: 'id' or 'date' (ties broken by id)
+            after: Cursor from encode_cursor/query_page; rows sorting after it are returned
+            limit: Maximum number of rows, or None for all remaining rows
+            chunk_size: Rows fetched per round trip
             
+        Yields:
+            Lists of at most chunk_size row dicts
+        """
+        after_clause, order = keyset(order_by)
+        query = f"SELECT * FROM {table} WHERE session_key = %s"
+        params = [session_key]
+        
+        if filters:
+            for key, value in filters.items():
+                query += f" AND {key} = %s"
+                params.append(value)
+        
+        if after is not None:
+            query += f" AND {after_clause}"
+            params.extend(decode_cursor(after, order_by))
+        
+        query += f" ORDER BY {order}"
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit)
+        
+        cursor = self.conn.cursor(name=f"{table}_{uuid.uuid4().hex}")
+        cursor.itersize = chunk_size
+        try:
             cursor.execute(query, params)
-            columns = [desc[0] for desc in cursor.description]
-            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            
-            logger.info(f"Retrieved {len(results)} records from {table}")
-            return results
+            columns = None
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                if columns is None:
+                    columns = [desc[0] for desc in cursor.description]
+                yield [dict(zip(columns, row)) for row in rows]
         finally:
             cursor.close()
+    
+    def query_page(self, table: str, session_key: int, filters: Optional[Dict] = None,
+                   order_by: str = 'id', after: Optional[str] = None, limit: int = 1000) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Query one keyset page of data from database
+        
+        Returns:
+            (records, cursor for the next page or None after the last page)
+        """
+        results = [row for chunk in self.iter_table(table, session_key, filters, order_by, after, limit, min(limit, 5000)) for row in chunk]
+        next_cursor = encode_cursor(results[-1], order_by) if len(results) == limit else None
+        
+        logger.info(f"Retrieved {len(results)} records from {table}")
+        return results, next_cursor
+    
+    def query_table(self, table: str, session_key: int, filters: Optional[Dict] = None,
+                    order_by: str = 'id', after: Optional[str] = None, limit: int = 1000) -> List[Dict]:
+        """Query one page of data from database; the session_key filter prunes telemetry to one partition"""
+        return self.query_page(table, session_key, filters, order_by, after, limit)[0]
             
 # if __name__ == "__main__":
 #     db_config = {
@@ -522,8 +1613,10 @@ class F1DataManager:
     
 #     with F1DataManager(db_config) as manager:
 #         # manager.initial_setup(year=2023)
+#         # manager.sync(year=2025)  # nightly / post-session: only fetches what is new
 #         # manager.load_driver_info_by_year(2022)
 #         manager.load_missing_session_results()
+#         # manager.warm_circuit_info(2024)
         
 #         # # Example: Get lap data (will use cache if available)
 #         # laps = manager.get_data('laps', session_key=9161, filters={'driver_number': 1})
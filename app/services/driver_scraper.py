@@ -1,12 +1,17 @@
 import requests
 from bs4 import BeautifulSoup
+from app.config import Config
+from app.services.scrape_cache import cached_scrape
+from app.utils.timing import timed
 
+@cached_scrape('driver_stats', lambda first, last: f"{first.lower().strip()}-{last.lower().strip()}")
+@timed('scrape')
 def scrap_driver_stats(driver_first: str, driver_last: str):
     driver_first = driver_first.lower().strip()
     driver_last = driver_last.lower().strip()
         
     url = f"https://www.formula1.com/en/drivers/{driver_first}-{driver_last}"
-    response = requests.get(url)
+    response = requests.get(url, timeout=Config.SCRAPE_TIMEOUT)
     soup = BeautifulSoup(response.content, "html.parser")
     infos = soup.find_all("div", {"class", "DataGrid-module_item__cs9Zd"})
     
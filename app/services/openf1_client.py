@@ -0,0 +1,353 @@
+import json
+import time
+import codecs
+import random
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote, urlencode
+import requests
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+COMPARISONS = ('>=', '<=', '>', '<')
+_WHITESPACE = ' \t\r\n'
+_NUMBER_CHARS = set('0123456789.eE+-')
+
+
+def query_string(params: Optional[Dict]) -> Optional[str]:
+    """
+    Encode OpenF1 query parameters
+
+    Keys ending in a comparison operator are written without a separating
+    '=', the way OpenF1 filters are spelled: {'date_start>=': v} is sent as
+    date_start>=v, not date_start>==v.
+    """
+    if not params:
+        return None
+    parts = []
+    for key, value in params.items():
+        if key.endswith(COMPARISONS):
+            parts.append(quote(key, safe='=') + quote(str(value), safe=''))
+        else:
+            parts.append(urlencode({key: value}))
+    return '&'.join(parts)
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Incrementally parse a top-level JSON array from a stream of byte chunks
+
+    Elements are decoded one at a time with the C scanner as soon as they are
+    complete, so memory is bounded by one element plus one chunk.
+
+    Raises:
+        ValueError if the stream is not a well-formed JSON array
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    buffer = ''
+    pos = 0
+    exhausted = False
+
+    def refill() -> bool:
+        nonlocal buffer, pos, exhausted
+        if exhausted:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            text = utf8.decode(b'', final=True)
+        else:
+            text = utf8.decode(chunk)
+        buffer = buffer[pos:] + text
+        pos = 0
+        return True
+
+    def peek() -> Optional[str]:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not refill():
+                return None
+
+    if peek() != '[':
+        raise ValueError("Expected a JSON array")
+    pos += 1
+
+    first = True
+    while True:
+        char = peek()
+        if char == ']':
+            return
+        if char is None:
+            raise ValueError("Unterminated JSON array")
+        if not first:
+            if char != ',':
+                raise ValueError(f"Expected ',' in JSON array, got {char!r}")
+            pos += 1
+            peek()
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if refill():
+                    continue
+                raise ValueError("Truncated JSON array element")
+            # A number ending at the buffer edge may continue in the next chunk, even
+            # after a '.' or 'e' the scanner stopped short of ('3.' then '5')
+            if _NUMBER_CHARS.issuperset(buffer[end:]) and refill():
+                continue
+            break
+
+        pos = end
+        first = False
+        yield value
+
+
+
+@dataclass
+class FetchConfig:
+    """Limits for talking to the OpenF1 API"""
+    requests_per_second: float = 3.0
+    burst: int = 3
+    max_concurrency: int = 4
+    max_retries: int = 5
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    timeout: float = 30.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is available"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_for = (1 - self._tokens) / self.rate
+            time.sleep(wait_for)
+
+
+class OpenF1Client:
+    """
+    Rate-limited, retrying HTTP client for OpenF1 with a bounded worker pool.
+
+    fetch() is a single blocking call; fetch_many() downloads a batch of
+    requests concurrently and yields each response as soon as it lands, so the
+    caller can insert one while the next ones are still downloading.
+    """
+
+    def __init__(self, config: Optional[FetchConfig] = None):
+        self.config = config or FetchConfig()
+        self.bucket = TokenBucket(self.config.requests_per_second, self.config.burst)
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats = defaultdict(lambda: {'requests': 0, 'records': 0, 'bytes': 0, 'retries': 0, 'errors': 0, 'seconds': 0.0})
+        self._spans = {}
+
+    def _session(self) -> requests.Session:
+        # requests.Session is not thread-safe; keep one per worker thread
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def _record(self, endpoint: str, started: Optional[float] = None, **counters):
+        with self._stats_lock:
+            stats = self._stats[endpoint]
+            for key, value in counters.items():
+                stats[key] += value
+            if started is not None:
+                first, _ = self._spans.get(endpoint, (started, started))
+                self._spans[endpoint] = (min(first, started), time.perf_counter())
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response]) -> float:
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        # Full jitter: spreads retries from concurrent workers apart
+        return random.uniform(0, min(self.config.backoff_max, self.config.backoff_base * 2 ** attempt))
+
+    def _request(self, url: str, endpoint: str, params: Optional[Dict] = None, stream: bool = False):
+        """
+        GET with rate limiting and retries on 429/5xx and connection errors
+
+        Returns:
+            (response, started) for a successful response
+
+        Raises:
+            requests.exceptions.RequestException once retries are exhausted
+        """
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            start = time.perf_counter()
+            response = None
+            try:
+                response = self._session().get(url, params=query_string(params), timeout=self.config.timeout, stream=stream)
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response, start
+                error = requests.exceptions.HTTPError(f"{response.status_code} for {response.url}", response=response)
+                response.close()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+            except requests.exceptions.RequestException:
+                self._record(endpoint, requests=1, errors=1, seconds=time.perf_counter() - start)
+                raise
+
+            self._record(endpoint, requests=1, seconds=time.perf_counter() - start)
+            if attempt >= self.config.max_retries:
+                self._record(endpoint, errors=1)
+                raise error
+
+            delay = self._backoff(attempt, response)
+            attempt += 1
+            self._record(endpoint, retries=1)
+            logger.warning(f"Retrying {endpoint} {params or ''} in {delay:.2f}s (attempt {attempt}): {error}")
+            time.sleep(delay)
+
+    def fetch(self, url: str, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
+        """
+        GET one OpenF1 resource, retrying 429/5xx and connection errors
+
+        Args:
+            url: Full request URL
+            endpoint: Endpoint name used for throughput stats
+            params: Query parameters
+
+        Returns:
+            List of data dictionaries
+
+        Raises:
+            requests.exceptions.RequestException once retries are exhausted
+        """
+        response, start = self._request(url, endpoint, params)
+        data = response.json()
+        self._record(endpoint, started=start, requests=1, records=len(data),
+                     bytes=len(response.content), seconds=time.perf_counter() - start)
+        return data
+
+    def stream(self, url: str, endpoint: str, params: Optional[Dict] = None, chunk_size: int = 5000) -> Iterator[List[Dict]]:
+        """
+        GET one OpenF1 resource and parse the JSON array incrementally
+
+        Only one chunk of records and one network buffer are alive at a time,
+        however large the response is. Retries cover the request itself, not a
+        connection dropped mid-body.
+
+        Yields:
+            Lists of at most chunk_size records
+        """
+        response, start = self._request(url, endpoint, params, stream=True)
+        received = 0
+        records = 0
+
+        def body():
+            nonlocal received
+            for block in response.iter_content(chunk_size=1 << 16):
+                received += len(block)
+                yield block
+
+        try:
+            batch = []
+            for record in iter_json_array(body()):
+                batch.append(record)
+                if len(batch) >= chunk_size:
+                    records += len(batch)
+                    yield batch
+                    batch = []
+            if batch:
+                records += len(batch)
+                yield batch
+        finally:
+            response.close()
+            self._record(endpoint, started=start, requests=1, records=records,
+                         bytes=received, seconds=time.perf_counter() - start)
+
+    def fetch_many(self, jobs: Iterable[Tuple[str, str, Optional[Dict]]]) -> Iterator[Tuple[str, Optional[Dict], List[Dict]]]:
+        """
+        Fetch (url, endpoint, params) jobs concurrently
+
+        At most max_concurrency requests are in flight and completed responses
+        are handed back one at a time, so memory stays bounded by the window
+        rather than the batch. Failed jobs yield None instead of a list, so
+        callers can tell a failure from an empty result.
+
+        Yields:
+            Tuples of (endpoint, params, data) in completion order
+        """
+        jobs = iter(jobs)
+        window = self.config.max_concurrency
+
+        with ThreadPoolExecutor(max_workers=window, thread_name_prefix='openf1') as executor:
+            pending = {}
+
+            def submit_next() -> bool:
+                job = next(jobs, None)
+                if job is None:
+                    return False
+                url, endpoint, params = job
+                pending[executor.submit(self.fetch, url, endpoint, params)] = (endpoint, params)
+                return True
+
+            for _ in range(window):
+                if not submit_next():
+                    break
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    endpoint, params = pending.pop(future)
+                    submit_next()
+                    try:
+                        data = future.result()
+                    except requests.exceptions.RequestException as e:
+                        logger.error(f"API request failed for {endpoint} {params or ''}: {e}")
+                        data = None
+                    yield endpoint, params, data
+
+    def throughput(self) -> Dict[str, Dict]:
+        """Per-endpoint counters plus records/sec over the wall-clock span of its requests"""
+        with self._stats_lock:
+            report = {}
+            for endpoint, stats in self._stats.items():
+                first, last = self._spans.get(endpoint, (0.0, 0.0))
+                wall = last - first
+                report[endpoint] = {
+                    **stats,
+                    'wall_seconds': wall,
+                    'records_per_sec': stats['records'] / wall if wall else 0.0,
+                }
+            return report
+
+    def log_throughput(self):
+        for endpoint, stats in sorted(self.throughput().items()):
+            logger.info(
+                f"{endpoint}: {stats['requests']} requests, {stats['records']} records, "
+                f"{stats['bytes'] / 1e6:.1f} MB, {stats['retries']} retries, {stats['errors']} errors, "
+                f"{stats['records_per_sec']:.0f} records/s over {stats['wall_seconds']:.2f}s"
+            )
@@ -0,0 +1,238 @@
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+from typing import Any, Callable, Optional, Tuple
+from psycopg2.extras import Json
+from app.config import Config
+from app.utils.db_pool import get_pool
+from app.utils.timing import timed
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeCache:
+    """
+    Durable cache for formula1.com scrapes, stored in the scrape_cache table.
+
+    - fresh entries are returned straight from the table
+    - stale entries (past expires_at but within the stale window) are returned
+      immediately while a background thread re-scrapes them; if that refresh
+      fails the stale payload is kept and served for another error_ttl
+    - a miss is scraped inline once per process: concurrent requests for the
+      same key wait up to wait_timeout for that scrape instead of starting
+      their own
+    - failed scrapes of a miss are stored as errors for a short TTL so a
+      broken page is not hammered on every request
+    """
+
+    def __init__(self, ttl: int, stale_ttl: int, error_ttl: int, refresh_workers: int = 2,
+                 wait_timeout: float = 30.0):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.error_ttl = error_ttl
+        self.refresh_workers = refresh_workers
+        self.wait_timeout = wait_timeout
+
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._inflight = {}
+        self._executor = None
+        self._pid = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Threads do not survive fork, so every worker process gets its own pool
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ThreadPoolExecutor(max_workers=self.refresh_workers, thread_name_prefix='scrape-refresh')
+                self._refreshing = set()
+                self._inflight = {}
+                self._pid = os.getpid()
+            return self._executor
+
+    def read(self, key: str):
+        """Return (payload, is_error, expires_at) for a key, or None on a miss"""
+        try:
+            with timed('scrape_cache'), get_pool().connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT payload, is_error, expires_at FROM scrape_cache WHERE cache_key = %s",
+                        (key,)
+                    )
+                    return cursor.fetchone()
+        except Exception as e:
+            logger.warning(f"Scrape cache read failed for {key}: {e}")
+            return None
+
+    def write(self, key: str, payload: Any, is_error: bool = False):
+        ttl = self.error_ttl if is_error else self.ttl
+        try:
+            with get_pool().connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        INSERT INTO scrape_cache (cache_key, payload, is_error, fetched_at, expires_at)
+                        VALUES (%s, %s, %s, NOW(), NOW() + %s * INTERVAL '1 second')
+                        ON CONFLICT (cache_key) DO UPDATE SET
+                            payload = EXCLUDED.payload,
+                            is_error = EXCLUDED.is_error,
+                            fetched_at = EXCLUDED.fetched_at,
+                            expires_at = EXCLUDED.expires_at
+                    """, (key, Json(payload) if payload is not None else None, is_error, ttl))
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Scrape cache write failed for {key}: {e}")
+
+    def extend(self, key: str):
+        """Serve a key's stored payload for another error_ttl; error entries are left alone"""
+        try:
+            with get_pool().connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        UPDATE scrape_cache
+                        SET expires_at = NOW() + %s * INTERVAL '1 second'
+                        WHERE cache_key = %s AND NOT is_error
+                    """, (self.error_ttl, key))
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Scrape cache extend failed for {key}: {e}")
+
+    def scrape(self, key: str, scrape_fn: Callable, *args, keep_stale: bool = False) -> Optional[dict]:
+        """
+        Run the scraper and store its result
+
+        A failure is stored as a short-lived error entry, or with keep_stale
+        the payload already stored is kept and extended instead
+        """
+        try:
+            result = scrape_fn(*args)
+        except Exception as e:
+            logger.error(f"Scrape failed for {key}: {e}")
+            result = None
+
+        if not isinstance(result, dict) or len(result) == 0:
+            if keep_stale:
+                self.extend(key)
+            else:
+                self.write(key, None, is_error=True)
+            return None
+
+        self.write(key, result)
+        return result
+
+    def scrape_once(self, key: str, scrape_fn: Callable, *args) -> Optional[dict]:
+        """scrape(), joining the one already running for the key in this process"""
+        # Resets the per-process state after a fork
+        self._get_executor()
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = {'done': threading.Event(), 'result': None}
+
+        if not leader:
+            if not flight['done'].wait(self.wait_timeout):
+                logger.warning(f"Gave up waiting for the scrape of {key}")
+            return flight['result']
+
+        try:
+            flight['result'] = self.scrape(key, scrape_fn, *args)
+            return flight['result']
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight['done'].set()
+
+    def _refresh(self, key: str, scrape_fn: Callable, *args):
+        try:
+            self.scrape(key, scrape_fn, *args, keep_stale=True)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def refresh_in_background(self, key: str, scrape_fn: Callable, *args):
+        executor = self._get_executor()
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        executor.submit(self._refresh, key, scrape_fn, *args)
+
+    def lookup(self, key: str) -> Tuple[str, Optional[dict]]:
+        """
+        State of a key without scraping: ('fresh', payload), ('stale', payload)
+        within the stale window, ('error', None) for a recent failure, or
+        ('miss', None)
+        """
+        entry = self.read(key)
+        if entry is not None:
+            payload, is_error, expires_at = entry
+            now = datetime.now(timezone.utc)
+
+            if now < expires_at:
+                return ('error', None) if is_error else ('fresh', payload)
+
+            if not is_error and now < expires_at + timedelta(seconds=self.stale_ttl):
+                return 'stale', payload
+
+        return 'miss', None
+
+    def get(self, key: str, scrape_fn: Callable, *args) -> Optional[dict]:
+        """
+        Cached result for a key, scraping on a miss
+
+        Returns:
+            The scraped dict, or None when the scrape failed (now or within error_ttl)
+        """
+        state, payload = self.lookup(key)
+        if state == 'stale':
+            self.refresh_in_background(key, scrape_fn, *args)
+        if state != 'miss':
+            return payload
+
+        return self.scrape_once(key, scrape_fn, *args)
+
+
+scrape_cache = ScrapeCache(
+    ttl=Config.SCRAPE_CACHE_TTL,
+    stale_ttl=Config.SCRAPE_CACHE_STALE_TTL,
+    error_ttl=Config.SCRAPE_CACHE_ERROR_TTL,
+    refresh_workers=Config.SCRAPE_REFRESH_WORKERS,
+    wait_timeout=Config.SCRAPE_JOB_TIMEOUT,
+)
+
+
+def cached_scrape(namespace: str, make_key: Callable[..., str]):
+    """
+    Route a scraper through the shared ScrapeCache
+
+    Args:
+        namespace: Prefix separating the scrapers' keys
+        make_key: Builds the normalized key from the scraper's arguments
+
+    The undecorated scraper stays reachable as .uncached for batch jobs that
+    always want a live fetch. .key(*args) gives the cache key and
+    .lookup(*args) returns (hit, payload) without ever scraping inline, for
+    callers that hand misses to a background job.
+    """
+    def decorator(scrape_fn):
+        def cache_key(*args) -> str:
+            return f"{namespace}:{make_key(*args)}"
+
+        @wraps(scrape_fn)
+        def wrapper(*args):
+            return scrape_cache.get(cache_key(*args), scrape_fn, *args)
+
+        def lookup(*args) -> Tuple[bool, Optional[dict]]:
+            key = cache_key(*args)
+            state, payload = scrape_cache.lookup(key)
+            if state == 'stale':
+                scrape_cache.refresh_in_background(key, scrape_fn, *args)
+            return state != 'miss', payload
+
+        wrapper.uncached = scrape_fn
+        wrapper.key = cache_key
+        wrapper.lookup = lookup
+        return wrapper
+    return decorator
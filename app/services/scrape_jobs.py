@@ -0,0 +1,156 @@
+import os
+import time
+import base64
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from app.config import Config
+from app.services.scrape_cache import scrape_cache
+
+logger = logging.getLogger(__name__)
+
+
+def encode_job_id(created: int, key: str) -> str:
+    return base64.urlsafe_b64encode(f"{created}|{key}".encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_job_id(job_id: str):
+    """(created, key) of a job id; raises ValueError if it is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(job_id + '=' * (-len(job_id) % 4)).decode('utf-8')
+        created, key = raw.split('|', 1)
+        return int(created), key
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Malformed job id {job_id!r}") from e
+
+
+class ScrapeJobs:
+    """
+    Bounded in-process pool running scrapes for the async mode of the
+    scrape-backed routes
+
+    - at most max_pending jobs are queued or running per process; past that
+      submit() refuses new work
+    - a request for a key that is already outstanding joins the existing job
+    - jobs past their timeout are reported as timed out; one still queued
+      then is dropped without scraping. Python cannot stop a running thread,
+      so a running scrape is bounded by SCRAPE_TIMEOUT instead and its late
+      result still lands in the scrape cache
+
+    Results live in the shared scrape_cache table, not here: the job id
+    encodes the cache key and creation time, so any gunicorn worker can
+    answer a status request, not only the one running the job.
+    """
+
+    def __init__(self, workers: int = 4, max_pending: int = 32, timeout: float = 30.0):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._executor = None
+        self._pid = None
+        self._stats = {'submitted': 0, 'joined': 0, 'rejected': 0, 'completed': 0, 'dropped': 0}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Threads do not survive fork, so every worker process gets its own pool (caller holds the lock)
+        if self._executor is None or self._pid != os.getpid():
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='scrape-job')
+            self._jobs = {}
+            self._pid = os.getpid()
+        return self._executor
+
+    def submit(self, scraper: Callable, *args) -> Optional[Dict[str, Any]]:
+        """
+        Queue a scrape through a @cached_scrape scraper, or join the job
+        already outstanding for its key
+
+        Returns:
+            Snapshot of the job, or None when max_pending jobs are outstanding
+        """
+        key = scraper.key(*args)
+        with self._lock:
+            executor = self._get_executor()
+            job = self._jobs.get(key)
+            if job is not None:
+                self._stats['joined'] += 1
+                return dict(job)
+
+            if len(self._jobs) >= self.max_pending:
+                self._stats['rejected'] += 1
+                return None
+
+            created = int(time.time())
+            job = self._jobs[key] = {
+                'job_id': encode_job_id(created, key),
+                'key': key,
+                'status': 'queued',
+                'created': created,
+            }
+            self._stats['submitted'] += 1
+            executor.submit(self._run, key, scraper, *args)
+            return dict(job)
+
+    def _run(self, key: str, scraper: Callable, *args):
+        try:
+            with self._lock:
+                job = self._jobs[key]
+                if time.time() > job['created'] + self.timeout:
+                    self._stats['dropped'] += 1
+                    logger.warning(f"Scrape job for {key} timed out in the queue")
+                    return
+                job['status'] = 'running'
+
+            scrape_cache.scrape_once(key, scraper.uncached, *args)
+            with self._lock:
+                self._stats['completed'] += 1
+        except Exception as e:
+            logger.error(f"Scrape job for {key} failed: {e}")
+        finally:
+            with self._lock:
+                self._jobs.pop(key, None)
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Current state of a job: done (with its result), failed, queued,
+        running, timeout, or pending when another worker owns it
+
+        Raises:
+            ValueError if the job id is malformed
+        """
+        created, key = decode_job_id(job_id)
+        report = {'job_id': job_id, 'created': created}
+
+        state, payload = scrape_cache.lookup(key)
+        if state in ('fresh', 'stale'):
+            return {**report, 'status': 'done', 'result': payload}
+        if state == 'error':
+            return {**report, 'status': 'failed'}
+
+        with self._lock:
+            job = self._jobs.get(key) if self._pid == os.getpid() else None
+            local = job['status'] if job is not None and job['job_id'] == job_id else None
+
+        if time.time() > created + self.timeout:
+            return {**report, 'status': 'timeout'}
+        return {**report, 'status': local or 'pending'}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            outstanding = len(self._jobs) if self._pid == os.getpid() else 0
+            return {
+                'workers': self.workers,
+                'max_pending': self.max_pending,
+                'timeout': self.timeout,
+                'outstanding': outstanding,
+                **self._stats,
+            }
+
+
+scrape_jobs = ScrapeJobs(
+    workers=Config.SCRAPE_JOB_WORKERS,
+    max_pending=Config.SCRAPE_JOB_MAX_PENDING,
+    timeout=Config.SCRAPE_JOB_TIMEOUT,
+)
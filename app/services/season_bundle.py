@@ -0,0 +1,321 @@
+import os
+import gzip
+import json
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from app.config import Config
+from app.utils.serializer import dumps
+
+try:
+    import brotli
+except ImportError:
+    # Optional: without it bundles are built and served as gzip and identity only
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Content-Encoding -> file suffix, in the order the server prefers them
+ENCODINGS = {'br': '.br', 'gzip': '.gz', 'identity': ''}
+
+
+# ==================== BUILDING (loader side) ====================
+
+def _fetch(cursor, query: str, params) -> List[Dict[str, Any]]:
+    cursor.execute(query, params)
+    columns = [desc[0] for desc in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def build_season_bundle(conn, year: int) -> Optional[Dict[str, Any]]:
+    """
+    Everything the frontend needs to render a season, in one document
+
+    Meetings are nested with their sessions and each session with its
+    results, using the same columns as /meetings/, /meetings/sessions/,
+    /meetings/sessions/session_result/ and /drivers/.
+
+    Args:
+        conn: psycopg2 connection, e.g. F1DataManager.conn
+        year: Season to build
+
+    Returns:
+        The document, or None when the season has no meetings
+    """
+    cursor = conn.cursor()
+    try:
+        meetings = _fetch(cursor, """
+            SELECT DISTINCT ON (m.date_start)
+                m.meeting_key,
+                m.country_code,
+                m.country_name,
+                m.date_start,
+                m.location,
+                m.meeting_name,
+                m.circuit_short_name
+            FROM meetings m
+            WHERE m.year = %s
+            ORDER BY m.date_start;
+        """, (year,))
+        if not meetings:
+            return None
+
+        sessions = _fetch(cursor, """
+            SELECT DISTINCT ON (s.meeting_key, s.date_start)
+                s.meeting_key,
+                s.session_key,
+                s.circuit_short_name,
+                s.date_start,
+                s.date_end,
+                s.location,
+                s.session_name,
+                s.session_type
+            FROM sessions s
+            WHERE s.year = %s
+            ORDER BY s.meeting_key, s.date_start;
+        """, (year,))
+
+        results = _fetch(cursor, """
+            SELECT
+                sr.session_key,
+                sr.position,
+                sr.number_of_laps,
+                sr.gap_to_leader,
+                sr.duration,
+                sr.driver_number,
+                d.full_name,
+                d.team_name,
+                d.team_colour,
+                sr.dnf,
+                sr.dns,
+                sr.dsq,
+                sr.points,
+                d.headshot_url
+            FROM session_result sr
+            JOIN sessions s
+                ON s.session_key = sr.session_key
+            JOIN drivers d
+                ON d.driver_number = sr.driver_number
+                AND d.session_key = sr.session_key
+            WHERE s.year = %s
+            ORDER BY sr.session_key, sr.position, sr.driver_number;
+        """, (year,))
+
+        drivers = _fetch(cursor, """
+            SELECT DISTINCT ON (d.driver_number)
+                d.id,
+                d.driver_number,
+                d.first_name,
+                d.last_name,
+                d.full_name,
+                d.broadcast_name,
+                d.name_acronym,
+                d.team_name,
+                d.team_colour,
+                d.country_code,
+                d.headshot_url
+            FROM drivers d
+            JOIN sessions s
+                ON d.session_key = s.session_key
+            WHERE s.year = %s
+            ORDER BY d.driver_number;
+        """, (year,))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    results_by_session: Dict[int, List[Dict]] = {}
+    for row in results:
+        results_by_session.setdefault(row.pop('session_key'), []).append(row)
+
+    sessions_by_meeting: Dict[int, List[Dict]] = {}
+    for row in sessions:
+        row['results'] = results_by_session.get(row['session_key'], [])
+        sessions_by_meeting.setdefault(row.pop('meeting_key'), []).append(row)
+
+    for meeting in meetings:
+        meeting['sessions'] = sessions_by_meeting.get(meeting['meeting_key'], [])
+
+    return {
+        'year': year,
+        'generated_at': datetime.now(timezone.utc).replace(microsecond=0),
+        'meetings': meetings,
+        'drivers': drivers,
+    }
+
+
+def _meta_path(directory: str, year: int) -> str:
+    return os.path.join(directory, f'season_{year}.meta.json')
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp = f'{path}.tmp{os.getpid()}'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def write_season_bundle(year: int, document: Dict[str, Any], directory: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Serialize and pre-compress a bundle and publish it under directory
+
+    Bodies go to immutable files named after their content hash
+    (season_2024.<etag>.json, .json.gz, .json.br); season_2024.meta.json
+    is replaced last and points at them, so a reader never sees a mix of
+    two builds. The previous build's files are kept for readers still
+    holding the old pointer; older ones are removed. A season whose data
+    has not changed is left as it is.
+
+    Returns:
+        The meta document of the published bundle
+    """
+    directory = directory or Config.SEASON_BUNDLE_DIR
+    os.makedirs(directory, exist_ok=True)
+
+    previous = None
+    try:
+        with open(_meta_path(directory, year)) as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    # The ETag covers the data, not generated_at, so an unchanged season keeps
+    # its ETag (and every client cache) across rebuilds
+    etag = hashlib.sha1(dumps({**document, 'generated_at': None})).hexdigest()[:20]
+    if previous is not None and previous.get('etag') == etag and all(
+        os.path.exists(os.path.join(directory, name)) for name in previous['files'].values()
+    ):
+        return previous
+
+    body = dumps(document)
+    bodies = {'identity': body, 'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        # Built once, served many times: maximum quality is worth it
+        bodies['br'] = brotli.compress(body, quality=11)
+
+    files = {}
+    for encoding, data in bodies.items():
+        name = f'season_{year}.{etag}.json{ENCODINGS[encoding]}'
+        _write_atomic(os.path.join(directory, name), data)
+        files[encoding] = name
+
+    meta = {
+        'year': year,
+        'etag': etag,
+        'generated_at': document['generated_at'].isoformat(),
+        'files': files,
+        'bytes': {encoding: len(data) for encoding, data in bodies.items()},
+    }
+    _write_atomic(_meta_path(directory, year), json.dumps(meta, indent=2).encode('utf-8'))
+
+    keep = {etag, previous and previous.get('etag')}
+    prefix = f'season_{year}.'
+    for name in os.listdir(directory):
+        if not name.startswith(prefix) or name.endswith('.meta.json') or '.tmp' in name:
+            continue
+        if name[len(prefix):].split('.', 1)[0] not in keep:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+
+    return meta
+
+
+# ==================== SERVING (API side) ====================
+
+@dataclass
+class SeasonBundle:
+    year: int
+    etag: str
+    generated_at: datetime
+    bodies: Dict[str, bytes]
+
+
+class SeasonBundleStore:
+    """
+    Serves the bundles the loader publishes, without touching the database
+
+    Each season's bodies are read into memory once and kept until the
+    loader replaces its meta file; a request costs one stat() of that file.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._bundles: Dict[int, tuple] = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'loads': 0, 'misses': 0}
+
+    def get(self, year: int) -> Optional[SeasonBundle]:
+        path = _meta_path(self.directory, year)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._bundles.pop(year, None)
+                self._stats['misses'] += 1
+            return None
+
+        with self._lock:
+            entry = self._bundles.get(year)
+            if entry is not None and entry[0] == mtime:
+                self._stats['hits'] += 1
+                return entry[1]
+
+        # A build two generations back may be removed under us; the meta file is then newer
+        for _ in range(3):
+            try:
+                bundle = self._load(path)
+                break
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Could not read the {year} season bundle: {e}")
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    return None
+        else:
+            return None
+
+        with self._lock:
+            self._bundles[year] = (mtime, bundle)
+            self._stats['loads'] += 1
+        return bundle
+
+    def _load(self, path: str) -> SeasonBundle:
+        with open(path) as f:
+            meta = json.load(f)
+
+        bodies = {}
+        for encoding, name in meta['files'].items():
+            with open(os.path.join(self.directory, name), 'rb') as f:
+                bodies[encoding] = f.read()
+
+        return SeasonBundle(
+            year=meta['year'],
+            etag=meta['etag'],
+            generated_at=datetime.fromisoformat(meta['generated_at']),
+            bodies=bodies,
+        )
+
+    def clear(self):
+        with self._lock:
+            self._bundles.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'directory': self.directory,
+                'seasons': sorted(self._bundles),
+                'bytes': sum(len(body) for _, bundle in self._bundles.values() for body in bundle.bodies.values()),
+                **self._stats,
+            }
+
+
+season_bundles = SeasonBundleStore(Config.SEASON_BUNDLE_DIR)
+
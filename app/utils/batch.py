@@ -0,0 +1,62 @@
+from typing import Any, Dict, Iterable, List
+from flask import request
+from app.config import Config
+
+
+def parse_keys(arg: str) -> List[int]:
+    """
+    Integer keys from a batch query argument, as a comma-separated list
+    (?session_key=1,2,3), repeated arguments (?session_key=1&session_key=2)
+    or both. Duplicates are dropped, order is kept.
+
+    Raises:
+        ValueError if a key is not an integer, none are given or there are
+        more than BATCH_MAX_KEYS
+    """
+    keys = []
+    for value in request.args.getlist(arg):
+        for part in value.split(','):
+            part = part.strip()
+            if not part:
+                continue
+            try:
+                key = int(part)
+            except ValueError:
+                raise ValueError(f"{arg} must be a list of integers, got {part!r}")
+            if key not in keys:
+                keys.append(key)
+
+    if not keys:
+        raise ValueError(f"{arg} is required")
+    if len(keys) > Config.BATCH_MAX_KEYS:
+        raise ValueError(f"At most {Config.BATCH_MAX_KEYS} values of {arg} per request, got {len(keys)}")
+    return keys
+
+
+def keyed(rows: List[Dict[str, Any]], keys: Iterable[int], column: str, not_found: str,
+          many: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Group the rows of a set-based query by the input key they belong to
+
+    Every requested key gets an entry, so callers can tell a miss from a
+    dropped key: {'found': True, 'data': ...} or {'found': False, 'error': ...}.
+
+    Args:
+        rows: Rows carrying the key in column
+        keys: The requested keys, in request order
+        column: Column holding the key
+        not_found: Error for keys with no rows, formatted with {key}
+        many: Each key maps to a list of rows, otherwise to its first row
+    """
+    grouped: Dict[Any, List[Dict[str, Any]]] = {}
+    for row in rows:
+        grouped.setdefault(row[column], []).append(row)
+
+    result = {}
+    for key in keys:
+        found = grouped.get(key)
+        if not found:
+            result[str(key)] = {'found': False, 'error': not_found.format(key=key)}
+        else:
+            result[str(key)] = {'found': True, 'data': found if many else found[0]}
+    return result
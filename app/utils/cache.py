@@ -0,0 +1,220 @@
+import time
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from functools import wraps
+from typing import Any, Dict, Iterable, Optional, Tuple
+from flask import g, has_app_context
+from app.config import Config
+from app.utils.db_pool import get_pool
+
+logger = logging.getLogger(__name__)
+
+# Argument names that scope a cached result to a slice of the data
+TAG_ARGS = {
+    'year': 'year',
+    'meeting_key': 'meeting',
+    'session_key': 'session',
+}
+
+# Season of a meeting or session key, for results whose rows do not carry one
+KEY_YEAR_QUERIES = {
+    'meeting': "SELECT year FROM meetings WHERE meeting_key = %s",
+    'session': "SELECT year FROM sessions WHERE session_key = %s",
+}
+
+_key_years = {}
+_key_years_lock = threading.Lock()
+
+
+class ResponseCache:
+    """
+    Bounded, thread-safe LRU cache with per-entry TTL and tag-based invalidation.
+
+    Entries are tagged with the (scope, key) pairs they depend on, e.g.
+    ('year', 2024) or ('session', 9472), so the loader can drop exactly the
+    results affected by newly committed rows.
+    """
+
+    def __init__(self, max_entries: int = 1024, enabled: bool = True):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """Return (hit, value) for a key, dropping it if it has expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return False, None
+
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._stats['misses'] += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return True, value
+
+    def set(self, key: Tuple, value: Any, ttl: float, tags: Iterable[Tuple[str, Any]] = ()):
+        if not self.enabled or ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl, frozenset(tags))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def invalidate(self, session_keys: Iterable = (), meeting_keys: Iterable = (), years: Iterable = ()) -> int:
+        """
+        Drop every entry tagged with any of the given sessions, meetings or years
+
+        Returns:
+            Number of entries removed
+        """
+        targets = {('session', _normalize(k)) for k in session_keys}
+        targets |= {('meeting', _normalize(k)) for k in meeting_keys}
+        targets |= {('year', _normalize(k)) for k in years}
+        if not targets:
+            return 0
+
+        with self._lock:
+            stale = [key for key, (_, _, tags) in self._entries.items() if tags & targets]
+            for key in stale:
+                del self._entries[key]
+            self._stats['invalidations'] += len(stale)
+
+        if stale:
+            logger.info(f"Invalidated {len(stale)} cached results for {sorted(targets, key=str)}")
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'enabled': self.enabled, 'size': len(self._entries), 'max_entries': self.max_entries, **self._stats}
+
+
+response_cache = ResponseCache(max_entries=Config.CACHE_MAX_ENTRIES, enabled=Config.CACHE_ENABLED)
+
+
+def _normalize(value):
+    """Make '2024' and 2024 produce the same key"""
+    if isinstance(value, str):
+        value = value.strip()
+        if value.lstrip('-').isdigit():
+            return int(value)
+    return value
+
+
+def _rows_year(result) -> Optional[int]:
+    """Best-effort season of a result, from a year or date_start column"""
+    if not isinstance(result, list) or not result or not isinstance(result[0], dict):
+        return None
+
+    row = result[0]
+    if row.get('year') is not None:
+        return int(row['year'])
+    if isinstance(row.get('date_start'), (date, datetime)):
+        return row['date_start'].year
+    return None
+
+
+def _key_year(scope: str, key: int) -> Optional[int]:
+    """Season of a meeting or session key, memoized since a key never changes season"""
+    with _key_years_lock:
+        if (scope, key) in _key_years:
+            return _key_years[(scope, key)]
+
+    try:
+        with get_pool().connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(KEY_YEAR_QUERIES[scope], (key,))
+                row = cursor.fetchone()
+    except Exception as e:
+        logger.warning(f"Could not resolve the season of {scope} {key}: {e}")
+        return None
+    if row is None:
+        # Not loaded yet; ask again next time
+        return None
+
+    with _key_years_lock:
+        if len(_key_years) >= 4096:
+            _key_years.clear()
+        _key_years[(scope, key)] = row[0]
+    return row[0]
+
+
+def ttl_for_year(year: Optional[int]) -> float:
+    """Short TTL for the running season, long TTL for finished ones"""
+    if year is None:
+        return Config.CACHE_TTL_DEFAULT
+    if year >= date.today().year:
+        return Config.CACHE_TTL_CURRENT_SEASON
+    return Config.CACHE_TTL_PAST_SEASON
+
+
+def cached(func):
+    """
+    Cache a model method's (result, msg) return value.
+
+    The key is the method's qualified name plus its normalized arguments and,
+    inside a @conditional view, the data version its ETag was built from: the
+    loader only invalidates the cache of its own process, so a bumped version
+    has to miss here rather than pair the new ETag with an old result.
+    Failed queries (msg set) are never cached.
+    """
+    signature = inspect.signature(func)
+    endpoint = func.__qualname__
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not response_cache.enabled:
+            return func(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        call_args = {name: _normalize(value) for name, value in bound.arguments.items() if name != 'self'}
+        data_version = g.get('resource_data_version') if has_app_context() else None
+        key = (endpoint, tuple(sorted(call_args.items())), data_version)
+
+        hit, value = response_cache.get(key)
+        if hit:
+            return value
+
+        value = func(self, *args, **kwargs)
+        result, msg = value[0], value[1]
+        if msg is not None or result is None:
+            return value
+
+        tags = {(TAG_ARGS[name], arg) for name, arg in call_args.items() if name in TAG_ARGS and arg is not None}
+        year = call_args.get('year')
+        if not isinstance(year, int):
+            year = _rows_year(result)
+            if year is None:
+                # Session results, driver entries, ... only carry their key
+                year = next((_key_year(scope, key) for scope, key in sorted(tags)
+                             if scope in KEY_YEAR_QUERIES and isinstance(key, int)), None)
+            if year is not None:
+                tags.add(('year', year))
+
+        response_cache.set(key, value, ttl_for_year(year), tags)
+        return value
+
+    return wrapper
+
+
+def invalidate(session_keys: Iterable = (), meeting_keys: Iterable = (), years: Iterable = ()) -> int:
+    """Hook for the loader: drop cached results touched by newly committed rows"""
+    return response_cache.invalidate(session_keys=session_keys, meeting_keys=meeting_keys, years=years)
@@ -0,0 +1,57 @@
+import gzip
+from flask import request
+from app.config import Config
+from app.utils.timing import timed
+
+try:
+    import brotli
+except ImportError:
+    # Optional: without it responses are only gzip-compressed
+    brotli = None
+
+COMPRESSIBLE = {'application/json', 'application/x-ndjson', 'text/plain', 'text/html'}
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(data, quality=Config.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=Config.COMPRESSION_GZIP_LEVEL)
+
+
+def init_compression(app):
+    """
+    Compress buffered responses of COMPRESSION_MIN_BYTES or more with brotli
+    or gzip, whichever the client prefers in Accept-Encoding
+
+    Streamed responses and responses that already carry a Content-Encoding
+    (the pre-compressed season bundles) are left alone. Register after
+    init_timing so the 'compress' phase makes it into Server-Timing.
+    """
+    if not Config.COMPRESSION_ENABLED:
+        return
+
+    encodings = ['br', 'gzip'] if brotli is not None else ['gzip']
+
+    @app.after_request
+    def compress_response(response):
+        if (response.status_code != 200
+                or response.direct_passthrough
+                or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE):
+            return response
+
+        length = response.content_length
+        if length is None or length < Config.COMPRESSION_MIN_BYTES:
+            return response
+
+        # The body depends on Accept-Encoding from here on, whether or not this client gets it compressed
+        response.vary.add('Accept-Encoding')
+        encoding = request.accept_encodings.best_match(encodings)
+        if encoding is None:
+            return response
+
+        with timed('compress'):
+            response.set_data(compress(response.get_data(), encoding))
+        response.headers['Content-Encoding'] = encoding
+        return response
@@ -0,0 +1,91 @@
+import time
+import hashlib
+import threading
+from functools import wraps
+from flask import g, make_response, request
+from app.config import Config
+from app.models.DataVersionModel import DataVersionModel
+
+data_version_model = DataVersionModel()
+
+_versions = {}
+_versions_lock = threading.Lock()
+
+
+def get_data_version(scope: str, scope_key: int):
+    """
+    Current (version, updated_at) for a scope, memoized for DATA_VERSION_TTL seconds
+
+    Scopes the loader has never bumped report version 0 and no timestamp.
+    Returns None when the lookup fails, which disables conditional handling.
+    """
+    now = time.monotonic()
+    with _versions_lock:
+        entry = _versions.get((scope, scope_key))
+        if entry and entry[0] > now:
+            return entry[1]
+
+    rows, msg = data_version_model.get_version(scope, scope_key)
+    if msg is not None:
+        return None
+
+    value = (rows[0]['version'], rows[0]['updated_at']) if rows else (0, None)
+    with _versions_lock:
+        if len(_versions) >= 4096:
+            _versions.clear()
+        _versions[(scope, scope_key)] = (now + Config.DATA_VERSION_TTL, value)
+    return value
+
+
+def _make_etag(scope: str, scope_key: int, version: int) -> str:
+    args = '&'.join(f'{k}={v}' for k, v in sorted(request.args.items(multi=True)))
+    raw = f'{request.endpoint}?{args}|{scope}:{scope_key}:{version}'
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:20]
+
+
+def _not_modified(etag: str, last_modified) -> bool:
+    # If-None-Match wins over If-Modified-Since when both are sent
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified is not None:
+        return last_modified.replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+def conditional(scope: str, arg: str, type=int, default=None):
+    """
+    Answer 304 Not Modified from the data version alone, before the view runs.
+
+    Args:
+        scope: data_version scope the resource depends on ('year', 'meeting' or 'session')
+        arg: query argument holding the scope key
+        type: converter for the query argument
+        default: value the view itself falls back to when the argument is missing
+
+    The computed ETag and Last-Modified are left on flask.g for
+    create_response to attach to the 200 response, and the version for
+    @cached to key its entries on.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            scope_key = request.args.get(arg, default=default, type=type)
+            version = get_data_version(scope, scope_key) if scope_key is not None else None
+            if version is None:
+                return view(*args, **kwargs)
+
+            etag = _make_etag(scope, scope_key, version[0])
+            g.resource_etag = etag
+            g.resource_last_modified = version[1]
+            g.resource_data_version = (scope, scope_key, version[0])
+
+            if _not_modified(etag, version[1]):
+                response = make_response('', 304)
+                response.set_etag(etag, weak=True)
+                if version[1] is not None:
+                    response.last_modified = version[1]
+                return response
+
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,214 @@
+import os
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional, Dict, Any
+from psycopg2 import pool as pg_pool, OperationalError, InterfaceError
+from app.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class PoolExhaustedError(Exception):
+    """Raised when no connection becomes available before the checkout timeout"""
+
+
+class ConnectionPool:
+    """
+    Process-local, thread-safe pool of psycopg2 connections.
+
+    The underlying psycopg2 pool is created lazily on first checkout and is
+    re-created whenever the current pid differs from the pid that built it,
+    so a pool inherited through fork (e.g. gunicorn --preload) is never shared
+    between workers.
+    """
+
+    def __init__(self, dsn: str, min_size: int = 1, max_size: int = 10,
+                 timeout: float = 10.0, health_check: bool = True):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min={min_size}, max={max_size}")
+
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check = health_check
+
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pid = None
+        self._slots = None
+        self._stats_lock = threading.Lock()
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self._stats = {
+            'checkouts': 0,
+            'checkout_timeouts': 0,
+            'health_check_failures': 0,
+            'discarded': 0,
+            'in_use': 0,
+        }
+
+    def _bump(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _ensure_pool(self):
+        """Build the psycopg2 pool for this process if it does not exist yet"""
+        pid = os.getpid()
+        if self._pool is not None and self._pid == pid:
+            return
+
+        with self._lock:
+            if self._pool is not None and self._pid == pid:
+                return
+
+            if self._pool is not None:
+                # Inherited from the parent process: drop the references without
+                # closing, closing would tear down the parent's sockets.
+                logger.info(f"Discarding connection pool inherited from pid {self._pid}")
+
+            self._pool = pg_pool.ThreadedConnectionPool(self.min_size, self.max_size, self.dsn)
+            self._slots = threading.BoundedSemaphore(self.max_size)
+            self._pid = pid
+            self._reset_stats()
+            logger.info(f"Connection pool created (min={self.min_size}, max={self.max_size}, pid={pid})")
+
+    def _is_healthy(self, conn) -> bool:
+        if conn.closed:
+            return False
+        if not self.health_check:
+            return True
+
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except (OperationalError, InterfaceError):
+            return False
+
+    def _checkout(self):
+        self._ensure_pool()
+
+        if not self._slots.acquire(timeout=self.timeout):
+            self._bump('checkout_timeouts')
+            raise PoolExhaustedError(f"No database connection available after {self.timeout}s")
+
+        try:
+            # One retry per slot: a dead connection is replaced by a fresh one
+            for _ in range(self.max_size + 1):
+                conn = self._pool.getconn()
+                if self._is_healthy(conn):
+                    self._bump('checkouts')
+                    self._bump('in_use')
+                    return conn
+
+                self._bump('health_check_failures')
+                self._bump('discarded')
+                self._pool.putconn(conn, close=True)
+
+            raise OperationalError("Could not obtain a healthy database connection")
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _checkin(self, conn, discard: bool = False):
+        # A connection checked out before a fork belongs to the parent's pool
+        if self._pid != os.getpid():
+            return
+
+        try:
+            if not conn.closed and not discard:
+                conn.rollback()
+        except (OperationalError, InterfaceError):
+            discard = True
+
+        if discard or conn.closed:
+            self._bump('discarded')
+
+        self._pool.putconn(conn, close=discard or bool(conn.closed))
+        self._bump('in_use', -1)
+        self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection for the duration of a with-block
+
+        Yields:
+            A healthy psycopg2 connection; it is rolled back and returned to
+            the pool on exit, or discarded if it broke while in use
+        """
+        conn = self._checkout()
+        discard = False
+        try:
+            yield conn
+        except (OperationalError, InterfaceError):
+            discard = True
+            raise
+        finally:
+            self._checkin(conn, discard=discard)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of pool usage counters for this process"""
+        idle = len(self._pool._pool) if self._pool is not None and self._pid == os.getpid() else 0
+        return {
+            'pid': os.getpid(),
+            'min_size': self.min_size,
+            'max_size': self.max_size,
+            'idle': idle,
+            **self._stats,
+        }
+
+    def close(self):
+        """Close every connection owned by this process"""
+        with self._lock:
+            if self._pool is not None and self._pid == os.getpid():
+                self._pool.closeall()
+                logger.info("Connection pool closed")
+            self._pool = None
+            self._pid = None
+
+
+_pool: Optional[ConnectionPool] = None
+_init_lock = threading.Lock()
+
+
+def _build_pool(config) -> ConnectionPool:
+    return ConnectionPool(
+        config.DATABASE_URL,
+        min_size=config.DB_POOL_MIN_SIZE,
+        max_size=config.DB_POOL_MAX_SIZE,
+        timeout=config.DB_POOL_TIMEOUT,
+        health_check=config.DB_POOL_HEALTH_CHECK,
+    )
+
+
+def init_pool(config=Config) -> ConnectionPool:
+    """
+    Create the shared pool from a config object
+
+    Args:
+        config: Object exposing DATABASE_URL and the DB_POOL_* settings
+
+    Returns:
+        The shared ConnectionPool
+    """
+    global _pool
+    with _init_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = _build_pool(config)
+        return _pool
+
+
+def get_pool() -> ConnectionPool:
+    """Return the shared pool, creating it from Config if the app factory has not"""
+    global _pool
+    if _pool is None:
+        with _init_lock:
+            if _pool is None:
+                _pool = _build_pool(Config)
+    return _pool
@@ -0,0 +1,72 @@
+from typing import Dict, List, Sequence
+import numpy as np
+
+# API channel name -> car_data column
+CHANNELS = {
+    'speed': 'speed',
+    'throttle': 'throttle',
+    'brake': 'brake',
+    'gear': 'n_gear',
+    'rpm': 'rpm',
+}
+
+
+def pick_resolution(width_ms: float, resolutions: Sequence[int]) -> int:
+    """Coarsest precomputed rollup no wider than width_ms, or the finest one"""
+    fitting = [resolution for resolution in resolutions if resolution <= width_ms]
+    return max(fitting) if fitting else min(resolutions)
+
+
+def _to_json(values: np.ndarray, decimals: int = None) -> List:
+    if decimals is not None:
+        values = np.round(values, decimals)
+    return np.where(np.isnan(values), None, values).tolist()
+
+
+def to_trace(rows: List[Dict], width_ms: int) -> Dict:
+    """
+    Merge rollup buckets into width_ms-wide buckets and return them column-wise
+
+    Buckets are aligned to multiples of width_ms since the epoch. Minima and
+    maxima combine with fmin/fmax (NULLs ignored), means are weighted by each
+    bucket's sample count; all of it is vectorized with reduceat.
+
+    Args:
+        rows: car_data_rollup rows ordered by bucket_start
+        width_ms: Target bucket width, a multiple of the rows' resolution
+
+    Returns:
+        Dict with 'date' (epoch ms of each bucket start), 'samples' and a
+        {'min', 'max', 'mean'} dict of lists per channel
+    """
+    times = np.array([int(row['bucket_start'].timestamp() * 1000) for row in rows], dtype=np.int64)
+    samples = np.array([row['samples'] for row in rows], dtype=float)
+
+    buckets = times // width_ms
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    counts = np.add.reduceat(samples, starts)
+
+    trace = {
+        'date': (buckets[starts] * width_ms).tolist(),
+        'samples': counts.astype(int).tolist(),
+    }
+
+    for channel in CHANNELS:
+        mins = np.array([row[f'{channel}_min'] for row in rows], dtype=float)
+        maxs = np.array([row[f'{channel}_max'] for row in rows], dtype=float)
+        means = np.array([row[f'{channel}_mean'] for row in rows], dtype=float)
+
+        weights = np.where(np.isnan(means), 0.0, samples)
+        weighted = np.add.reduceat(np.nan_to_num(means) * weights, starts)
+        total = np.add.reduceat(weights, starts)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(total > 0, weighted / total, np.nan)
+
+        trace[channel] = {
+            'min': _to_json(np.fmin.reduceat(mins, starts)),
+            'max': _to_json(np.fmax.reduceat(maxs, starts)),
+            'mean': _to_json(mean, 1),
+        }
+
+    return trace
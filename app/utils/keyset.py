@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Dict, Tuple
+
+# Sort orders available for keyset pagination; id breaks ties between equal dates
+ORDERINGS = {
+    'id': ('id',),
+    'date': ('date', 'id'),
+}
+
+
+def keyset(order_by: str = 'id') -> Tuple[str, str]:
+    """
+    SQL fragments for keyset pagination
+
+    Returns:
+        (condition selecting rows after a cursor, ORDER BY column list)
+
+    Raises:
+        ValueError for an unknown ordering
+    """
+    if order_by not in ORDERINGS:
+        raise ValueError(f"Cannot page by {order_by!r}; use one of {', '.join(ORDERINGS)}")
+
+    columns = ', '.join(ORDERINGS[order_by])
+    placeholders = ', '.join(['%s'] * len(ORDERINGS[order_by]))
+    return f"({columns}) > ({placeholders})", columns
+
+
+def encode_cursor(row: Dict, order_by: str = 'id') -> str:
+    """Cursor pointing just past a row: '<id>' or '<iso date>,<id>'"""
+    values = [row[column] for column in ORDERINGS[order_by]]
+    return ','.join(value.isoformat() if isinstance(value, datetime) else str(value) for value in values)
+
+
+def decode_cursor(cursor: str, order_by: str = 'id') -> Tuple:
+    """
+    Parse a cursor produced by encode_cursor, or built by the client from the
+    last row it received
+
+    Raises:
+        ValueError if the cursor does not match the ordering
+    """
+    if order_by not in ORDERINGS:
+        raise ValueError(f"Cannot page by {order_by!r}; use one of {', '.join(ORDERINGS)}")
+
+    if order_by == 'id':
+        return (int(cursor),)
+
+    date, _, row_id = cursor.rpartition(',')
+    return (datetime.fromisoformat(date), int(row_id))
@@ -0,0 +1,187 @@
+import re
+import sys
+import time
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, List
+from app.config import Config
+
+logger = logging.getLogger(__name__)
+
+_COMMENTS = re.compile(r'--[^\n]*|/\*.*?\*/', re.S)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDERS = re.compile(r'%\(\w+\)s|%s')
+_NUMBERS = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LISTS = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=1024)
+def normalize(query: str) -> str:
+    """
+    Reduce a statement to its shape: comments dropped, literals and
+    placeholders replaced by ?, IN lists folded, whitespace collapsed, lower case
+    """
+    text = _COMMENTS.sub(' ', query)
+    text = _STRINGS.sub('?', text)
+    text = _PLACEHOLDERS.sub('?', text)
+    text = _NUMBERS.sub('?', text)
+    text = _IN_LISTS.sub('(?)', text)
+    return _WHITESPACE.sub(' ', text).strip().rstrip(';').strip().lower()
+
+
+def calling_method(model, depth: int = 12) -> str:
+    """
+    'Class.method' of the model method that issued the query
+
+    Walks up from the Query base-class helpers to the first frame running a
+    method the model's own class (or a model base other than Query) defines.
+    """
+    cls = type(model)
+    frame = sys._getframe(1)
+    while frame is not None and depth > 0:
+        if frame.f_locals.get('self') is model:
+            name = frame.f_code.co_name
+            if any(name in klass.__dict__ for klass in cls.__mro__[:-1] if klass.__name__ != 'Query'):
+                return f'{cls.__name__}.{name}'
+        frame = frame.f_back
+        depth -= 1
+    return cls.__name__
+
+
+class QueryStats:
+    """
+    Per-fingerprint counters for every query run through the Query base class:
+    calls, total / max time, rows returned, errors and the model methods
+    calling it, plus a slow-query log.
+
+    Process-local like the result cache, so each gunicorn worker reports its
+    own traffic. At most max_fingerprints shapes are tracked; new ones past
+    that are only counted as dropped.
+    """
+
+    def __init__(self, slow_ms: float = 200.0, max_fingerprints: int = 1000, enabled: bool = True):
+        self.slow_ms = slow_ms
+        self.max_fingerprints = max_fingerprints
+        self.enabled = enabled
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dropped = 0
+        self._lock = threading.Lock()
+
+    def record(self, query: str, params, seconds: float, rows: int, caller: str, error: bool = False):
+        normalized = normalize(query)
+        # The fingerprint: a short stable id of the normalized statement
+        key = hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:16]
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if len(self._entries) >= self.max_fingerprints:
+                    self._dropped += 1
+                    entry = None
+                else:
+                    entry = self._entries[key] = {
+                        'fingerprint': key,
+                        'query': normalized,
+                        'calls': 0,
+                        'errors': 0,
+                        'rows': 0,
+                        'total_time': 0.0,
+                        'max_time': 0.0,
+                        'callers': {},
+                    }
+            if entry is not None:
+                entry['calls'] += 1
+                entry['errors'] += error
+                entry['rows'] += rows
+                entry['total_time'] += seconds
+                entry['max_time'] = max(entry['max_time'], seconds)
+                entry['callers'][caller] = entry['callers'].get(caller, 0) + 1
+
+        if seconds * 1000 >= self.slow_ms:
+            shown = repr(params)
+            if len(shown) > 500:
+                shown = shown[:500] + '...'
+            logger.warning(
+                f"Slow query ({seconds * 1000:.1f} ms, {rows} rows) in {caller} [{key}]: "
+                f"{_WHITESPACE.sub(' ', query).strip()} params={shown}"
+            )
+
+    def top(self, limit: int = 20, sort: str = 'total_time') -> List[Dict[str, Any]]:
+        """The limit most expensive fingerprints by total_time, max_time, calls or rows"""
+        if sort not in ('total_time', 'max_time', 'calls', 'rows'):
+            raise ValueError(f"Cannot sort query stats by {sort!r}")
+
+        with self._lock:
+            entries = sorted(self._entries.values(), key=lambda entry: entry[sort], reverse=True)[:limit]
+            return [
+                {
+                    'fingerprint': entry['fingerprint'],
+                    'query': entry['query'],
+                    'calls': entry['calls'],
+                    'errors': entry['errors'],
+                    'rows': entry['rows'],
+                    'total_ms': round(entry['total_time'] * 1000, 3),
+                    'mean_ms': round(entry['total_time'] * 1000 / entry['calls'], 3),
+                    'max_ms': round(entry['max_time'] * 1000, 3),
+                    'callers': dict(entry['callers']),
+                }
+                for entry in entries
+            ]
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+            self._dropped = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'slow_ms': self.slow_ms,
+                'fingerprints': len(self._entries),
+                'max_fingerprints': self.max_fingerprints,
+                'dropped': self._dropped,
+            }
+
+
+query_stats = QueryStats(
+    slow_ms=Config.SLOW_QUERY_MS,
+    max_fingerprints=Config.QUERY_STATS_MAX_FINGERPRINTS,
+    enabled=Config.QUERY_STATS_ENABLED,
+)
+
+
+class _Observation:
+    __slots__ = ('rows',)
+
+    def __init__(self):
+        self.rows = 0
+
+
+@contextmanager
+def observe_query(query: str, params, model):
+    """
+    Time a query issued by a Query subclass and record it in query_stats
+
+    Set .rows on the yielded object to the number of rows returned. An
+    exception is counted as an error and re-raised.
+    """
+    if not query_stats.enabled:
+        yield _Observation()
+        return
+
+    observation = _Observation()
+    started = time.perf_counter()
+    error = False
+    try:
+        yield observation
+    except Exception:
+        error = True
+        raise
+    finally:
+        query_stats.record(query, params, time.perf_counter() - started, observation.rows,
+                           calling_method(model), error)
@@ -1,4 +1,18 @@
-from flask import jsonify, make_response
+import logging
+from typing import Dict, Iterator, List
+from flask import Response, g, jsonify, make_response
+from app.utils.serializer import dumps
+from app.utils.timing import timed
+
+logger = logging.getLogger(__name__)
+
+def _conditional_headers(response):
+    etag = g.get('resource_etag')
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+    last_modified = g.get('resource_last_modified')
+    if last_modified is not None:
+        response.last_modified = last_modified
 
 def create_response(result, msg=None):
     """
@@ -9,11 +23,64 @@ def create_response(result, msg=None):
         msg: Error message if result is None
         
     Returns:
-        Flask response with appropriate status code
+        Flask response with appropriate status code, carrying ETag and
+        Last-Modified when the view is wrapped with @conditional
     """
     if result is None:
         return make_response(jsonify({'error': msg or 'Internal server error'}), 500)
     elif len(result) == 0:
         return make_response(jsonify({'error': 'Data not available'}), 404)
     
-    return make_response(jsonify(result), 200)
\ No newline at end of file
+    with timed('serialize'):
+        body = dumps(result)
+    response = make_response(body, 200)
+    response.mimetype = 'application/json'
+    _conditional_headers(response)
+    
+    return response
+
+def stream_response(chunks: Iterator[List[Dict]], ndjson: bool = False):
+    """
+    Stream row chunks as a chunked JSON array, or as NDJSON (one row per line)
+    
+    The first chunk is fetched up front so a failing or empty query still
+    gets a proper 500 or 404; after that memory per request is one chunk,
+    however many rows follow.
+    
+    Args:
+        chunks: Iterator of row lists, e.g. Query.stream_rows(...)
+        ndjson: Emit application/x-ndjson instead of a JSON array
+    """
+    try:
+        with timed('db'):
+            first = next(chunks, None)
+    except Exception as e:
+        logger.error(f"Error streaming data from database: {e}")
+        return make_response(jsonify({'error': str(e)}), 500)
+    
+    if not first:
+        return make_response(jsonify({'error': 'Data not available'}), 404)
+    
+    def encode(chunk: List[Dict]) -> bytes:
+        if ndjson:
+            return b''.join(dumps(row, iso_dates=True) + b'\n' for row in chunk)
+        return b','.join(dumps(row, iso_dates=True) for row in chunk)
+    
+    def generate():
+        try:
+            yield encode(first) if ndjson else b'[' + encode(first)
+            for chunk in chunks:
+                yield encode(chunk) if ndjson else b',' + encode(chunk)
+            if not ndjson:
+                yield b']'
+        except Exception as e:
+            # Headers are already sent; a truncated body is the only signal left
+            logger.error(f"Error streaming data from database: {e}")
+        finally:
+            chunks.close()
+    
+    response = Response(generate(), 200, mimetype='application/x-ndjson' if ndjson else 'application/json')
+    # Returns the pooled connection even if the body is never iterated
+    response.call_on_close(chunks.close)
+    _conditional_headers(response)
+    return response
\ No newline at end of file
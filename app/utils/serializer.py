@@ -0,0 +1,149 @@
+import json
+import math
+import logging
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+from flask.json.provider import DefaultJSONProvider
+from pandas import NA, NaT
+from werkzeug.http import http_date
+from app.config import Config
+from app.utils.timing import timed
+
+try:
+    import orjson
+except ImportError:
+    # Optional: the stdlib encoder produces the same documents, only slower
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('orjson', 'stdlib')
+
+
+def json_default(value: Any):
+    """
+    Convert database values the encoders cannot handle natively
+
+    Dates keep the RFC 822 format Flask's jsonify has always produced and
+    Decimals (NUMERIC, NUMERIC[]) stay strings, so responses are unchanged
+    for clients. INTERVAL columns become seconds, pandas NA / NaT null.
+    """
+    # NaT is a datetime, so it has to be caught before the date branch
+    if value is NA or value is NaT:
+        return None
+    if isinstance(value, date):
+        return http_date(value)
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if hasattr(value, 'tolist'):
+        # numpy scalars and arrays left over from the DataFrame path
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_default_iso(value: Any):
+    """json_default, but timestamps keep full ISO 8601 precision (telemetry samples are sub-second)"""
+    if value is NA or value is NaT:
+        return None
+    if isinstance(value, date):
+        return value.isoformat()
+    return json_default(value)
+
+
+def select_backend(name: str) -> str:
+    """
+    Pick the encoder dumps() uses: 'orjson', 'stdlib', or 'auto' for orjson
+    when it is installed. Asking for orjson without it falls back to stdlib.
+
+    Returns:
+        The backend now in use
+    """
+    global _backend
+    if name not in BACKENDS + ('auto',):
+        raise ValueError(f"Unknown JSON encoder {name!r}; expected one of auto, {', '.join(BACKENDS)}")
+    if name == 'orjson' and orjson is None:
+        logger.warning("JSON_ENCODER=orjson but orjson is not installed; using the stdlib encoder")
+    _backend = 'orjson' if name in ('orjson', 'auto') and orjson is not None else 'stdlib'
+    return _backend
+
+
+def current_backend() -> str:
+    return _backend
+
+
+_backend = 'stdlib'
+select_backend(Config.JSON_ENCODER)
+
+if orjson is not None:
+    # RFC 822 dates go through json_default; ISO dates, numpy scalars and
+    # arrays, and non-string keys are encoded natively
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    _ORJSON_ISO_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _finite(value: Any, default) -> Any:
+    """value with NaN / Infinity replaced by None, as orjson writes them"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item, default) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item, default) for item in value]
+    if value is None or isinstance(value, (str, int)):
+        return value
+    return _finite(default(value), default)
+
+
+def dumps(data: Any, iso_dates: bool = False) -> bytes:
+    """Serialize query rows straight to compact JSON bytes"""
+    if _backend == 'orjson':
+        if iso_dates:
+            return orjson.dumps(data, default=json_default_iso, option=_ORJSON_ISO_OPTIONS)
+        return orjson.dumps(data, default=json_default, option=_ORJSON_OPTIONS)
+
+    default = json_default_iso if iso_dates else json_default
+    try:
+        return json.dumps(data, default=default, separators=(',', ':'), allow_nan=False).encode('utf-8')
+    except ValueError:
+        # NaN / Infinity (e.g. float8 columns) are not JSON; write null like orjson instead of failing
+        return json.dumps(_finite(data, default), separators=(',', ':'), allow_nan=False).encode('utf-8')
+
+
+class JSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by dumps(), so jsonify() and dict return
+    values are encoded like create_response bodies
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        if _backend == 'orjson':
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
+
+
+def to_records(result):
+    """
+    Normalize a model result to a list of dicts
+
+    Args:
+        result: DataFrame from the pandas path, list of dicts from the row path, or None
+
+    Returns:
+        List of row dicts, or None when the query failed
+    """
+    if result is None:
+        return None
+    if hasattr(result, 'to_dict'):
+        with timed('convert'):
+            return result.to_dict(orient='records')
+    return result
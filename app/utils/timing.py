@@ -0,0 +1,171 @@
+import time
+import bisect
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Tuple
+from flask import Response, g, has_request_context, request
+from app.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Prometheus' default latency buckets, in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Thread-safe cumulative histogram keyed by a tuple of label values"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...], buckets: Iterable[float] = BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # per-bucket counts (last one is +Inf), sum
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            series = [(labels, list(counts), total) for labels, (counts, total) in sorted(self._series.items())]
+
+        for labels, counts, total in series:
+            label_text = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                yield f'{self.name}_bucket{{{label_text},le="{le}"}} {cumulative}'
+            yield f"{self.name}_sum{{{label_text}}} {total}"
+            yield f"{self.name}_count{{{label_text}}} {cumulative}"
+
+
+class Counter:
+    """Thread-safe counter keyed by a tuple of label values"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Dict[Tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple, amount: int = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            label_text = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, labels))
+            yield f"{self.name}{{{label_text}}} {value}"
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metrics:
+    """
+    Request and per-phase latency histograms in Prometheus text format.
+
+    Every gunicorn worker keeps its own copy, so /metrics reports the worker
+    that served the scrape; run Prometheus against each worker or with a
+    single worker per target.
+    """
+
+    def __init__(self):
+        self.requests = Counter('f1_http_requests_total', 'HTTP requests by route, method and status',
+                                ('route', 'method', 'status'))
+        self.latency = Histogram('f1_http_request_duration_seconds', 'Time spent handling a request',
+                                 ('route', 'method'))
+        self.phases = Histogram('f1_http_request_phase_duration_seconds',
+                                'Time spent per request in each phase (db, validate, convert, serialize, scrape, ...)',
+                                ('route', 'phase'))
+
+    def render(self) -> str:
+        lines = [*self.requests.render(), *self.latency.render(), *self.phases.render()]
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
+
+
+def record(phase: str, seconds: float):
+    """Add time spent in a phase to the current request; a no-op outside a request"""
+    if not has_request_context():
+        return
+    timings = g.setdefault('timings', {})
+    timings[phase] = timings.get(phase, 0.0) + seconds
+
+
+@contextmanager
+def timed(phase: str):
+    """
+    Time a block, or a function when used as a decorator, as one phase of the
+    current request. Repeated phases (several queries) add up.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, time.perf_counter() - start)
+
+
+def server_timing(timings: Dict[str, float], total: float) -> str:
+    """Server-Timing header value, durations in milliseconds"""
+    entries = [f"{phase};dur={seconds * 1000:.2f}" for phase, seconds in timings.items()]
+    entries.append(f"total;dur={total * 1000:.2f}")
+    return ', '.join(entries)
+
+
+def init_timing(app):
+    """
+    Time every request: phases recorded with timed() go out in a Server-Timing
+    header and, with the total, into the /metrics histograms
+
+    For streamed responses the total covers the view and the first chunk,
+    not the rest of the body.
+    """
+    @app.before_request
+    def start_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def finish_timer(response):
+        started = g.get('request_started')
+        if started is None:
+            return response
+
+        total = time.perf_counter() - started
+        timings = g.get('timings', {})
+        if Config.SERVER_TIMING_ENABLED:
+            response.headers['Server-Timing'] = server_timing(timings, total)
+
+        if Config.METRICS_ENABLED:
+            # The rule, not the path, so URL variables do not explode the label set
+            route = request.url_rule.rule if request.url_rule else 'unmatched'
+            metrics.requests.inc((route, request.method, str(response.status_code)))
+            metrics.latency.observe((route, request.method), total)
+            for phase, seconds in timings.items():
+                metrics.phases.observe((route, phase), seconds)
+        return response
+
+    if Config.METRICS_ENABLED:
+        @app.route('/metrics')
+        def prometheus_metrics():
+            return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
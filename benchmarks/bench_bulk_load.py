@@ -0,0 +1,108 @@
+"""
+Rows/sec for the telemetry insert paths: execute_batch (insert_car_data) versus
+COPY FROM STDIN (bulk_loader.copy_rows), plus the COPY + staging + ON CONFLICT
+path used for position / intervals.
+
+Runs against temporary tables, so nothing is written to the real schema.
+
+    python -m benchmarks.bench_bulk_load --dsn postgresql://localhost/f1 --rows 50000 200000
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+import psycopg2
+from psycopg2.extras import execute_batch
+from app.config import Config
+from app.services.bulk_loader import copy_rows
+
+COLUMNS = ['session_key', 'meeting_key', 'driver_number', 'date', 'brake', 'drs', 'n_gear', 'rpm', 'speed', 'throttle']
+
+DDL = """
+    CREATE TEMP TABLE car_data (
+        id BIGSERIAL PRIMARY KEY,
+        session_key INTEGER NOT NULL,
+        meeting_key INTEGER NOT NULL,
+        driver_number INTEGER NOT NULL,
+        date TIMESTAMPTZ NOT NULL,
+        brake INTEGER, drs INTEGER, n_gear INTEGER, rpm INTEGER, speed INTEGER, throttle INTEGER,
+        UNIQUE (session_key, driver_number, date)
+    )
+"""
+
+INSERT = """
+    INSERT INTO car_data (
+        session_key, meeting_key, driver_number, date,
+        brake, drs, n_gear, rpm, speed, throttle
+    ) VALUES (
+        %(session_key)s, %(meeting_key)s, %(driver_number)s, %(date)s,
+        %(brake)s, %(drs)s, %(n_gear)s, %(rpm)s, %(speed)s, %(throttle)s
+    )
+"""
+
+
+def synthetic_car_data(count: int):
+    """OpenF1-shaped car_data records (ISO date strings, ~3.7 Hz per driver)"""
+    start = datetime(2024, 3, 2, 15, tzinfo=timezone.utc)
+    drivers = [1, 11, 16, 55, 44, 63, 4, 81, 14, 18, 10, 31, 23, 2, 22, 3, 27, 20, 77, 24]
+    return [
+        {
+            'session_key': 9472, 'meeting_key': 1229,
+            'driver_number': drivers[i % len(drivers)],
+            'date': (start + timedelta(milliseconds=270 * (i // len(drivers)))).isoformat(),
+            'brake': 0 if i % 9 else 100, 'drs': 8, 'n_gear': i % 8 + 1,
+            'rpm': 10000 + i % 2000, 'speed': 150 + i % 180, 'throttle': i % 101,
+        }
+        for i in range(count)
+    ]
+
+
+def run(conn, label, fn, rows):
+    with conn.cursor() as cursor:
+        cursor.execute("TRUNCATE car_data")
+    conn.commit()
+
+    start = time.perf_counter()
+    fn(rows)
+    conn.commit()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}{len(rows):>10}{elapsed:>10.2f}s{len(rows) / elapsed:>14,.0f} rows/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', default=Config.DATABASE_URL)
+    parser.add_argument('--rows', type=int, nargs='+', default=[50000, 200000])
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(args.dsn)
+    with conn.cursor() as cursor:
+        cursor.execute(DDL)
+    conn.commit()
+
+    def batch(rows):
+        # Same shape as F1DataManager.insert_car_data
+        with conn.cursor() as cursor:
+            for i in range(0, len(rows), 5000):
+                execute_batch(cursor, INSERT, rows[i:i + 5000], page_size=1000)
+                conn.commit()
+
+    def copy(rows):
+        copy_rows(conn, 'car_data', COLUMNS, rows)
+
+    def copy_dedup(rows):
+        copy_rows(conn, 'car_data', COLUMNS, rows, dedup=True)
+
+    print(f"{'path':<28}{'rows':>10}{'time':>11}{'throughput':>19}")
+    for count in args.rows:
+        rows = synthetic_car_data(count)
+        before = run(conn, 'execute_batch', batch, rows)
+        after = run(conn, 'COPY', copy, rows)
+        run(conn, 'COPY + staging/ON CONFLICT', copy_dedup, rows)
+        print(f"{'':<28}COPY speedup {before / after:.1f}x\n")
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
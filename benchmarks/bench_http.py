@@ -0,0 +1,315 @@
+"""
+Latency and throughput of every API route, served by gunicorn from create_app().
+
+Optionally seeds the database first (benchmarks.seed at benchmark scale: ten
+seasons, 240 meetings, 1,200 sessions and 1.2M position plus 1.2M intervals
+rows), starts gunicorn on server:app pointed at it, then hits each route for
+a fixed time from a pool of client threads. Request arguments are drawn at
+random from the keys actually in the database, so the result cache sees a
+realistic mix of hits and misses.
+
+Reports requests/sec and p50/p95/p99 latency per endpoint and writes them to
+a JSON file; --compare prints the change against an earlier run.
+
+    python -m benchmarks.bench_http --dsn postgresql://localhost/f1_bench --seed
+    python -m benchmarks.bench_http --dsn ... --workers 4 --concurrency 32 --duration 20
+    python -m benchmarks.bench_http --dsn ... --compare bench_http_ac64ee9.json
+    python -m benchmarks.bench_http --url http://localhost:8000 --dsn ...   # already running server
+
+Scrape-backed routes (/drivers/driver-stats, /meetings/get-meeting-info for
+meetings without pre-scraped circuit info) call formula1.com and are only
+included with --include-scrapers.
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+import numpy as np
+import psycopg2
+import requests
+from app.config import Config
+from app.services.scrape_jobs import encode_job_id
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# endpoint -> (path, function building query args from the samples)
+ROUTES = {
+    'meetings.meetings_by_year': ('/meetings/', lambda s: {'year': random.choice(s['years'])}),
+    'meetings.meeting_by_key': ('/meetings/get-meeting', lambda s: {'meeting_key': random.choice(s['meetings'])}),
+    'meetings.meeting_info': ('/meetings/get-meeting-info', lambda s: {'meeting_key': random.choice(s['meetings'])}),
+    'sessions.all_sessions': ('/meetings/sessions/', lambda s: {'meeting_key': random.choice(s['meetings'])}),
+    'sessions.meeting_by_key': ('/meetings/sessions/get-session', lambda s: {'session_key': random.choice(s['sessions'])}),
+    'session_result.all_sessions': ('/meetings/sessions/session_result/',
+                                    lambda s: {'session_key': random.choice(s['result_sessions'])}),
+    'sessions.sessions_batch': ('/meetings/sessions/batch', lambda s: {
+        'meeting_key': ','.join(map(str, random.sample(s['meetings'], min(5, len(s['meetings'])))))}),
+    'sessions.sessions_by_keys_batch': ('/meetings/sessions/get-session/batch', lambda s: {
+        'session_key': ','.join(map(str, random.sample(s['sessions'], min(5, len(s['sessions'])))))}),
+    'session_result.session_results_batch': ('/meetings/sessions/session_result/batch', lambda s: {
+        'session_key': ','.join(map(str, random.sample(s['result_sessions'], min(5, len(s['result_sessions'])))))}),
+    'drivers.drivers_by_year': ('/drivers/', lambda s: {'year': random.choice(s['years'])}),
+    'drivers.driver_by_number_and_session': ('/drivers/driver', lambda s: {
+        'session_key': random.choice(s['sessions']), 'driver_number': random.choice(s['drivers'])}),
+    'drivers.drivers_by_numbers_and_session': ('/drivers/driver/batch', lambda s: {
+        'session_key': random.choice(s['sessions']),
+        'driver_number': ','.join(map(str, random.sample(s['drivers'], min(20, len(s['drivers'])))))}),
+    'drivers.driver_by_number_and_year': ('/drivers/driver-for-year', lambda s: {
+        'year': random.choice(s['years']), 'driver_number': random.choice(s['drivers'])}),
+    'drivers.driver_race_win_by_year': ('/drivers/race-wins', lambda s: {
+        'year': random.choice(s['years']), 'driver_number': random.choice(s['drivers'])}),
+    'drivers.driver_podiums_by_year': ('/drivers/podiums', lambda s: {
+        'year': random.choice(s['years']), 'driver_number': random.choice(s['drivers'])}),
+    'drivers.driver_stats': ('/drivers/driver-stats', lambda s: {
+        'year': random.choice(s['years']), 'driver_number': random.choice(s['drivers'])}),
+    'seasons.season_bundle': ('/seasons/bundle', lambda s: {'year': random.choice(s['years'])}),
+    'standings.driver_standings': ('/standings/drivers', lambda s: {'year': random.choice(s['years'])}),
+    'standings.team_standings': ('/standings/teams', lambda s: {'year': random.choice(s['years'])}),
+    'telemetry.car_data_trace': ('/telemetry/car-data', lambda s: {
+        'session_key': random.choice(s['car_data_sessions']), 'driver_number': random.choice(s['drivers']),
+        'points': random.choice([200, 1000, 5000])}),
+    'telemetry.raw_telemetry': ('/telemetry/raw/{table}', lambda s: {
+        'table': random.choice(['position', 'intervals']), 'session_key': random.choice(s['telemetry_sessions']),
+        'driver_number': random.choice(s['drivers']), 'limit': 1000}),
+    # A poll for a job no worker knows about: one scrape cache read
+    'jobs.job_status': ('/jobs/{job_id}', lambda s: {
+        'job_id': encode_job_id(int(time.time()), f"driver_stats:driver-number{random.choice(s['drivers'])}")}),
+    'health': ('/health', lambda s: {}),
+}
+
+SCRAPE_ROUTES = {'drivers.driver_stats', 'meetings.meeting_info'}
+
+
+def unmapped_routes() -> list:
+    """Blueprint endpoints with no entry in ROUTES"""
+    from flask import Flask
+    from app.routes import blueprints
+
+    app = Flask(__name__)
+    for blueprint in blueprints:
+        app.register_blueprint(blueprint)
+    return [rule.endpoint for rule in app.url_map.iter_rules()
+            if rule.endpoint != 'static' and rule.endpoint not in ROUTES]
+
+
+def load_samples(dsn: str) -> dict:
+    """Keys to draw request arguments from"""
+    queries = {
+        'years': "SELECT DISTINCT year FROM meetings",
+        'meetings': "SELECT meeting_key FROM meetings",
+        'sessions': "SELECT session_key FROM sessions",
+        'result_sessions': "SELECT DISTINCT session_key FROM session_result",
+        'drivers': "SELECT DISTINCT driver_number FROM drivers",
+        'telemetry_sessions': "SELECT session_key FROM load_manifest WHERE table_name = 'position' AND status = 'complete'",
+        'car_data_sessions': "SELECT DISTINCT session_key FROM car_data_rollup",
+    }
+    samples = {}
+    with psycopg2.connect(dsn) as conn, conn.cursor() as cursor:
+        for name, query in queries.items():
+            cursor.execute(query)
+            samples[name] = [row[0] for row in cursor.fetchall()]
+        cursor.execute("""
+            SELECT
+            (SELECT COUNT(*) FROM meetings),
+            (SELECT COUNT(*) FROM sessions),
+            (SELECT COUNT(*) FROM position),
+            (SELECT COUNT(*) FROM intervals)
+        """)
+        samples['dataset'] = dict(zip(['meetings', 'sessions', 'position', 'intervals'], cursor.fetchone()))
+    conn.close()
+    return samples
+
+
+def start_gunicorn(dsn: str, bind: str, workers: int, threads: int, cache: bool) -> subprocess.Popen:
+    env = dict(os.environ, DATABASE_URL=dsn, CACHE_ENABLED='true' if cache else 'false', FLASK_ENV='production')
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'server:app', '--bind', bind, '--workers', str(workers),
+         '--threads', str(threads), '--log-level', 'warning'],
+        cwd=ROOT, env=env,
+    )
+
+    url = f'http://{bind}'
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"gunicorn exited with status {process.returncode}")
+        try:
+            if requests.get(f'{url}/health', timeout=1).ok:
+                return process
+        except requests.RequestException:
+            time.sleep(0.2)
+
+    process.terminate()
+    raise SystemExit(f"gunicorn did not come up on {bind}")
+
+
+def run_endpoint(base_url: str, path: str, make_args, samples: dict, concurrency: int, duration: float) -> dict:
+    """Hit one route from concurrency threads for duration seconds"""
+    latencies = [[] for _ in range(concurrency)]
+    statuses = [{} for _ in range(concurrency)]
+    sizes = [0] * concurrency
+    stop = threading.Event()
+
+    def worker(i):
+        session = requests.Session()
+        while not stop.is_set():
+            args = make_args(samples)
+            url = base_url + path.format(**args)
+            params = {key: value for key, value in args.items() if '{' + key + '}' not in path}
+            started = time.perf_counter()
+            try:
+                response = session.get(url, params=params, timeout=30)
+                body = response.content
+                status = response.status_code
+            except requests.RequestException:
+                body, status = b'', 'error'
+            latencies[i].append(time.perf_counter() - started)
+            statuses[i][status] = statuses[i].get(status, 0) + 1
+            sizes[i] += len(body)
+        session.close()
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    times = np.array([latency for thread_latencies in latencies for latency in thread_latencies]) * 1000
+    status_counts = {}
+    for thread_statuses in statuses:
+        for status, count in thread_statuses.items():
+            status_counts[str(status)] = status_counts.get(str(status), 0) + count
+
+    if len(times) == 0:
+        return {'requests': 0, 'statuses': status_counts}
+
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    return {
+        'requests': len(times),
+        'rps': round(len(times) / elapsed, 1),
+        'p50_ms': round(float(p50), 2),
+        'p95_ms': round(float(p95), 2),
+        'p99_ms': round(float(p99), 2),
+        'mean_ms': round(float(times.mean()), 2),
+        'max_ms': round(float(times.max()), 2),
+        'bytes_per_request': int(sum(sizes) / len(times)),
+        'statuses': status_counts,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def print_results(results: dict, baseline: dict = None):
+    header = f"{'endpoint':<40}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}  statuses"
+    print(header)
+    print('-' * len(header))
+    for endpoint, stats in results['endpoints'].items():
+        if not stats['requests']:
+            print(f"{endpoint:<40}{'no responses':>36}  {stats['statuses']}")
+            continue
+        print(f"{endpoint:<40}{stats['rps']:>9}{stats['p50_ms']:>9}{stats['p95_ms']:>9}{stats['p99_ms']:>9}  {stats['statuses']}")
+
+        before = (baseline or {}).get('endpoints', {}).get(endpoint)
+        if before and before.get('requests'):
+            change = {
+                key: f"{(stats[key] - before[key]) / before[key] * 100:+.0f}%" if before[key] else 'n/a'
+                for key in ['rps', 'p50_ms', 'p95_ms', 'p99_ms']
+            }
+            print(f"{'  vs ' + baseline['meta']['commit']:<40}{change['rps']:>9}{change['p50_ms']:>9}"
+                  f"{change['p95_ms']:>9}{change['p99_ms']:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', default=Config.DATABASE_URL, help='Database the server reads (and --seed fills)')
+    parser.add_argument('--seed', action='store_true', help='Recreate the schema and seed it first (drops the public schema)')
+    parser.add_argument('--seasons', type=int, default=10)
+    parser.add_argument('--telemetry-samples', type=int, default=250,
+                        help='position / intervals samples per driver per race when seeding')
+    parser.add_argument('--url', help='Benchmark an already running server instead of starting gunicorn')
+    parser.add_argument('--bind', default='127.0.0.1:8099')
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn worker processes')
+    parser.add_argument('--threads', type=int, default=4, help='Threads per gunicorn worker')
+    parser.add_argument('--no-cache', action='store_true', help='Start the server with CACHE_ENABLED=false')
+    parser.add_argument('--concurrency', type=int, default=16, help='Client threads per endpoint')
+    parser.add_argument('--duration', type=float, default=10, help='Seconds per endpoint')
+    parser.add_argument('--warmup', type=float, default=1, help='Seconds of unmeasured traffic per endpoint first')
+    parser.add_argument('--only', nargs='*', help='Endpoint names (e.g. drivers.drivers_by_year) to run')
+    parser.add_argument('--include-scrapers', action='store_true', help='Also hit routes that scrape formula1.com')
+    parser.add_argument('--output', help='Results file (default bench_http_<commit>.json)')
+    parser.add_argument('--compare', help='Earlier results file to compare against')
+    args = parser.parse_args()
+
+    if args.seed:
+        from benchmarks.seed import seed
+        counts = seed(args.dsn, reset=True, seasons=args.seasons, telemetry_samples=args.telemetry_samples)
+        print(f"Seeded {counts['position']:,} position and {counts['intervals']:,} intervals rows in {counts['seconds']}s")
+
+    for endpoint in unmapped_routes():
+        print(f"Warning: no benchmark arguments for {endpoint}; add it to ROUTES")
+
+    samples = load_samples(args.dsn)
+    endpoints = [
+        endpoint for endpoint in ROUTES
+        if (not args.only or endpoint in args.only)
+        and (args.include_scrapers or endpoint not in SCRAPE_ROUTES)
+    ]
+
+    server = None
+    base_url = args.url
+    if not base_url:
+        server = start_gunicorn(args.dsn, args.bind, args.workers, args.threads, not args.no_cache)
+        base_url = f'http://{args.bind}'
+
+    results = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'url': base_url,
+            'workers': None if args.url else args.workers,
+            'threads': None if args.url else args.threads,
+            'cache': not args.no_cache,
+            'concurrency': args.concurrency,
+            'duration': args.duration,
+            'dataset': samples['dataset'],
+        },
+        'endpoints': {},
+    }
+
+    try:
+        for endpoint in endpoints:
+            path, make_args = ROUTES[endpoint]
+            if args.warmup:
+                run_endpoint(base_url, path, make_args, samples, args.concurrency, args.warmup)
+            results['endpoints'][endpoint] = run_endpoint(base_url, path, make_args, samples,
+                                                          args.concurrency, args.duration)
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+    print_results(results, baseline)
+
+    output = Path(args.output or f"bench_http_{results['meta']['commit']}.json")
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    main()
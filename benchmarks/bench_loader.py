@@ -0,0 +1,189 @@
+"""
+Throughput of the F1DataManager loaders against the local mock OpenF1 server.
+
+Recreates the schema in --dsn (its public schema is dropped), starts
+benchmarks.mock_openf1 in-process and runs each loader in a fresh
+interpreter, so every scenario gets its own peak-memory figure:
+
+    initial_setup                     meetings, sessions, every per-season table
+                                      and telemetry for the latest races
+    load_session_telemetry            streamed telemetry for --sessions races
+    load_session_telemetry_buffered   the same with stream=False, on other races
+    load_missing_session_results      after emptying session_result
+
+Reports wall time, records received from the API, records/sec, rows added
+to the database and peak RSS per scenario, and writes them to a JSON file.
+
+    python -m benchmarks.bench_loader --dsn postgresql://localhost/f1_loader_bench
+    python -m benchmarks.bench_loader --dsn ... --samples 20000 --latency 0.05 --sessions 5
+    python -m benchmarks.bench_loader --dsn ... --compare bench_loader_49f546d.json
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import time
+from pathlib import Path
+import psycopg2
+from benchmarks.bench_http import git_commit
+from benchmarks.mock_openf1 import MockConfig, MockOpenF1
+from benchmarks.seed import reset_schema
+
+SCENARIOS = [
+    'initial_setup',
+    'load_session_telemetry',
+    'load_session_telemetry_buffered',
+    'load_missing_session_results',
+]
+
+COUNTED_TABLES = ['meetings', 'sessions', 'drivers', 'session_result', 'car_data', 'location', 'position', 'intervals']
+
+
+def count_rows(conn) -> dict:
+    with conn.cursor() as cursor:
+        counts = {}
+        for table in COUNTED_TABLES:
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            counts[table] = cursor.fetchone()[0]
+    conn.commit()
+    return counts
+
+
+def race_sessions(conn, offset: int, count: int) -> list:
+    """Races with no telemetry loaded yet, oldest first"""
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT s.session_key
+            FROM sessions s
+            LEFT JOIN load_manifest lm
+                ON lm.session_key = s.session_key AND lm.table_name = 'car_data'
+            WHERE s.session_type = 'Race' AND lm.session_key IS NULL
+            ORDER BY s.date_start
+            OFFSET %s LIMIT %s
+        """, (offset, count))
+        return [row[0] for row in cursor.fetchall()]
+
+
+def run_scenario(scenario: str, dsn: str, api_base_url: str, year: int, sessions: int,
+                 rate: float, concurrency: int, results):
+    """Child process body: run one loader and put its measurements on results"""
+    logging.disable(logging.INFO)
+    from app.services.data_manager import F1DataManager, peak_memory_mb
+    from app.services.openf1_client import FetchConfig
+
+    fetch_config = FetchConfig(requests_per_second=rate, burst=concurrency, max_concurrency=concurrency)
+    manager = F1DataManager({'dsn': dsn}, fetch_config, api_base_url=api_base_url)
+    manager.connect()
+    before = count_rows(manager.conn)
+
+    if scenario == 'initial_setup':
+        run = lambda: manager.initial_setup(year)
+    elif scenario.startswith('load_session_telemetry'):
+        buffered = scenario.endswith('buffered')
+        # The buffered run takes the next races so neither pays for clearing the other's partitions
+        keys = race_sessions(manager.conn, 0, sessions)
+        run = lambda: [manager.load_session_telemetry(key, stream=not buffered) for key in keys]
+    else:
+        with manager.conn.cursor() as cursor:
+            cursor.execute("DELETE FROM session_result")
+        manager.conn.commit()
+        before = count_rows(manager.conn)
+        run = manager.load_missing_session_results
+
+    baseline_rss = peak_memory_mb()
+    started = time.perf_counter()
+    run()
+    wall = time.perf_counter() - started
+
+    after = count_rows(manager.conn)
+    manager.close()
+    fetched = manager.client.throughput()
+    records = sum(stats['records'] for stats in fetched.values())
+    results.put({
+        'wall_seconds': round(wall, 3),
+        'requests': sum(stats['requests'] for stats in fetched.values()),
+        'records': records,
+        'records_per_sec': round(records / wall, 1) if wall else 0.0,
+        'megabytes': round(sum(stats['bytes'] for stats in fetched.values()) / 1e6, 2),
+        'rows_added': {table: after[table] - before[table] for table in COUNTED_TABLES if after[table] != before[table]},
+        'baseline_rss_mb': round(baseline_rss, 1),
+        'peak_rss_mb': round(peak_memory_mb(), 1),
+    })
+
+
+def print_results(results: dict, baseline: dict = None):
+    header = f"{'scenario':<34}{'wall s':>9}{'records':>11}{'records/s':>11}{'peak MB':>9}"
+    print(header)
+    print('-' * len(header))
+    for scenario, stats in results['scenarios'].items():
+        print(f"{scenario:<34}{stats['wall_seconds']:>9}{stats['records']:>11,}"
+              f"{stats['records_per_sec']:>11,.0f}{stats['peak_rss_mb']:>9}")
+        before = (baseline or {}).get('scenarios', {}).get(scenario)
+        if before:
+            change = lambda key: f"{(stats[key] - before[key]) / before[key] * 100:+.0f}%" if before[key] else 'n/a'
+            print(f"{'  vs ' + baseline['meta']['commit']:<34}{change('wall_seconds'):>9}{'':>11}"
+                  f"{change('records_per_sec'):>11}{change('peak_rss_mb'):>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', required=True, help='Scratch database; its public schema is dropped and recreated')
+    parser.add_argument('--year', type=int, default=2025)
+    parser.add_argument('--meetings', type=int, default=24)
+    parser.add_argument('--samples', type=int, default=5000, help='car_data / location rows per driver per session')
+    parser.add_argument('--coarse-samples', type=int, default=500, help='position / intervals rows per driver per session')
+    parser.add_argument('--latency', type=float, default=0.0, help='Mock server delay per request in seconds')
+    parser.add_argument('--sessions', type=int, default=3, help='Races per load_session_telemetry scenario')
+    parser.add_argument('--rate', type=float, default=1000, help='Client requests/sec limit')
+    parser.add_argument('--concurrency', type=int, default=4, help='Concurrent client requests')
+    parser.add_argument('--only', nargs='*', choices=SCENARIOS)
+    parser.add_argument('--output', help='Results file (default bench_loader_<commit>.json)')
+    parser.add_argument('--compare', help='Earlier results file to compare against')
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(args.dsn)
+    reset_schema(conn)
+    conn.close()
+
+    config = MockConfig(years=[args.year], meetings=args.meetings, samples=args.samples,
+                        coarse_samples=args.coarse_samples, latency=args.latency)
+    results = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'mock': vars(config),
+            'sessions': args.sessions,
+            'rate': args.rate,
+            'concurrency': args.concurrency,
+        },
+        'scenarios': {},
+    }
+
+    context = multiprocessing.get_context('spawn')
+    with MockOpenF1(config) as api_base_url:
+        for scenario in SCENARIOS:
+            # Later scenarios read the meetings and sessions initial_setup loads, so it always runs
+            if args.only and scenario not in args.only and scenario != 'initial_setup':
+                continue
+            queue = context.Queue()
+            process = context.Process(target=run_scenario, args=(
+                scenario, args.dsn, api_base_url, args.year, args.sessions, args.rate, args.concurrency, queue,
+            ))
+            process.start()
+            process.join()
+            if process.exitcode != 0:
+                raise SystemExit(f"{scenario} failed with exit code {process.exitcode}")
+            stats = queue.get()
+            if not args.only or scenario in args.only:
+                results['scenarios'][scenario] = stats
+
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+    print_results(results, baseline)
+
+    output = Path(args.output or f"bench_loader_{results['meta']['commit']}.json")
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Before/after benchmark for the read path: pandas DataFrame + jsonify versus
+cursor rows + serializer.dumps.
+
+    python -m benchmarks.bench_row_path              # synthetic rows, no database
+    python -m benchmarks.bench_row_path --live 9472  # real session_result query via the pool
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from statistics import median
+from flask import Flask, jsonify
+from pandas import DataFrame
+from app.utils.serializer import dumps
+
+COLUMNS = [
+    'position', 'number_of_laps', 'gap_to_leader', 'duration', 'driver_number',
+    'full_name', 'team_name', 'team_colour', 'dnf', 'dns', 'dsq', 'points',
+    'headshot_url', 'date_start',
+]
+
+
+def synthetic_rows(count: int):
+    """Tuples shaped like psycopg2 output for a session_result-style query"""
+    start = datetime(2024, 3, 2, 15, tzinfo=timezone.utc)
+    rows = []
+    for i in range(count):
+        finished = i % 7 != 0
+        rows.append((
+            i + 1 if finished else None,
+            57 if finished else None,
+            str(round(i * 1.7, 3)),
+            [Decimal('5504.742') + i, Decimal('90.125')],
+            i % 99,
+            f'Driver {i}',
+            'Team',
+            '3671C6',
+            not finished, False, False,
+            25 - (i % 25) if finished else None,
+            'https://example.invalid/headshot.png',
+            start + timedelta(minutes=i),
+        ))
+    return rows
+
+
+def pandas_path(app, columns, rows):
+    # read_sql_query builds the frame from cursor.fetchall() the same way
+    df = DataFrame.from_records(rows, columns=columns)
+    for col in ['position', 'number_of_laps', 'points']:
+        if col in df.columns:
+            df[col] = df[col].astype('Int64')
+    with app.app_context():
+        return jsonify(df.to_dict(orient='records')).get_data()
+
+
+def row_path(app, columns, rows):
+    return dumps([dict(zip(columns, row)) for row in rows])
+
+
+def timeit(fn, *args, repeat: int = 50):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = fn(*args)
+        samples.append(time.perf_counter() - start)
+    return median(samples) * 1000, len(body)
+
+
+def fetch_live(session_key: int):
+    from app.utils.db_pool import get_pool
+
+    with get_pool().connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT sr.*, d.full_name, d.team_name, d.team_colour, d.headshot_url
+                FROM session_result sr
+                JOIN drivers d ON d.driver_number = sr.driver_number AND d.session_key = sr.session_key
+                WHERE sr.session_key = %s
+            """, (session_key,))
+            return [desc[0] for desc in cursor.description], cursor.fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20, 200, 2000])
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--live', type=int, metavar='SESSION_KEY', help='benchmark rows fetched from the configured database')
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+
+    if args.live:
+        columns, rows = fetch_live(args.live)
+        datasets = [(f'session {args.live}', columns, rows)]
+    else:
+        datasets = [(f'{n} rows', COLUMNS, synthetic_rows(n)) for n in args.sizes]
+
+    print(f"{'dataset':<16}{'pandas ms':>12}{'rows ms':>12}{'speedup':>10}{'bytes':>10}")
+    for label, columns, rows in datasets:
+        before, size = timeit(pandas_path, app, columns, rows, repeat=args.repeat)
+        after, _ = timeit(row_path, app, columns, rows, repeat=args.repeat)
+        print(f"{label:<16}{before:>12.3f}{after:>12.3f}{before / after:>9.1f}x{size:>10}")
+
+
+if __name__ == '__main__':
+    main()
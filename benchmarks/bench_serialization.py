@@ -0,0 +1,169 @@
+"""
+Serialization time and bytes on the wire per endpoint, before and after the
+orjson encoder and response compression.
+
+Runs create_app() in-process against --dsn and requests every route in
+benchmarks.bench_http.ROUTES --requests times, with the same arguments for
+each Accept-Encoding:
+
+    serialize   time to encode the body create_response was given, with the
+                stdlib encoder (before) and orjson (after), best of five
+                timed loops per response
+    bytes       identity (before), gzip and br (after), as received
+    compress    time the server spent compressing, from Server-Timing
+
+Streamed routes (raw telemetry) only report bytes. Results go to a JSON file;
+--compare prints the change against an earlier run.
+
+    python -m benchmarks.bench_serialization --dsn postgresql://localhost/f1_bench
+    python -m benchmarks.bench_serialization --dsn ... --requests 50 --only drivers.drivers_by_year
+    python -m benchmarks.bench_serialization --dsn ... --compare bench_serialization_de75793.json
+"""
+import argparse
+import json
+import random
+import time
+import timeit
+from pathlib import Path
+from statistics import mean
+from benchmarks.bench_http import ROUTES, SCRAPE_ROUTES, git_commit, load_samples
+
+ENCODINGS = ['identity', 'gzip', 'br']
+
+
+def server_timing(header: str) -> dict:
+    """Phase durations in ms from a Server-Timing header"""
+    phases = {}
+    for entry in filter(None, (part.strip() for part in (header or '').split(','))):
+        name, _, duration = entry.partition(';dur=')
+        if duration:
+            phases[name] = float(duration)
+    return phases
+
+
+def time_dumps(dumps, payload) -> float:
+    """Milliseconds per dumps(payload), best of five loops of at least ~2 ms each"""
+    timer = timeit.Timer(lambda: dumps(payload))
+    number = 1
+    while timer.timeit(number) < 0.002:
+        number *= 2
+    return min(timer.repeat(repeat=5, number=number)) / number * 1000
+
+
+def run(dsn: str, requests: int, endpoints: list) -> dict:
+    from app import create_app
+    from app.config import Config
+    from app.utils import response_helper, serializer
+
+    # Keep the last body create_response encoded; streamed routes encode per row with iso_dates
+    captured = {}
+    original = response_helper.dumps
+
+    def capture(data, iso_dates=False):
+        if not iso_dates:
+            captured['payload'] = data
+        return original(data, iso_dates)
+
+    response_helper.dumps = capture
+    # Config is already loaded by the time --dsn is known
+    Config.DATABASE_URL = dsn
+    app = create_app()
+    client = app.test_client()
+    samples = load_samples(dsn)
+    results = {}
+
+    for endpoint in endpoints:
+        path, make_args = ROUTES[endpoint]
+        # Seeded per endpoint so every run requests the same arguments
+        random.seed(endpoint)
+        serialize = {backend: [] for backend in serializer.BACKENDS}
+        sizes = {encoding: [] for encoding in ENCODINGS}
+        compress = {encoding: [] for encoding in ENCODINGS[1:]}
+        statuses = {}
+
+        for _ in range(requests):
+            args = make_args(samples)
+            url = path.format(**args)
+            params = {key: value for key, value in args.items() if '{' + key + '}' not in path}
+            for encoding in ENCODINGS:
+                captured.clear()
+                response = client.get(url, query_string=params, headers={'Accept-Encoding': encoding})
+                statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+                if response.status_code != 200:
+                    break
+                sizes[encoding].append(len(response.data))
+                if encoding != 'identity':
+                    compress[encoding].append(server_timing(response.headers.get('Server-Timing')).get('compress', 0.0))
+                elif 'payload' in captured:
+                    for backend in serializer.BACKENDS:
+                        serializer.select_backend(backend)
+                        serialize[backend].append(time_dumps(serializer.dumps, captured['payload']))
+                    serializer.select_backend('auto')
+
+        results[endpoint] = {
+            'requests': requests,
+            'statuses': statuses,
+            'serialize_ms': {backend: round(mean(times), 4) if times else None for backend, times in serialize.items()},
+            'bytes': {encoding: round(mean(values)) if values else None for encoding, values in sizes.items()},
+            'compress_ms': {encoding: round(mean(times), 3) if times else None for encoding, times in compress.items()},
+        }
+    return results
+
+
+def print_results(results: dict, baseline: dict = None):
+    header = (f"{'endpoint':<40}{'stdlib ms':>10}{'orjson ms':>10}{'speedup':>9}"
+              f"{'identity B':>12}{'gzip B':>9}{'br B':>9}{'br ms':>8}")
+    print(header)
+    print('-' * len(header))
+    fmt = lambda value, spec: format(value, spec) if value is not None else 'n/a'
+    for endpoint, stats in results['endpoints'].items():
+        serialize, sizes = stats['serialize_ms'], stats['bytes']
+        speedup = serialize['stdlib'] / serialize['orjson'] if serialize['stdlib'] and serialize['orjson'] else None
+        print(f"{endpoint:<40}{fmt(serialize['stdlib'], '.3f'):>10}{fmt(serialize['orjson'], '.3f'):>10}"
+              f"{fmt(speedup, '.1f') + ('x' if speedup else ''):>9}{fmt(sizes['identity'], ','):>12}"
+              f"{fmt(sizes['gzip'], ','):>9}{fmt(sizes['br'], ','):>9}{fmt(stats['compress_ms']['br'], '.2f'):>8}")
+        before = (baseline or {}).get('endpoints', {}).get(endpoint)
+        if before:
+            def change(new, old):
+                return f"{(new - old) / old * 100:+.0f}%" if new is not None and old else 'n/a'
+            print(f"{'  vs ' + baseline['meta']['commit']:<40}"
+                  f"{change(serialize['stdlib'], before['serialize_ms']['stdlib']):>10}"
+                  f"{change(serialize['orjson'], before['serialize_ms']['orjson']):>10}{'':>9}"
+                  f"{change(sizes['identity'], before['bytes']['identity']):>12}"
+                  f"{change(sizes['gzip'], before['bytes']['gzip']):>9}{change(sizes['br'], before['bytes']['br']):>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', required=True, help='Seeded database, e.g. from benchmarks.bench_http --seed')
+    parser.add_argument('--requests', type=int, default=20, help='Requests per endpoint and encoding')
+    parser.add_argument('--only', nargs='*', help='Endpoints to run (default: all but the scrapers)')
+    parser.add_argument('--include-scrapers', action='store_true', help='Also run routes that call formula1.com')
+    parser.add_argument('--output', help='Results file (default bench_serialization_<commit>.json)')
+    parser.add_argument('--compare', help='Earlier results file to compare against')
+    args = parser.parse_args()
+
+    endpoints = [
+        endpoint for endpoint in ROUTES
+        if (not args.only or endpoint in args.only)
+        and (args.include_scrapers or endpoint not in SCRAPE_ROUTES)
+    ]
+    results = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'requests': args.requests,
+        },
+        'endpoints': run(args.dsn, args.requests, endpoints),
+    }
+
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+    print_results(results, baseline)
+
+    output = Path(args.output or f"bench_serialization_{results['meta']['commit']}.json")
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    main()
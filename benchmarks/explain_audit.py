@@ -0,0 +1,192 @@
+"""
+EXPLAIN every model query against a seeded database and fail on sequential scans.
+
+Each public method of each *Model class in app/models is called with sample
+arguments taken from the database. Query is patched so the SQL is captured
+instead of executed; every captured statement is then run through
+EXPLAIN (FORMAT JSON) and its plan walked for Seq Scan nodes.
+
+By default seq scans are disabled for the EXPLAIN, so the planner only
+reports one where no index can answer the query at all. --natural plans the
+way production does and so also catches an index the planner will not use;
+seq scans of the tables in SMALL_TABLES and ALLOWED_SEQ_SCANS are expected
+there. tests/test_query_plans.py runs the --natural audit under pytest.
+
+    python -m benchmarks.explain_audit --dsn postgresql://localhost/f1_bench --seed
+    python -m benchmarks.explain_audit --dsn ... --natural
+
+Exits with status 1 if any method falls back to a sequential scan.
+"""
+import argparse
+import importlib
+import inspect
+import json
+import pkgutil
+import sys
+import psycopg2
+import app.models
+from app.models.Query import Query
+from app.utils.cache import response_cache
+
+# A few hundred rows per season at most: scanning them beats any index
+SMALL_TABLES = {'meetings', 'sessions', 'circuit_info', 'data_version', 'driver_standings', 'team_standings'}
+# Methods that read a large share of a table by design
+ALLOWED_SEQ_SCANS = {
+    # Every driver entry of a season
+    'DriverModel.get_drivers_by_year': {'drivers'},
+}
+
+
+def sample_args(conn) -> dict:
+    """Argument values by parameter name, taken from the latest race with car_data"""
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT s.session_key, s.meeting_key, s.year, r.driver_number
+            FROM car_data_rollup r
+            JOIN sessions s ON s.session_key = r.session_key
+            ORDER BY s.date_start DESC
+            LIMIT 1
+        """)
+        row = cursor.fetchone()
+        if row is None:
+            cursor.execute("""
+                SELECT s.session_key, s.meeting_key, s.year, sr.driver_number
+                FROM session_result sr
+                JOIN sessions s ON s.session_key = sr.session_key
+                ORDER BY s.date_start DESC
+                LIMIT 1
+            """)
+            row = cursor.fetchone()
+    if row is None:
+        raise SystemExit("No session results in the database; seed it first (--seed)")
+
+    session_key, meeting_key, year, driver_number = row
+    return {
+        'session_key': session_key,
+        'meeting_key': meeting_key,
+        'year': year,
+        'driver_number': driver_number,
+        'session_keys': [session_key],
+        'meeting_keys': [meeting_key],
+        'driver_numbers': [driver_number],
+        'scope': 'session',
+        'scope_key': session_key,
+        'resolution_ms': 1000,
+        'table': 'car_data',
+    }
+
+
+def model_classes():
+    """Every Query subclass defined in app.models"""
+    for module_info in pkgutil.iter_modules(app.models.__path__):
+        module = importlib.import_module(f'app.models.{module_info.name}')
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if issubclass(cls, Query) and cls is not Query and cls.__module__ == module.__name__:
+                yield cls
+
+
+def capture_queries(args: dict):
+    """Call each model method with Query patched to record (method, sql, params)"""
+    captured = []
+    current = {}
+
+    def record(self, query, params=None, *rest, **kwargs):
+        captured.append((current['name'], query, params))
+        return [], None
+
+    def record_stream(self, query, params=None, *rest, **kwargs):
+        captured.append((current['name'], query, params))
+        return iter(())
+
+    originals = Query.query_db, Query.query_rows, Query.stream_rows
+    cache_enabled = response_cache.enabled
+    Query.query_db = Query.query_rows = record
+    Query.stream_rows = record_stream
+    response_cache.enabled = False
+    missing = []
+    try:
+        for cls in model_classes():
+            model = cls()
+            for name, method in inspect.getmembers(model, inspect.ismethod):
+                if name.startswith('_') or name in vars(Query) or name not in vars(cls):
+                    continue
+                current['name'] = f'{cls.__name__}.{name}'
+                params = inspect.signature(method).parameters
+                unknown = [p for p in params if p not in args and params[p].default is inspect.Parameter.empty]
+                if unknown:
+                    missing.append((current['name'], unknown))
+                    continue
+                result = method(**{p: args[p] for p in params if p in args})
+                if inspect.isgenerator(result) or hasattr(result, '__next__'):
+                    list(result)
+    finally:
+        Query.query_db, Query.query_rows, Query.stream_rows = originals
+        response_cache.enabled = cache_enabled
+
+    return captured, missing
+
+
+def seq_scans(plan: dict):
+    """Relations read with a Seq Scan anywhere in an EXPLAIN (FORMAT JSON) plan"""
+    if plan.get('Node Type') == 'Seq Scan':
+        yield plan.get('Relation Name')
+    for child in plan.get('Plans', []):
+        yield from seq_scans(child)
+
+
+def plan_seq_scans(conn, captured: list, natural: bool = False):
+    """
+    (method, tables) for each captured query, tables being the relations
+    its plan reads with a Seq Scan; with natural the expected ones are left out
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(f"SET enable_seqscan = {'on' if natural else 'off'}")
+        for name, query, params in captured:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {query.strip().rstrip(';')}", params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            tables = set(seq_scans(plan[0]['Plan']))
+            if natural:
+                tables -= SMALL_TABLES | ALLOWED_SEQ_SCANS.get(name, set())
+            yield name, sorted(tables)
+
+
+def audit(dsn: str, natural: bool = False) -> int:
+    conn = psycopg2.connect(dsn)
+    args = sample_args(conn)
+    captured, missing = capture_queries(args)
+
+    failures = 0
+    for name, tables in plan_seq_scans(conn, captured, natural):
+        status = 'SEQ SCAN ' + ', '.join(tables) if tables else 'ok'
+        failures += bool(tables)
+        print(f"{name:<52}{status}")
+    conn.close()
+
+    for name, unknown in missing:
+        print(f"{name:<52}skipped, no sample value for {', '.join(unknown)}")
+
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', required=True)
+    parser.add_argument('--seed', action='store_true',
+                        help='Recreate the schema and seed a small synthetic dataset first (drops the public schema)')
+    parser.add_argument('--natural', action='store_true', help='Leave seq scans enabled when planning')
+    args = parser.parse_args()
+
+    if args.seed:
+        from benchmarks.seed import seed
+        seed(args.dsn, reset=True)
+
+    failures = audit(args.dsn, args.natural)
+    if failures:
+        print(f"\n{failures} queries fall back to a sequential scan")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,416 @@
+"""
+Local stand-in for the OpenF1 API with deterministic synthetic data.
+
+Serves meetings, sessions, drivers, laps, session_result, car_data,
+location, position and intervals for a configurable number of seasons,
+meetings, drivers and telemetry samples, with an optional per-request
+latency. Every value is derived from the keys, so the same settings always
+produce the same payloads. Telemetry is written out as it is generated, so
+large sessions do not need to fit in the server's memory. Any other
+OpenF1 endpoint answers with an empty list.
+
+Filters work like OpenF1: exact matches (year=2025, session_key=...) and
+comparisons (date_start>=..., session_key>=...), which is what
+F1DataManager.sync sends.
+
+Keys encode their parents: meeting_key = year * 100 + round and
+session_key = meeting_key * 10 + session index (0-4, the race is 4).
+
+    python -m benchmarks.mock_openf1 --port 8765 --samples 20000 --latency 0.05
+    OPENF1_API_BASE_URL=http://127.0.0.1:8765/v1 python -c "..."
+
+or in-process:
+
+    with MockOpenF1(MockConfig(samples=5000)) as base_url:
+        F1DataManager(db_config, api_base_url=base_url).initial_setup(2025)
+"""
+import argparse
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urlparse, unquote_plus
+
+SESSIONS = [
+    ('Practice 1', 'Practice', timedelta(hours=1)),
+    ('Practice 2', 'Practice', timedelta(hours=1)),
+    ('Practice 3', 'Practice', timedelta(hours=1)),
+    ('Qualifying', 'Qualifying', timedelta(hours=1)),
+    ('Race', 'Race', timedelta(hours=2)),
+]
+
+DRIVER_NUMBERS = [1, 11, 16, 55, 44, 63, 4, 81, 14, 18, 10, 31, 23, 2, 22, 3, 27, 20, 77, 24]
+
+TEAMS = ['Red Bull Racing', 'Ferrari', 'Mercedes', 'McLaren', 'Aston Martin',
+         'Alpine', 'Williams', 'RB', 'Kick Sauber', 'Haas F1 Team']
+
+POINTS = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+
+TELEMETRY = ['car_data', 'location', 'position', 'intervals']
+
+FILTER = re.compile(r'^(\w+)(>=|<=|>|<|=)(.*)$')
+
+
+@dataclass
+class MockConfig:
+    """Size and speed of the synthetic API"""
+    years: List[int] = field(default_factory=lambda: [2025])
+    meetings: int = 24  # per season
+    drivers: int = 20
+    laps: int = 57  # per driver per session
+    samples: int = 5000  # car_data / location rows per driver per session
+    coarse_samples: int = 500  # position / intervals rows per driver per session
+    latency: float = 0.0  # seconds added before each response
+    chunk_records: int = 1000  # records per write while streaming a response
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat()
+
+
+class SyntheticF1:
+    """Deterministic generator for every endpoint the loader calls"""
+
+    def __init__(self, config: MockConfig):
+        self.config = config
+        self.driver_numbers = DRIVER_NUMBERS[:config.drivers]
+
+    # ---- keys ----
+
+    def meeting(self, year: int, round_number: int) -> Dict:
+        start = datetime(year, 3, 1, 11, tzinfo=timezone.utc) + timedelta(weeks=round_number - 1)
+        return {
+            'meeting_key': year * 100 + round_number,
+            'circuit_key': round_number,
+            'circuit_short_name': f'Circuit {round_number}',
+            'country_code': f'C{round_number:02d}'[:3],
+            'country_key': round_number,
+            'country_name': f'Country {round_number}',
+            'date_start': _iso(start),
+            'gmt_offset': '00:00:00',
+            'location': f'City {round_number}',
+            'meeting_name': f'Grand Prix {round_number}',
+            'meeting_official_name': f'Formula 1 Grand Prix {round_number} {year}',
+            'year': year,
+        }
+
+    def meetings(self) -> Iterator[Dict]:
+        for year in self.config.years:
+            for round_number in range(1, self.config.meetings + 1):
+                yield self.meeting(year, round_number)
+
+    def sessions(self) -> Iterator[Dict]:
+        for meeting in self.meetings():
+            start = datetime.fromisoformat(meeting['date_start'])
+            for index, (name, session_type, duration) in enumerate(SESSIONS):
+                session_start = start + timedelta(hours=5 * index)
+                yield {
+                    'session_key': meeting['meeting_key'] * 10 + index,
+                    'meeting_key': meeting['meeting_key'],
+                    'circuit_key': meeting['circuit_key'],
+                    'circuit_short_name': meeting['circuit_short_name'],
+                    'country_code': meeting['country_code'],
+                    'country_key': meeting['country_key'],
+                    'country_name': meeting['country_name'],
+                    'date_start': _iso(session_start),
+                    'date_end': _iso(session_start + duration),
+                    'gmt_offset': meeting['gmt_offset'],
+                    'location': meeting['location'],
+                    'session_name': name,
+                    'session_type': session_type,
+                    'year': meeting['year'],
+                }
+
+    def session(self, session_key: int) -> Optional[Dict]:
+        meeting_key, index = divmod(session_key, 10)
+        year, round_number = divmod(meeting_key, 100)
+        if year not in self.config.years or not 1 <= round_number <= self.config.meetings or index >= len(SESSIONS):
+            return None
+        name, session_type, duration = SESSIONS[index]
+        start = datetime.fromisoformat(self.meeting(year, round_number)['date_start']) + timedelta(hours=5 * index)
+        return {'session_key': session_key, 'meeting_key': meeting_key, 'session_type': session_type,
+                'date_start': start, 'date_end': start + duration, 'year': year}
+
+    # ---- per-session endpoints ----
+
+    def drivers(self, session: Dict) -> Iterator[Dict]:
+        for i, number in enumerate(self.driver_numbers):
+            yield {
+                'session_key': session['session_key'],
+                'meeting_key': session['meeting_key'],
+                'driver_number': number,
+                'broadcast_name': f'D NUMBER{number}',
+                'country_code': 'XXX',
+                'first_name': 'Driver',
+                'last_name': f'Number{number}',
+                'full_name': f'Driver NUMBER{number}',
+                'name_acronym': f'D{number:02d}'[:3],
+                'team_name': TEAMS[i // 2 % len(TEAMS)],
+                'team_colour': f'{(i * 997) % 0xFFFFFF:06X}',
+                'headshot_url': f'https://example.invalid/{number}.png',
+            }
+
+    def finishing_order(self, session_key: int) -> List[int]:
+        # A rotation per session keeps results deterministic but varied
+        shift = session_key % len(self.driver_numbers)
+        return self.driver_numbers[shift:] + self.driver_numbers[:shift]
+
+    def session_result(self, session: Dict) -> Iterator[Dict]:
+        race = session['session_type'] == 'Race'
+        qualifying = session['session_type'] == 'Qualifying'
+        for position, number in enumerate(self.finishing_order(session['session_key']), start=1):
+            dnf = race and (session['session_key'] + number) % 13 == 0
+            yield {
+                'session_key': session['session_key'],
+                'meeting_key': session['meeting_key'],
+                'driver_number': number,
+                'position': None if dnf else position,
+                'points': POINTS[position - 1] if race and not dnf and position <= len(POINTS) else 0,
+                'dnf': dnf,
+                'dns': False,
+                'dsq': False,
+                # Like OpenF1: one time per part (Q1-Q3) in qualifying, a single number otherwise
+                'duration': ([round(90 + position * 0.113 - part * 0.4, 3) for part in range(3)] if qualifying
+                             else round(5400 + position * 3.117, 3) if race else round(90 + position * 0.113, 3)),
+                'gap_to_leader': 0 if position == 1 else round((position - 1) * 3.117, 3),
+                'number_of_laps': self.config.laps,
+            }
+
+    def laps(self, session: Dict) -> Iterator[Dict]:
+        for lap in range(1, self.config.laps + 1):
+            for rank, number in enumerate(self.driver_numbers):
+                lap_start = session['date_start'] + timedelta(seconds=90 * (lap - 1) + rank)
+                yield {
+                    'session_key': session['session_key'],
+                    'meeting_key': session['meeting_key'],
+                    'driver_number': number,
+                    'lap_number': lap,
+                    'date_start': _iso(lap_start),
+                    'lap_duration': round(90 + rank * 0.11 + (lap % 7) * 0.05, 3),
+                    'is_pit_out_lap': lap == 1,
+                    'duration_sector_1': 28.1, 'duration_sector_2': 31.4, 'duration_sector_3': 30.5,
+                    'i1_speed': 290, 'i2_speed': 275, 'st_speed': 310,
+                    'segments_sector_1': [2049, 2049, 2051], 'segments_sector_2': [2049, 2048],
+                    'segments_sector_3': [2049, 2049],
+                }
+
+    def telemetry(self, table: str, session: Dict) -> Iterator[Dict]:
+        samples = self.config.samples if table in ('car_data', 'location') else self.config.coarse_samples
+        step = (session['date_end'] - session['date_start']) / max(samples, 1)
+        for i in range(samples):
+            date = session['date_start'] + step * i
+            for rank, number in enumerate(self.driver_numbers):
+                record = {
+                    'session_key': session['session_key'],
+                    'meeting_key': session['meeting_key'],
+                    'driver_number': number,
+                    'date': _iso(date + timedelta(milliseconds=rank)),
+                }
+                if table == 'car_data':
+                    record.update(brake=100 if i % 9 == 0 else 0, drs=8 if i % 11 == 0 else 0,
+                                  n_gear=i % 8 + 1, rpm=10000 + (i * 37 + rank) % 2000,
+                                  speed=80 + (i * 13 + rank) % 250, throttle=(i * 7) % 101)
+                elif table == 'location':
+                    record.update(x=(i * 31 + rank) % 10000, y=(i * 17 + rank) % 10000, z=i % 100)
+                elif table == 'position':
+                    record.update(position=rank + 1)
+                else:
+                    record.update(gap_to_leader=round(rank * 1.7, 3) if rank else 0,
+                                  interval=round(1.7, 3) if rank else 0)
+                yield record
+
+    # ---- dispatch ----
+
+    def records(self, endpoint: str, filters: Dict[str, str]) -> Iterator[Dict]:
+        """Records for one request, before comparison filters are applied"""
+        if endpoint == 'meetings':
+            yield from self.meetings()
+            return
+        if endpoint == 'sessions':
+            yield from self.sessions()
+            return
+
+        if 'session_key' in filters:
+            session = self.session(int(filters['session_key']))
+            sessions = [session] if session else []
+        else:
+            sessions = [
+                self.session(row['session_key']) for row in self.sessions()
+                if filters.get('meeting_key') in (None, str(row['meeting_key']))
+                and filters.get('year') in (None, str(row['year']))
+            ]
+
+        for session in sessions:
+            if endpoint == 'drivers':
+                yield from self.drivers(session)
+            elif endpoint == 'session_result':
+                yield from self.session_result(session)
+            elif endpoint == 'laps':
+                yield from self.laps(session)
+            elif endpoint in TELEMETRY:
+                yield from self.telemetry(endpoint, session)
+
+
+def _compare(value, operator: str, target: str) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, (int, float)):
+        target = float(target)
+    else:
+        value = str(value)
+    return {
+        '>': value > target, '>=': value >= target,
+        '<': value < target, '<=': value <= target,
+    }[operator]
+
+
+def parse_filters(query: str):
+    """
+    Split an OpenF1 query string into exact filters and (column, operator, value)
+    comparisons
+
+    Like OpenF1, each parameter is unquoted before it is parsed, so
+    date_start%3E=value reads as date_start>=value.
+    """
+    exact, comparisons = {}, []
+    for part in filter(None, query.split('&')):
+        match = FILTER.match(unquote_plus(part))
+        if not match:
+            continue
+        column, operator, value = match.groups()
+        if operator == '=':
+            exact[column] = value
+        else:
+            comparisons.append((column, operator, value))
+    return exact, comparisons
+
+
+class MockOpenF1:
+    """
+    Threaded HTTP server serving SyntheticF1 under /v1/<endpoint>
+
+    Use as a context manager (yields the base URL) or start()/stop().
+    stats counts requests, records and bytes per endpoint.
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = '127.0.0.1', port: int = 0):
+        self.config = config or MockConfig()
+        self.data = SyntheticF1(self.config)
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}/v1'
+
+    def _count(self, endpoint: str, records: int, size: int):
+        with self._stats_lock:
+            stats = self.stats.setdefault(endpoint, {'requests': 0, 'records': 0, 'bytes': 0})
+            stats['requests'] += 1
+            stats['records'] += records
+            stats['bytes'] += size
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # No Content-Length: the body is streamed and the connection closed at the end
+            protocol_version = 'HTTP/1.0'
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                endpoint = url.path.rstrip('/').rsplit('/', 1)[-1]
+                exact, comparisons = parse_filters(url.query)
+
+                if mock.config.latency:
+                    time.sleep(mock.config.latency)
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.end_headers()
+
+                records = 0
+                size = 0
+                batch = []
+
+                def flush(prefix: bytes):
+                    nonlocal size
+                    payload = prefix + ','.join(batch).encode()
+                    self.wfile.write(payload)
+                    size += len(payload)
+                    batch.clear()
+
+                prefix = b'['
+                for record in mock.data.records(endpoint, exact):
+                    if any(key in record and str(record[key]) != value for key, value in exact.items()):
+                        continue
+                    if not all(_compare(record.get(column), operator, value) for column, operator, value in comparisons):
+                        continue
+                    batch.append(json.dumps(record))
+                    records += 1
+                    if len(batch) >= mock.config.chunk_records:
+                        flush(prefix)
+                        prefix = b','
+                if batch:
+                    flush(prefix)
+                    prefix = b','
+                tail = b']' if prefix == b',' else b'[]'
+                self.wfile.write(tail)
+                mock._count(endpoint, records, size + len(tail))
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self.server.serve_forever, name='mock-openf1', daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> str:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--years', type=int, nargs='+', default=[2025])
+    parser.add_argument('--meetings', type=int, default=24, help='Meetings per season')
+    parser.add_argument('--drivers', type=int, default=20)
+    parser.add_argument('--laps', type=int, default=57)
+    parser.add_argument('--samples', type=int, default=5000, help='car_data / location rows per driver per session')
+    parser.add_argument('--coarse-samples', type=int, default=500, help='position / intervals rows per driver per session')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds of delay before each response')
+    args = parser.parse_args()
+
+    config = MockConfig(years=args.years, meetings=args.meetings, drivers=args.drivers, laps=args.laps,
+                        samples=args.samples, coarse_samples=args.coarse_samples, latency=args.latency)
+    mock = MockOpenF1(config, args.host, args.port)
+    print(f"Serving synthetic OpenF1 at {mock.base_url}")
+    try:
+        mock.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mock.server.server_close()
+
+
+if __name__ == '__main__':
+    main()
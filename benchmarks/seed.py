@@ -0,0 +1,244 @@
+"""
+Seed a Postgres database with deterministic synthetic F1 data.
+
+Loads app/services/F1data.sql, then fills meetings, sessions, drivers and
+session_result for several seasons, plus position / intervals samples for
+every race and car_data (with rollups) for the latest races. Standings and
+the load manifest are built through F1DataManager, exactly as the loader
+would. Everything goes in with COPY, so millions of rows take seconds.
+
+    python -m benchmarks.seed --dsn postgresql://localhost/f1_bench --reset
+    python -m benchmarks.seed --dsn ... --reset --seasons 10 --meetings 24 --telemetry-samples 250
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import psycopg2
+from app.services.bulk_loader import copy_rows
+from app.services.data_manager import F1DataManager
+
+SCHEMA = Path(__file__).resolve().parent.parent / 'app' / 'services' / 'F1data.sql'
+
+SESSIONS = [
+    ('Practice 1', 'Practice', timedelta(hours=1)),
+    ('Practice 2', 'Practice', timedelta(hours=1)),
+    ('Practice 3', 'Practice', timedelta(hours=1)),
+    ('Qualifying', 'Qualifying', timedelta(hours=1)),
+    ('Race', 'Race', timedelta(hours=2)),
+]
+
+TEAMS = [
+    ('Red Bull Racing', '3671C6'), ('Ferrari', 'E8002D'), ('Mercedes', '27F4D2'),
+    ('McLaren', 'FF8000'), ('Aston Martin', '229971'), ('Alpine', 'FF87BC'),
+    ('Williams', '64C4FF'), ('RB', '6692FF'), ('Kick Sauber', '52E252'), ('Haas F1 Team', 'B6BABD'),
+]
+
+DRIVER_NUMBERS = [1, 11, 16, 55, 44, 63, 4, 81, 14, 18, 10, 31, 23, 2, 22, 3, 27, 20, 77, 24]
+
+POINTS = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+
+COLUMNS = {
+    'meetings': ['meeting_key', 'circuit_key', 'circuit_short_name', 'country_code', 'country_key',
+                 'country_name', 'date_start', 'gmt_offset', 'location', 'meeting_name',
+                 'meeting_official_name', 'year'],
+    'sessions': ['session_key', 'meeting_key', 'circuit_key', 'circuit_short_name', 'country_code',
+                 'country_key', 'country_name', 'date_start', 'date_end', 'gmt_offset', 'location',
+                 'session_name', 'session_type', 'year'],
+    'drivers': ['session_key', 'meeting_key', 'driver_number', 'broadcast_name', 'country_code',
+                'first_name', 'last_name', 'full_name', 'name_acronym', 'team_name', 'team_colour',
+                'headshot_url'],
+    'session_result': ['session_key', 'meeting_key', 'driver_number', 'position', 'points', 'dnf',
+                       'dns', 'dsq', 'duration', 'gap_to_leader', 'number_of_laps'],
+}
+
+
+def reset_schema(conn):
+    """Drop everything in the public schema and recreate it from F1data.sql"""
+    with conn.cursor() as cursor:
+        cursor.execute("DROP SCHEMA public CASCADE")
+        cursor.execute("CREATE SCHEMA public")
+        cursor.execute(SCHEMA.read_text())
+    conn.commit()
+
+
+def generate(seasons: int, meetings: int, last_year: int, seed: int):
+    """Meetings, sessions, drivers and results as lists of dicts"""
+    rng = random.Random(seed)
+    data = {table: [] for table in COLUMNS}
+    meeting_key = 1000
+    session_key = 10000
+
+    for year in range(last_year - seasons + 1, last_year + 1):
+        for round_number in range(meetings):
+            meeting_key += 1
+            start = datetime(year, 3, 1, 11, tzinfo=timezone.utc) + timedelta(weeks=round_number)
+            circuit = round_number + 1
+            place = {
+                'circuit_key': circuit,
+                'circuit_short_name': f'Circuit {circuit}',
+                'country_code': f'C{circuit:02d}'[:3],
+                'country_key': circuit,
+                'country_name': f'Country {circuit}',
+                'gmt_offset': '00:00:00',
+                'location': f'City {circuit}',
+            }
+            data['meetings'].append({
+                'meeting_key': meeting_key, 'date_start': start, 'year': year,
+                'meeting_name': f'Grand Prix {circuit}',
+                'meeting_official_name': f'Formula 1 Grand Prix {circuit} {year}',
+                **place,
+            })
+
+            for day, (name, session_type, duration) in enumerate(SESSIONS):
+                session_key += 1
+                session_start = start + timedelta(hours=5 * day)
+                data['sessions'].append({
+                    'session_key': session_key, 'meeting_key': meeting_key,
+                    'date_start': session_start, 'date_end': session_start + duration,
+                    'session_name': name, 'session_type': session_type, 'year': year,
+                    **place,
+                })
+
+                for i, number in enumerate(DRIVER_NUMBERS):
+                    team_name, team_colour = TEAMS[i // 2]
+                    data['drivers'].append({
+                        'session_key': session_key, 'meeting_key': meeting_key, 'driver_number': number,
+                        'broadcast_name': f'D {number}', 'country_code': 'XXX',
+                        'first_name': 'Driver', 'last_name': f'NUMBER{number}',
+                        'full_name': f'Driver NUMBER{number}', 'name_acronym': f'D{number:02d}'[:3],
+                        'team_name': team_name, 'team_colour': team_colour,
+                        'headshot_url': f'https://example.invalid/{number}.png',
+                    })
+
+                if session_type not in ('Race', 'Qualifying'):
+                    continue
+
+                order = DRIVER_NUMBERS[:]
+                rng.shuffle(order)
+                for position, number in enumerate(order, start=1):
+                    dnf = session_type == 'Race' and rng.random() < 0.08
+                    data['session_result'].append({
+                        'session_key': session_key, 'meeting_key': meeting_key, 'driver_number': number,
+                        'position': None if dnf else position,
+                        'points': POINTS[position - 1] if session_type == 'Race' and not dnf and position <= 10 else 0,
+                        'dnf': dnf, 'dns': False, 'dsq': False,
+                        'duration': [round(5400 + position * 3.1 + rng.random(), 3)],
+                        'gap_to_leader': None if position == 1 else str(round(position * 3.1, 3)),
+                        'number_of_laps': 57,
+                    })
+
+    return data
+
+
+def telemetry(session: dict, samples: int, columns: list, rng: random.Random):
+    """samples rows per driver spread across the session, for position / intervals / car_data"""
+    step = (session['date_end'] - session['date_start']) / samples
+    for i in range(samples):
+        date = session['date_start'] + step * i
+        for rank, number in enumerate(DRIVER_NUMBERS, start=1):
+            row = {
+                'session_key': session['session_key'], 'meeting_key': session['meeting_key'],
+                'driver_number': number, 'date': date + timedelta(milliseconds=rank),
+            }
+            if 'position' in columns:
+                row['position'] = rank
+            if 'gap_to_leader' in columns:
+                row['gap_to_leader'] = round(rank * 1.7 + rng.random(), 3)
+                row['interval'] = round(1.7 + rng.random(), 3)
+            if 'speed' in columns:
+                row.update(brake=0 if i % 9 else 100, drs=0, n_gear=i % 8 + 1,
+                           rpm=10000 + (i * 37) % 2000, speed=80 + (i * 13 + rank) % 250,
+                           throttle=(i * 7) % 101)
+            yield row
+
+
+def seed(dsn: str, reset: bool = False, seasons: int = 3, meetings: int = 24, last_year: int = 2025,
+         telemetry_samples: int = 100, car_data_sessions: int = 2, car_data_samples: int = 2000,
+         random_seed: int = 1) -> dict:
+    """
+    Fill the database and return row counts per table
+
+    Args:
+        dsn: Target database
+        reset: Drop and recreate the public schema first
+        seasons: Number of seasons ending at last_year
+        meetings: Meetings per season (each has five sessions)
+        telemetry_samples: position / intervals samples per driver per race
+        car_data_sessions: Latest races that get car_data and rollups
+        car_data_samples: car_data samples per driver for those races
+    """
+    conn = psycopg2.connect(dsn)
+    if reset:
+        reset_schema(conn)
+
+    data = generate(seasons, meetings, last_year, random_seed)
+    counts = {}
+    started = time.perf_counter()
+
+    for table in ['meetings', 'sessions', 'drivers', 'session_result']:
+        counts[table] = copy_rows(conn, table, COLUMNS[table], data[table])
+        conn.commit()
+
+    manager = F1DataManager({'dsn': dsn})
+    manager.conn = conn
+    rng = random.Random(random_seed)
+    races = [session for session in data['sessions'] if session['session_type'] == 'Race']
+    telemetry_tables = {
+        'position': ['session_key', 'meeting_key', 'driver_number', 'date', 'position'],
+        'intervals': ['session_key', 'meeting_key', 'driver_number', 'date', 'gap_to_leader', 'interval'],
+    }
+
+    for table, columns in telemetry_tables.items():
+        counts[table] = 0
+        if not telemetry_samples:
+            continue
+        for session in races:
+            manager.ensure_partition(table, session['session_key'])
+            counts[table] += copy_rows(conn, table, columns, telemetry(session, telemetry_samples, columns, rng))
+        conn.commit()
+        manager.mark_loaded(table, {session['session_key']: telemetry_samples * len(DRIVER_NUMBERS) for session in races})
+
+    columns = manager.config.copy_columns['car_data']
+    counts['car_data'] = 0
+    for session in races[-car_data_sessions:] if car_data_sessions else []:
+        manager.ensure_partition('car_data', session['session_key'])
+        counts['car_data'] += copy_rows(conn, 'car_data', columns, telemetry(session, car_data_samples, columns, rng))
+        conn.commit()
+        manager.after_load('car_data', {session['session_key']: car_data_samples * len(DRIVER_NUMBERS)})
+
+    manager.refresh_standings()
+    manager.rebuild_season_bundles(range(last_year - seasons + 1, last_year + 1))
+
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    conn.close()
+
+    counts['seconds'] = round(time.perf_counter() - started, 2)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', required=True, help='Database to seed (its public schema is dropped with --reset)')
+    parser.add_argument('--reset', action='store_true', help='Recreate the schema from F1data.sql first')
+    parser.add_argument('--seasons', type=int, default=3)
+    parser.add_argument('--meetings', type=int, default=24, help='Meetings per season')
+    parser.add_argument('--last-year', type=int, default=2025)
+    parser.add_argument('--telemetry-samples', type=int, default=100,
+                        help='position / intervals samples per driver per race')
+    parser.add_argument('--car-data-sessions', type=int, default=2)
+    parser.add_argument('--car-data-samples', type=int, default=2000)
+    parser.add_argument('--random-seed', type=int, default=1)
+    args = parser.parse_args()
+
+    counts = seed(args.dsn, args.reset, args.seasons, args.meetings, args.last_year,
+                  args.telemetry_samples, args.car_data_sessions, args.car_data_samples, args.random_seed)
+    for table, count in counts.items():
+        print(f"{table:<16}{count:>12,}")
+
+
+if __name__ == '__main__':
+    main()
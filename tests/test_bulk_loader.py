@@ -0,0 +1,148 @@
+import os
+from datetime import date, datetime, timezone
+from decimal import Decimal
+import pytest
+from app.services.bulk_loader import RowStream, _format_value, copy_rows
+
+DSN = os.environ.get('F1_TEST_DSN')
+
+AWKWARD = {
+    'id': 1,
+    'name': 'tab\there, newline\nhere, return\rhere, backslash \\ and a literal \\N',
+    'team': None,
+    'dnf': True,
+    'points': 25.5,
+    'date': datetime(2024, 12, 8, 13, 0, 0, 250000, tzinfo=timezone.utc),
+    'segments': [2048, None, 2051],
+    'gap_to_leader': [Decimal('1.250'), None, 0.5],
+    'notes': ['a,b', 'say "box"', '{braces}', 'back\\slash', 'tab\tin array', None],
+}
+
+
+class FakeCursor:
+    def __init__(self):
+        self.statements = []
+        self.payload = b''
+        self.rowcount = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+
+    def copy_expert(self, sql, file, size=8192):
+        self.statements.append(sql)
+        while True:
+            chunk = file.read(size)
+            if not chunk:
+                break
+            self.payload += chunk
+        self.rowcount = self.payload.count(b'\n')
+
+
+class FakeConnection:
+    def __init__(self):
+        self.cursor_ = FakeCursor()
+
+    def cursor(self):
+        return self.cursor_
+
+
+@pytest.mark.parametrize('value, text', [
+    (None, '\\N'),
+    (True, 't'),
+    (False, 'f'),
+    (7, '7'),
+    (0.1, '0.1'),
+    (Decimal('1.250'), '1.250'),
+    (date(2024, 12, 8), '2024-12-08'),
+    (datetime(2024, 12, 8, 13, 0, tzinfo=timezone.utc), '2024-12-08T13:00:00+00:00'),
+    ('plain', 'plain'),
+    ('a\tb\nc\rd\\e', 'a\\tb\\nc\\rd\\\\e'),
+    ('\\N', '\\\\N'),
+    ([1, None, 3], '{1,NULL,3}'),
+    ([Decimal('1.5'), None], '{"1.5",NULL}'),
+    (['a,b', 'say "box"'], '{"a,b","say \\\\"box\\\\""}'),
+    (['back\\slash'], '{"back\\\\\\\\slash"}'),
+    (['tab\there'], '{"tab\\there"}'),
+    ([[1, 2], [3, None]], '{{1,2},{3,NULL}}'),
+])
+def test_format_value(value, text):
+    assert _format_value(value) == text
+
+
+def test_each_row_is_one_line_with_one_field_per_column():
+    line = RowStream(list(AWKWARD), [AWKWARD]).read()
+    assert line.endswith(b'\n') and line.count(b'\n') == 1
+    assert line.count(b'\t') == len(AWKWARD) - 1
+
+
+@pytest.mark.parametrize('size', [1, 7, 64, -1])
+def test_row_stream_reads_in_any_chunk_size(size):
+    rows = [{'id': i, 'name': f'driver {i}'} for i in range(50)]
+    stream = RowStream(['id', 'name'], iter(rows))
+    chunks = []
+    while True:
+        chunk = stream.read(size)
+        if not chunk:
+            break
+        assert size < 0 or len(chunk) <= size
+        chunks.append(chunk)
+    assert b''.join(chunks) == b''.join(f'{i}\tdriver {i}\n'.encode() for i in range(50))
+
+
+def test_row_stream_readinto():
+    stream = RowStream(['id'], [{'id': 1}, {'id': 22}])
+    buffer = bytearray(3)
+    assert stream.readinto(buffer) == 3 and bytes(buffer) == b'1\n2'
+    assert stream.readinto(buffer) == 2 and bytes(buffer[:2]) == b'2\n'
+    assert stream.readinto(buffer) == 0
+
+
+def test_missing_keys_load_as_null():
+    assert RowStream(['id', 'team'], [{'id': 1}]).read() == b'1\t\\N\n'
+
+
+def test_copy_rows():
+    conn = FakeConnection()
+    assert copy_rows(conn, 'car_data', ['id', 'speed'], [{'id': 1, 'speed': 300}, {'id': 2}]) == 2
+    assert conn.cursor_.statements == ['COPY car_data (id, speed) FROM STDIN']
+    assert conn.cursor_.payload == b'1\t300\n2\t\\N\n'
+
+
+def test_copy_rows_with_dedup_goes_through_a_staging_table():
+    conn = FakeConnection()
+    copy_rows(conn, 'position', ['id'], [{'id': 1}], dedup=True, conflict_target='(session_key, driver_number, date)')
+    assert conn.cursor_.statements[-2] == 'COPY staging_position (id) FROM STDIN'
+    assert conn.cursor_.statements[-1] == (
+        'INSERT INTO position (id) SELECT id FROM staging_position '
+        'ON CONFLICT (session_key, driver_number, date) DO NOTHING'
+    )
+
+
+@pytest.mark.skipif(not DSN, reason='F1_TEST_DSN is not set')
+def test_awkward_values_survive_a_real_copy():
+    import psycopg2
+
+    conn = psycopg2.connect(DSN)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                CREATE TEMP TABLE copy_check (
+                    id INTEGER, name TEXT, team TEXT, dnf BOOLEAN, points REAL, date TIMESTAMPTZ,
+                    segments INTEGER[], gap_to_leader NUMERIC[], notes TEXT[]
+                )
+            """)
+        assert copy_rows(conn, 'copy_check', list(AWKWARD), [AWKWARD]) == 1
+        with conn.cursor() as cursor:
+            cursor.execute(f"SELECT {', '.join(AWKWARD)} FROM copy_check")
+            loaded = dict(zip(AWKWARD, cursor.fetchone()))
+    finally:
+        conn.rollback()
+        conn.close()
+
+    assert loaded == {**AWKWARD, 'gap_to_leader': [Decimal('1.250'), None, Decimal('0.5')]}
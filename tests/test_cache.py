@@ -0,0 +1,174 @@
+from datetime import date, datetime
+import pytest
+from flask import Flask, g
+from app.config import Config
+from app.utils import cache
+from app.utils.cache import ResponseCache, cached, ttl_for_year
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache.time, 'monotonic', clock)
+    return clock
+
+
+@pytest.fixture
+def response_cache(monkeypatch):
+    fresh = ResponseCache(max_entries=16)
+    monkeypatch.setattr(cache, 'response_cache', fresh)
+    return fresh
+
+
+class Model:
+    """Stands in for a Query model: counts the queries that reach the database"""
+
+    def __init__(self, result=None, msg=None):
+        self.result = [{'position': 1}] if result is None else result
+        self.msg = msg
+        self.queries = 0
+
+    @cached
+    def by_year(self, year: int):
+        self.queries += 1
+        return self.result, self.msg
+
+    @cached
+    def by_session(self, session_key: int):
+        self.queries += 1
+        return self.result, self.msg
+
+
+def test_get_returns_what_was_set(clock):
+    entries = ResponseCache()
+    assert entries.get(('a',)) == (False, None)
+    entries.set(('a',), 'value', ttl=10)
+    assert entries.get(('a',)) == (True, 'value')
+    assert entries.stats()['hits'] == 1
+    assert entries.stats()['misses'] == 1
+
+
+def test_entries_expire_after_their_ttl(clock):
+    entries = ResponseCache()
+    entries.set(('a',), 'value', ttl=10)
+    clock.now += 9.9
+    assert entries.get(('a',)) == (True, 'value')
+    clock.now += 0.1
+    assert entries.get(('a',)) == (False, None)
+    assert entries.stats()['size'] == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    entries = ResponseCache(max_entries=2)
+    entries.set(('a',), 1, ttl=10)
+    entries.set(('b',), 2, ttl=10)
+    entries.get(('a',))
+    entries.set(('c',), 3, ttl=10)
+    assert entries.get(('b',)) == (False, None)
+    assert entries.get(('a',)) == (True, 1)
+    assert entries.get(('c',)) == (True, 3)
+    assert entries.stats()['evictions'] == 1
+
+
+@pytest.mark.parametrize('enabled, ttl', [(False, 10), (True, 0)])
+def test_nothing_is_stored_when_disabled_or_without_ttl(clock, enabled, ttl):
+    entries = ResponseCache(enabled=enabled)
+    entries.set(('a',), 1, ttl=ttl)
+    assert entries.stats()['size'] == 0
+
+
+def test_invalidate_drops_entries_by_tag(clock):
+    entries = ResponseCache()
+    entries.set(('season',), 1, ttl=10, tags={('year', 2024)})
+    entries.set(('race',), 2, ttl=10, tags={('year', 2024), ('session', 9472)})
+    entries.set(('other race',), 3, ttl=10, tags={('session', 9473)})
+
+    assert entries.invalidate(session_keys=['9472']) == 1
+    assert entries.get(('race',)) == (False, None)
+    assert entries.invalidate(years=[2024], meeting_keys=[1229]) == 1
+    assert entries.get(('season',)) == (False, None)
+    assert entries.get(('other race',)) == (True, 3)
+    assert entries.invalidate() == 0
+
+
+def test_ttl_for_year():
+    this_year = date.today().year
+    assert ttl_for_year(None) == Config.CACHE_TTL_DEFAULT
+    assert ttl_for_year(this_year) == Config.CACHE_TTL_CURRENT_SEASON
+    assert ttl_for_year(this_year - 1) == Config.CACHE_TTL_PAST_SEASON
+
+
+@pytest.mark.parametrize('result, year', [
+    ([{'year': '2023'}], 2023),
+    ([{'date_start': datetime(2022, 3, 20, 15)}], 2022),
+    ([{'date_start': date(2021, 3, 28)}], 2021),
+    ([{'position': 1}], None),
+    ([], None),
+    ({'year': 2023}, None),
+])
+def test_rows_year(result, year):
+    assert cache._rows_year(result) == year
+
+
+def test_cached_results_are_reused(response_cache):
+    model = Model()
+    assert model.by_year(2024) == model.by_year('2024') == ([{'position': 1}], None)
+    assert model.queries == 1
+
+
+def test_failed_queries_are_not_cached(response_cache):
+    model = Model(msg='Database error')
+    model.by_year(2024)
+    model.by_year(2024)
+    assert model.queries == 2
+
+
+def test_cached_results_are_tagged_for_invalidation(response_cache):
+    model = Model()
+    model.by_year(2024)
+    response_cache.invalidate(years=[2023])
+    model.by_year(2024)
+    assert model.queries == 1
+
+    response_cache.invalidate(years=[2024])
+    model.by_year(2024)
+    assert model.queries == 2
+
+
+def test_key_only_results_take_the_ttl_of_their_season(response_cache, monkeypatch):
+    monkeypatch.setattr(cache, '_key_year', lambda scope, key: 2020 if (scope, key) == ('session', 9472) else None)
+    stored = []
+    monkeypatch.setattr(response_cache, 'set', lambda key, value, ttl, tags: stored.append((ttl, tags)))
+
+    Model().by_session(9472)
+    Model().by_session(9999)
+    assert stored == [
+        (Config.CACHE_TTL_PAST_SEASON, {('session', 9472), ('year', 2020)}),
+        (Config.CACHE_TTL_DEFAULT, {('session', 9999)}),
+    ]
+
+
+def test_cache_disabled_always_queries(response_cache):
+    response_cache.enabled = False
+    model = Model()
+    model.by_year(2024)
+    model.by_year(2024)
+    assert model.queries == 2
+
+
+def test_entries_are_keyed_on_the_request_data_version(response_cache):
+    model = Model()
+    app = Flask(__name__)
+    for version in (1, 1, 2):
+        with app.test_request_context():
+            g.resource_data_version = ('year', 2024, version)
+            model.by_year(2024)
+    assert model.queries == 2
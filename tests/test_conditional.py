@@ -0,0 +1,111 @@
+from datetime import datetime, timezone
+import pytest
+from flask import Flask, request
+from app.config import Config
+from app.utils import conditional as conditional_module
+from app.utils.conditional import conditional, get_data_version
+from app.utils.response_helper import create_response
+
+UPDATED_AT = datetime(2024, 12, 8, 15, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def versions(monkeypatch):
+    """Data versions by (scope, key); a missing key makes the lookup fail"""
+    versions = {('year', 2024): (3, UPDATED_AT)}
+    monkeypatch.setattr(conditional_module, 'get_data_version', lambda scope, key: versions.get((scope, key)))
+    return versions
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.calls = 0
+
+    @app.get('/standings')
+    @conditional('year', 'year', default=2024)
+    def standings():
+        app.calls += 1
+        return create_response([{'position': 1, 'year': request.args.get('year', 2024, type=int)}])
+
+    client = app.test_client()
+    client.app = app
+    return client
+
+
+def test_responses_carry_a_weak_etag_and_last_modified(client, versions):
+    response = client.get('/standings?year=2024')
+    assert response.status_code == 200
+    assert response.headers['ETag'].startswith('W/"')
+    assert response.last_modified == UPDATED_AT
+
+
+def test_matching_etag_is_answered_without_running_the_view(client, versions):
+    etag = client.get('/standings?year=2024').headers['ETag']
+    response = client.get('/standings?year=2024', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+    assert client.app.calls == 1
+
+
+def test_a_new_data_version_changes_the_etag(client, versions):
+    etag = client.get('/standings?year=2024').headers['ETag']
+    versions[('year', 2024)] = (4, UPDATED_AT)
+    response = client.get('/standings?year=2024', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_etag_depends_on_the_query_arguments(client, versions):
+    versions[('year', 2023)] = versions[('year', 2024)]
+    assert client.get('/standings?year=2024').headers['ETag'] != client.get('/standings?year=2023').headers['ETag']
+
+
+def test_if_modified_since(client, versions):
+    assert client.get('/standings', headers={'If-Modified-Since': 'Sun, 08 Dec 2024 15:30:00 GMT'}).status_code == 304
+    assert client.get('/standings', headers={'If-Modified-Since': 'Sun, 08 Dec 2024 15:29:59 GMT'}).status_code == 200
+
+
+def test_if_none_match_wins_over_if_modified_since(client, versions):
+    response = client.get('/standings', headers={
+        'If-None-Match': 'W/"something-else"',
+        'If-Modified-Since': 'Sun, 08 Dec 2024 15:30:00 GMT',
+    })
+    assert response.status_code == 200
+
+
+def test_failed_version_lookup_serves_without_validators(client, versions):
+    response = client.get('/standings?year=1999')
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
+
+
+def test_get_data_version_is_memoized(monkeypatch):
+    lookups = []
+
+    def get_version(scope, scope_key):
+        lookups.append((scope, scope_key))
+        return [{'version': 7, 'updated_at': UPDATED_AT}], None
+
+    now = [100.0]
+    monkeypatch.setattr(conditional_module.data_version_model, 'get_version', get_version)
+    monkeypatch.setattr(conditional_module.time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(conditional_module, '_versions', {})
+
+    assert get_data_version('session', 9472) == (7, UPDATED_AT)
+    assert get_data_version('session', 9472) == (7, UPDATED_AT)
+    assert len(lookups) == 1
+
+    now[0] += Config.DATA_VERSION_TTL
+    get_data_version('session', 9472)
+    assert len(lookups) == 2
+
+
+def test_get_data_version_of_an_unknown_scope_and_a_failed_lookup(monkeypatch):
+    monkeypatch.setattr(conditional_module, '_versions', {})
+    monkeypatch.setattr(conditional_module.data_version_model, 'get_version', lambda scope, key: ([], None))
+    assert get_data_version('meeting', 1229) == (0, None)
+
+    monkeypatch.setattr(conditional_module, '_versions', {})
+    monkeypatch.setattr(conditional_module.data_version_model, 'get_version', lambda scope, key: (None, 'Database error'))
+    assert get_data_version('meeting', 1229) is None
@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+import pytest
+from app.utils.keyset import decode_cursor, encode_cursor, keyset
+
+ROW = {'id': 48213, 'date': datetime(2024, 12, 8, 13, 4, 5, 123456, tzinfo=timezone.utc), 'speed': 301}
+
+
+def test_keyset_fragments():
+    assert keyset() == ('(id) > (%s)', 'id')
+    assert keyset('date') == ('(date, id) > (%s, %s)', 'date, id')
+
+
+@pytest.mark.parametrize('order_by', ['speed', 'id; DROP TABLE car_data'])
+def test_unknown_orderings_are_rejected(order_by):
+    with pytest.raises(ValueError):
+        keyset(order_by)
+    with pytest.raises(ValueError):
+        decode_cursor('1', order_by)
+
+
+def test_id_cursor_round_trip():
+    cursor = encode_cursor(ROW)
+    assert cursor == '48213'
+    assert decode_cursor(cursor) == (48213,)
+
+
+def test_date_cursor_round_trip():
+    cursor = encode_cursor(ROW, 'date')
+    assert cursor == '2024-12-08T13:04:05.123456+00:00,48213'
+    assert decode_cursor(cursor, 'date') == (ROW['date'], 48213)
+
+
+def test_cursor_values_line_up_with_the_placeholders():
+    for order_by in ('id', 'date'):
+        condition, _ = keyset(order_by)
+        assert condition.count('%s') == len(decode_cursor(encode_cursor(ROW, order_by), order_by))
+
+
+@pytest.mark.parametrize('cursor, order_by', [
+    ('abc', 'id'),
+    ('', 'id'),
+    ('48213', 'date'),
+    ('not a date,48213', 'date'),
+    ('2024-12-08T13:04:05+00:00,x', 'date'),
+])
+def test_malformed_cursors_raise_value_error(cursor, order_by):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, order_by)
@@ -0,0 +1,39 @@
+import json
+import pytest
+from app.services.openf1_client import iter_json_array, query_string
+
+DOCUMENT = (
+    '[3.5, -1e-7, 12E+3, 0, 42, {"date": "2025-03-16T04:03:00+00:00", "laps": [1.25, true, null]},'
+    ' "caf\\u00e9", "café", false, 1.0e10, [], {}]'
+).encode('utf-8')
+
+
+def chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize('size', range(1, len(DOCUMENT) + 1))
+def test_iter_json_array_any_chunk_size(size):
+    assert list(iter_json_array(chunked(DOCUMENT, size))) == json.loads(DOCUMENT)
+
+
+@pytest.mark.parametrize('chunks', [[b'[3.', b'5]'], [b'[1e', b'3]'], [b'[1E+', b'2]'], [b'[-', b'4]']])
+def test_iter_json_array_number_split_mid_token(chunks):
+    assert list(iter_json_array(chunks)) == json.loads(b''.join(chunks))
+
+
+@pytest.mark.parametrize('document', [b'[]', b'  [ ]  ', b'[1]'])
+def test_iter_json_array_small_documents(document):
+    assert list(iter_json_array([document])) == json.loads(document)
+
+
+@pytest.mark.parametrize('document', [b'{"a": 1}', b'[1, 2', b'[1 2]', b'[{"a": 1]'])
+def test_iter_json_array_rejects_malformed(document):
+    with pytest.raises(ValueError):
+        list(iter_json_array(chunked(document, 2)))
+
+
+def test_query_string_writes_comparisons_with_their_operator():
+    query = query_string({'year': 2025, 'date_start>=': '2025-03-16T04:00:00+00:00', 'session_key<': 9999})
+    assert query == 'year=2025&date_start%3E=2025-03-16T04%3A00%3A00%2B00%3A00&session_key%3C9999'
+    assert query_string({}) is None
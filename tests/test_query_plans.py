@@ -0,0 +1,45 @@
+"""
+Planner's choice for every model query on a seeded database
+
+Needs F1_TEST_DSN pointing at a scratch database: its public schema is
+dropped and reseeded. Skipped when it is not set.
+"""
+import os
+import pytest
+
+DSN = os.environ.get('F1_TEST_DSN')
+
+pytestmark = pytest.mark.skipif(not DSN, reason='F1_TEST_DSN is not set')
+
+
+@pytest.fixture(scope='module')
+def audit(tmp_path_factory):
+    import psycopg2
+    from app.config import Config
+    from benchmarks.explain_audit import capture_queries, plan_seq_scans, sample_args
+    from benchmarks.seed import seed
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(Config, 'SEASON_BUNDLE_DIR', str(tmp_path_factory.mktemp('bundles')))
+        # Ten seasons, so one season is a small enough share of each table for an index to win
+        seed(DSN, reset=True, seasons=10, telemetry_samples=10)
+
+    conn = psycopg2.connect(DSN)
+    try:
+        captured, missing = capture_queries(sample_args(conn))
+        plans = list(plan_seq_scans(conn, captured, natural=True))
+    finally:
+        conn.close()
+    return captured, missing, plans
+
+
+def test_every_model_method_is_explained(audit):
+    captured, missing, _ = audit
+    assert captured
+    assert missing == []
+
+
+def test_model_queries_use_indexes(audit):
+    _, _, plans = audit
+    seq_scans = {name: tables for name, tables in plans if tables}
+    assert seq_scans == {}
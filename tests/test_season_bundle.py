@@ -0,0 +1,110 @@
+import gzip
+import json
+import os
+from datetime import datetime, timezone
+import pytest
+from flask import Flask
+from app.routes import seasons
+from app.services import season_bundle
+from app.services.season_bundle import SeasonBundleStore, write_season_bundle
+
+
+def document(generated_at=datetime(2024, 12, 9, 6, 0, tzinfo=timezone.utc), winner='VER'):
+    return {
+        'year': 2024,
+        'generated_at': generated_at,
+        'meetings': [{'meeting_key': 1229, 'sessions': [{'session_key': 9472, 'results': [{'name_acronym': winner}]}]}],
+    }
+
+
+def bodies_on_disk(directory):
+    return sorted(name for name in os.listdir(directory) if not name.endswith('.meta.json'))
+
+
+def test_bundle_is_written_in_every_encoding(tmp_path):
+    meta = write_season_bundle(2024, document(), str(tmp_path))
+
+    with open(tmp_path / 'season_2024.meta.json') as f:
+        assert json.load(f) == meta
+    assert meta['generated_at'] == '2024-12-09T06:00:00+00:00'
+
+    identity = (tmp_path / meta['files']['identity']).read_bytes()
+    assert json.loads(identity)['meetings'][0]['sessions'][0]['results'] == [{'name_acronym': 'VER'}]
+    assert gzip.decompress((tmp_path / meta['files']['gzip']).read_bytes()) == identity
+    if season_bundle.brotli is not None:
+        assert season_bundle.brotli.decompress((tmp_path / meta['files']['br']).read_bytes()) == identity
+    for encoding, name in meta['files'].items():
+        assert name.startswith(f"season_2024.{meta['etag']}.json")
+        assert meta['bytes'][encoding] == (tmp_path / name).stat().st_size
+
+
+def test_unchanged_data_keeps_the_published_build(tmp_path):
+    first = write_season_bundle(2024, document(), str(tmp_path))
+    files = bodies_on_disk(tmp_path)
+    second = write_season_bundle(2024, document(generated_at=datetime(2024, 12, 10, tzinfo=timezone.utc)), str(tmp_path))
+    assert second == first
+    assert bodies_on_disk(tmp_path) == files
+
+
+def test_rebuilds_keep_only_the_previous_build(tmp_path):
+    first = write_season_bundle(2024, document(winner='VER'), str(tmp_path))
+    second = write_season_bundle(2024, document(winner='NOR'), str(tmp_path))
+    assert second['etag'] != first['etag']
+    assert {name.split('.')[1] for name in bodies_on_disk(tmp_path)} == {first['etag'], second['etag']}
+
+    third = write_season_bundle(2024, document(winner='LEC'), str(tmp_path))
+    assert {name.split('.')[1] for name in bodies_on_disk(tmp_path)} == {second['etag'], third['etag']}
+
+
+def test_other_seasons_are_left_alone(tmp_path):
+    other = write_season_bundle(2023, {**document(), 'year': 2023}, str(tmp_path))
+    write_season_bundle(2024, document(winner='VER'), str(tmp_path))
+    write_season_bundle(2024, document(winner='NOR'), str(tmp_path))
+    write_season_bundle(2024, document(winner='LEC'), str(tmp_path))
+    assert all((tmp_path / name).exists() for name in other['files'].values())
+
+
+def test_store_serves_the_latest_build(tmp_path):
+    store = SeasonBundleStore(str(tmp_path))
+    assert store.get(2024) is None
+
+    meta = write_season_bundle(2024, document(winner='VER'), str(tmp_path))
+    bundle = store.get(2024)
+    assert bundle.etag == meta['etag']
+    assert bundle.generated_at == datetime(2024, 12, 9, 6, 0, tzinfo=timezone.utc)
+    assert bundle.bodies['identity'] == (tmp_path / meta['files']['identity']).read_bytes()
+    assert store.get(2024) is bundle
+
+    meta = write_season_bundle(2024, document(winner='NOR'), str(tmp_path))
+    # Make sure the replaced meta file is seen as newer, whatever the filesystem's timestamp resolution
+    stat = (tmp_path / 'season_2024.meta.json').stat()
+    os.utime(tmp_path / 'season_2024.meta.json', ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert store.get(2024).etag == meta['etag']
+    assert store.stats()['loads'] == 2
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    write_season_bundle(2024, document(), str(tmp_path))
+    monkeypatch.setattr(seasons, 'season_bundles', SeasonBundleStore(str(tmp_path)))
+    app = Flask(__name__)
+    app.register_blueprint(seasons.bp)
+    return app.test_client()
+
+
+@pytest.mark.parametrize('encoding', ['gzip', 'identity'] + (['br'] if season_bundle.brotli is not None else []))
+def test_each_encoding_has_its_own_etag(client, encoding):
+    response = client.get('/seasons/bundle?year=2024', headers={'Accept-Encoding': encoding})
+    assert response.status_code == 200
+    assert response.headers.get('Content-Encoding', 'identity') == encoding
+    assert response.headers['ETag'].endswith(f'-{encoding}"')
+    assert 'Accept-Encoding' in response.headers['Vary']
+
+    etag = response.headers['ETag']
+    assert client.get('/seasons/bundle?year=2024', headers={'Accept-Encoding': encoding, 'If-None-Match': etag}).status_code == 304
+    other = 'gzip' if encoding != 'gzip' else 'identity'
+    assert client.get('/seasons/bundle?year=2024', headers={'Accept-Encoding': other, 'If-None-Match': etag}).status_code == 200
+
+
+def test_missing_season_is_a_404(client):
+    assert client.get('/seasons/bundle?year=1999').status_code == 404
@@ -0,0 +1,119 @@
+import json
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+import pytest
+from flask import Flask, jsonify
+from app.utils import serializer
+from app.utils.serializer import JSONProvider, dumps, select_backend, to_records
+
+ROW = {
+    'date_start': datetime(2024, 12, 8, 13, 0, 0, 250000, tzinfo=timezone.utc),
+    'day': date(2024, 12, 8),
+    'gap_to_leader': Decimal('1.250'),
+    'duration': timedelta(minutes=1, seconds=23, milliseconds=456),
+    'points': np.int64(25),
+    'speed': np.float64(312.5),
+    'segments': np.array([2048, 2049]),
+    'position': pd.NA,
+    'finished_at': pd.NaT,
+    'interval': float('nan'),
+    'gap': float('inf'),
+    'laps': [1.5, float('-inf')],
+    'dnf': False,
+    'team_name': 'Ferrari',
+    'number': None,
+    1: 'non-string key',
+}
+
+EXPECTED = {
+    'date_start': 'Sun, 08 Dec 2024 13:00:00 GMT',
+    'day': 'Sun, 08 Dec 2024 00:00:00 GMT',
+    'gap_to_leader': '1.250',
+    'duration': 83.456,
+    'points': 25,
+    'speed': 312.5,
+    'segments': [2048, 2049],
+    'position': None,
+    'finished_at': None,
+    'interval': None,
+    'gap': None,
+    'laps': [1.5, None],
+    'dnf': False,
+    'team_name': 'Ferrari',
+    'number': None,
+    '1': 'non-string key',
+}
+
+available = [name for name in serializer.BACKENDS if name != 'orjson' or serializer.orjson is not None]
+
+
+@pytest.fixture(params=available)
+def backend(request):
+    previous = serializer.current_backend()
+    select_backend(request.param)
+    yield request.param
+    select_backend(previous)
+
+
+def test_database_values_are_encoded_like_jsonify(backend):
+    assert json.loads(dumps([ROW])) == [EXPECTED]
+
+
+def test_iso_dates_keep_full_precision(backend):
+    encoded = json.loads(dumps(ROW, iso_dates=True))
+    assert encoded['date_start'] == '2024-12-08T13:00:00.250000+00:00'
+    assert encoded['day'] == '2024-12-08'
+    assert encoded['finished_at'] is None
+
+
+def test_output_is_compact_strict_json(backend):
+    encoded = dumps({'a': [1, float('nan')]})
+    assert encoded == b'{"a":[1,null]}'
+    json.loads(encoded, parse_constant=lambda name: pytest.fail(f'{name} is not JSON'))
+
+
+@pytest.mark.skipif(serializer.orjson is None, reason='orjson is not installed')
+def test_backends_produce_the_same_documents():
+    previous = serializer.current_backend()
+    try:
+        documents = {}
+        for name in serializer.BACKENDS:
+            select_backend(name)
+            documents[name] = (dumps([ROW]), dumps([ROW], iso_dates=True))
+    finally:
+        select_backend(previous)
+    assert documents['orjson'] == documents['stdlib']
+
+
+def test_unknown_values_are_rejected(backend):
+    with pytest.raises(TypeError):
+        dumps({'value': object()})
+
+
+def test_select_backend():
+    previous = serializer.current_backend()
+    try:
+        assert select_backend('stdlib') == 'stdlib'
+        assert select_backend('auto') == ('orjson' if serializer.orjson is not None else 'stdlib')
+        with pytest.raises(ValueError):
+            select_backend('ujson')
+    finally:
+        select_backend(previous)
+
+
+def test_jsonify_goes_through_dumps(backend):
+    app = Flask(__name__)
+    app.json = JSONProvider(app)
+    with app.app_context():
+        response = jsonify({'gap_to_leader': Decimal('0.5'), 'interval': float('nan')})
+        assert response.get_data() == b'{"gap_to_leader":"0.5","interval":null}'
+        assert app.json.loads('{"a": 1}') == {'a': 1}
+
+
+def test_to_records():
+    rows = [{'position': 1}]
+    assert to_records(None) is None
+    assert to_records(rows) is rows
+    assert to_records(pd.DataFrame(rows)) == rows